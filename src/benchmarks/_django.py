@@ -0,0 +1,13 @@
+import os
+
+
+def setup_django(settings_module: str = 'django_app.settings'):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+
+    import django  # pylint: disable=import-outside-toplevel
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+    from django.test.utils import setup_test_environment  # pylint: disable=import-outside-toplevel
+
+    django.setup()
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0, keepdb=False)
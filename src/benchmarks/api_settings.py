@@ -0,0 +1,72 @@
+# pylint: disable=import-outside-toplevel
+"""
+Latency of GET /categories/ through the full Django stack (middleware, DRF,
+repository) with the default settings and the lean API settings
+(django_app.settings_api), each in its own process.
+
+    PYTHONPATH=src python -m benchmarks.api_settings --requests 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SETTINGS = ('django_app.settings', 'django_app.settings_api')
+
+
+def run_settings(args):
+    from benchmarks._django import setup_django
+    setup_django(args.settings)
+
+    from django.db import connection
+    from django.test import Client
+    from core.category.domain.entities import Category
+    from core.category.infra.django_app.repositories import CategoryDjangoRepository
+
+    repo = CategoryDjangoRepository()
+    for index in range(args.seed):
+        repo.insert(Category(name=f'category {index}'))
+
+    client = Client()
+    for _ in range(50):
+        client.get('/categories/')
+    timings = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        response = client.get('/categories/')
+        timings.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    timings.sort()
+
+    print(
+        f'{args.settings:>24}: '
+        f'p50 {timings[len(timings) // 2] * 1e3:6.3f} ms  '
+        f'p99 {timings[int(len(timings) * 0.99)] * 1e3:6.3f} ms  '
+        f'{args.requests / sum(timings):7.0f} req/s  '
+        f'{len(connection.queries_log):3d} queries logged per request'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=100)
+    parser.add_argument('--settings')
+    args = parser.parse_args()
+
+    if args.settings:
+        run_settings(args)
+        return
+
+    # one process per settings module: Django reads them once, at setup
+    for settings in SETTINGS:
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.api_settings', '--settings', settings,
+             '--requests', str(args.requests), '--seed', str(args.seed)],
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': settings}, check=True
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Latency of the autocomplete path: PrefixIndex.complete and the use case on
+top of it, for a process-local index of --total category names.
+
+    PYTHONPATH=src python -m benchmarks.category_autocomplete
+"""
+import argparse
+import itertools
+import random
+import string
+import timeit
+import uuid
+
+from core.__seedwork.infra.prefix_index import PrefixIndex
+from core.category.application.use_cases import AutocompleteCategoriesUseCase
+from core.category.infra.django_app.autocomplete import CategoryPrefixNameIndex
+
+
+def random_name(rnd: random.Random) -> str:
+    return ''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(4, 14)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=100_000)
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--number', type=int, default=10_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    names = [(str(uuid.uuid4()), random_name(rnd)) for _ in range(args.total)]
+    prefixes = [name[:rnd.randint(1, 3)] for _, name in rnd.sample(names, 1000)]
+
+    index = PrefixIndex()
+    build = timeit.timeit(lambda: index.build(lambda: names), number=1)
+    print(f'build {args.total} names: {build * 1e3:.1f} ms')
+
+    def run(func):
+        cycle = itertools.cycle(prefixes)
+        return min(timeit.repeat(
+            lambda: func(next(cycle)), repeat=5, number=args.number
+        )) / args.number
+
+    complete = run(lambda prefix: index.complete(prefix, args.limit))
+    print(f'PrefixIndex.complete: {complete * 1e6:.2f} us')
+
+    name_index = CategoryPrefixNameIndex(None, max_age=float('inf'), index=index)  # type: ignore
+    name_index._built_at = 0  # pylint: disable=protected-access
+    use_case = AutocompleteCategoriesUseCase(name_index)
+    execute = run(lambda prefix: use_case.execute(
+        AutocompleteCategoriesUseCase.Input(prefix=prefix, limit=args.limit)
+    ))
+    print(f'AutocompleteCategoriesUseCase.execute: {execute * 1e6:.2f} us')
+
+    upsert = min(timeit.repeat(
+        lambda: index.upsert(names[0][0], random_name(rnd)), repeat=5, number=1000
+    )) / 1000
+    print(f'PrefixIndex.upsert: {upsert * 1e6:.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure with tracemalloc what a page of list output costs when kept as a
+list of CategoryOutput dataclasses versus a ColumnarItems container.
+
+    PYTHONPATH=src python -m benchmarks.category_list_memory
+"""
+import argparse
+import datetime
+import gc
+import tracemalloc
+import uuid
+
+from core.__seedwork.application.dto import ColumnarItems
+from core.category.application.dto import CategoryOutput
+
+
+def make_rows(total: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        (str(uuid.uuid4()), f'category {index}', None, True,
+         now - datetime.timedelta(seconds=index))
+        for index in range(total)
+    ]
+
+
+def as_list(rows):
+    return [CategoryOutput(*row) for row in rows]
+
+
+def as_columnar(rows):
+    return ColumnarItems(CategoryOutput, list(zip(*rows)))
+
+
+def measure(build, rows):
+    gc.collect()
+    tracemalloc.start()
+    result = build(rows)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--per-page', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f'{"per_page":>8} {"container":>10} {"retained":>12} {"peak":>12}')
+    for per_page in args.per_page:
+        rows = make_rows(per_page)
+        for name, build in (('list', as_list), ('columnar', as_columnar)):
+            current, peak = measure(build, rows)
+            print(f'{per_page:>8} {name:>10} {current:>10} B {peak:>10} B')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# pylint: disable=import-outside-toplevel
+"""
+Compare ListCategoriesUseCase through the write repository (model -> entity ->
+output) against the read-side projection (values_list -> output).
+
+    PYTHONPATH=src python -m benchmarks.category_list_projection
+"""
+import argparse
+import datetime
+import timeit
+import uuid
+
+from benchmarks._django import setup_django
+
+
+def seed(total: int):
+    from core.category.infra.django_app.models import CategoryModel
+    now = datetime.datetime.now(datetime.timezone.utc)
+    CategoryModel.objects.bulk_create([
+        CategoryModel(
+            id=uuid.uuid4(),
+            name=f'category {index}',
+            description='some description',
+            is_active=True,
+            created_at=now - datetime.timedelta(seconds=index)
+        ) for index in range(total)
+    ], batch_size=500)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=1000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from core.category.application.use_cases import ListCategoriesUseCase
+    from core.category.infra.django_app.repositories import (
+        CategoryDjangoQueryRepository,
+        CategoryDjangoRepository
+    )
+
+    seed(args.total)
+    input_param = ListCategoriesUseCase.Input(per_page=args.per_page)
+    use_cases = {
+        'entity': ListCategoriesUseCase(CategoryDjangoRepository()),
+        'projection': ListCategoriesUseCase(
+            CategoryDjangoRepository(),
+            category_query_repo=CategoryDjangoQueryRepository()
+        ),
+    }
+
+    results = {}
+    for name, use_case in use_cases.items():
+        timer = timeit.Timer(lambda use_case=use_case: use_case.execute(input_param))
+        best = min(timer.repeat(repeat=args.repeat, number=args.number)) / args.number
+        results[name] = best
+        print(
+            f'{name:>10}: {best * 1e3:8.3f} ms/request '
+            f'{best * 1e6 / args.per_page:8.2f} us/row'
+        )
+
+    print(f'   speedup: {results["entity"] / results["projection"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
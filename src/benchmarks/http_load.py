@@ -0,0 +1,304 @@
+# pylint: disable=import-outside-toplevel
+"""
+HTTP load test of the categories API. Starts the app in its own process on
+a fresh SQLite database seeded with --catalog synthetic categories (or uses
+--url), then runs --clients threads, each with a keep-alive connection,
+picking requests from a scenario for --seconds:
+
+    read   GET by id, some listings
+    list   listings with filters, sorts and pages
+    mixed  reads plus create, update and delete
+
+and reports throughput, p50/p95/p99 latency and error rate per endpoint.
+
+    PYTHONPATH=src python -m benchmarks.http_load --scenario mixed --catalog 10000
+
+The server inherits the environment: DJANGO_DATABASE_PROFILE=production
+avoids the "database is locked" 500s of the default profile under writes.
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# seeded ids are derived from their index, so clients know them up front
+CATALOG_NAMESPACE = uuid.UUID('5b1c4ad4-6f44-4b0e-9b8a-1f7c3f6d2a10')
+
+Request = Tuple[str, str, str, Optional[dict]]  # endpoint, method, path, body
+
+
+def catalog_id(index: int) -> str:
+    return str(uuid.uuid5(CATALOG_NAMESPACE, str(index)))
+
+
+def serve(args):
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    from django.core.servers.basehttp import WSGIServer, run
+    from django.core.wsgi import get_wsgi_application
+    from django.utils import timezone
+    from core.category.infra.django_app.models import CategoryModel
+
+    call_command('migrate', verbosity=0)
+    start = timezone.now()
+    CategoryModel.objects.bulk_create(
+        (
+            CategoryModel(
+                id=catalog_id(index),
+                name=f'category {index}',
+                description=f'description {index}' if index % 2 else None,
+                is_active=index % 5 != 0,
+                created_at=start - timezone.timedelta(seconds=index)
+            ) for index in range(args.catalog)
+        ),
+        batch_size=2000
+    )
+    application = get_wsgi_application()
+    # after get_wsgi_application(), which configures logging again
+    logging.getLogger('django.server').setLevel(logging.CRITICAL)
+
+    class NoDelayWSGIServer(WSGIServer):
+        # wsgiref writes the status line, the headers and the body
+        # separately; with Nagle's algorithm on, the body waits for the
+        # client's delayed ACK and every response takes ~40ms more
+        def get_request(self):
+            connection, address = super().get_request()
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return connection, address
+
+    run('127.0.0.1', args.port, application, threading=True, server_cls=NoDelayWSGIServer)
+
+
+class Scenario:
+
+    def __init__(self, catalog: int, rng: random.Random) -> None:
+        self.catalog = catalog
+        self.rng = rng
+        self.created: List[str] = []
+        # last page of each listing query (its parameters without the page),
+        # learned from the responses
+        self.last_pages: Dict[str, int] = {}
+
+    def get(self) -> Request:
+        return ('GET /categories/{id}/', 'GET',
+                f'/categories/{catalog_id(self.rng.randrange(self.catalog))}/', None)
+
+    def list(self) -> Request:
+        params = {'per_page': self.rng.choice([15, 50])}
+        if self.rng.random() < 0.5:
+            params['sort'] = self.rng.choice(['name', 'created_at'])
+            params['sort_dir'] = self.rng.choice(['asc', 'desc'])
+        choice = self.rng.random()
+        if choice < 0.3:
+            params['filter'] = f'category {self.rng.randrange(100)}'
+        elif choice < 0.5:
+            params['name_prefix'] = f'category {self.rng.randrange(10)}'
+        elif choice < 0.7:
+            params['is_active'] = self.rng.choice(['true', 'false'])
+        # one of the first 5 pages that exist: past the last one the API
+        # errors, which would measure error handling instead of listing
+        last_page = self.last_pages.get(self._query(params), 1)
+        params['page'] = self.rng.randint(1, min(5, last_page))
+        return 'GET /categories/', 'GET', f'/categories/?{urlencode(params)}', None
+
+    def create(self) -> Request:
+        return ('POST /categories/', 'POST', '/categories/',
+                {'name': f'new category {self.rng.randrange(10 ** 6)}', 'description': 'load test'})
+
+    def update(self) -> Request:
+        index = self.rng.randrange(self.catalog)
+        return ('PUT /categories/{id}/', 'PUT', f'/categories/{catalog_id(index)}/',
+                {'name': f'category {index}', 'description': f'updated {time.time()}',
+                 'is_active': index % 5 != 0})
+
+    def delete(self) -> Request:
+        if not self.created:
+            return self.create()
+        return ('DELETE /categories/{id}/', 'DELETE', f'/categories/{self.created.pop()}/', None)
+
+    def observe(self, method: str, path: str, data: bytes) -> None:
+        # learns from a successful response what later requests can ask for
+        if method == 'POST':
+            self.created.append(json.loads(data)['id'])
+        elif method == 'GET' and path.startswith('/categories/?'):
+            params = dict(parse_qsl(urlsplit(path).query))
+            self.last_pages[self._query(params)] = json.loads(data)['last_page']
+
+    @staticmethod
+    def _query(params: Dict[str, object]) -> str:
+        return urlencode(sorted((key, value) for key, value in params.items() if key != 'page'))
+
+
+SCENARIOS: Dict[str, List[Tuple[Callable[[Scenario], Request], int]]] = {
+    'read': [(Scenario.get, 90), (Scenario.list, 10)],
+    'list': [(Scenario.list, 100)],
+    'mixed': [
+        (Scenario.get, 50), (Scenario.list, 20),
+        (Scenario.create, 10), (Scenario.update, 10), (Scenario.delete, 10)
+    ],
+}
+
+
+def client(host: str, port: int, scenario: Scenario, operations, weights,
+           deadline: float, results: Dict[str, Dict[str, list]]) -> None:
+    # http.client sets TCP_NODELAY on the sockets it opens
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    while time.perf_counter() < deadline:
+        endpoint, method, path, body = scenario.rng.choices(operations, weights)[0](scenario)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload else {}
+        stats = results.setdefault(endpoint, {'latencies': [], 'errors': []})
+        start = time.perf_counter()
+        try:
+            connection.request(method, path, payload, headers)
+            response = connection.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            status, data = 0, b''
+        stats['latencies'].append(time.perf_counter() - start)
+        if status == 0 or status >= 400:
+            stats['errors'].append(status)
+        else:
+            scenario.observe(method, path, data)
+    connection.close()
+
+
+def report(results: List[Dict[str, Dict[str, list]]], seconds: float) -> Dict[str, dict]:
+    merged: Dict[str, Dict[str, list]] = {}
+    for result in results:
+        for endpoint, stats in result.items():
+            target = merged.setdefault(endpoint, {'latencies': [], 'errors': []})
+            target['latencies'] += stats['latencies']
+            target['errors'] += stats['errors']
+    merged['total'] = {
+        'latencies': [value for stats in merged.values() for value in stats['latencies']],
+        'errors': [value for stats in merged.values() for value in stats['errors']],
+    }
+
+    summary = {}
+    print(f'{"endpoint":>26} {"requests":>9} {"req/s":>8} {"p50 ms":>8} '
+          f'{"p95 ms":>8} {"p99 ms":>8} {"errors":>7}')
+    for endpoint, stats in merged.items():
+        latencies = sorted(stats['latencies'])
+        if not latencies:
+            continue
+        count = len(latencies)
+        summary[endpoint] = {
+            'requests': count,
+            'throughput': count / seconds,
+            **{
+                f'p{percentile}_ms': latencies[int(percentile / 100 * (count - 1))] * 1e3
+                for percentile in (50, 95, 99)
+            },
+            'error_rate': len(stats['errors']) / count,
+            'error_statuses': sorted(set(stats['errors'])),
+        }
+        row = summary[endpoint]
+        print(f'{endpoint:>26} {count:9d} {row["throughput"]:8.0f} {row["p50_ms"]:8.2f} '
+              f'{row["p95_ms"]:8.2f} {row["p99_ms"]:8.2f} {row["error_rate"]:7.1%}')
+    return summary
+
+
+def wait_for_server(host: str, port: int, process: Optional[subprocess.Popen], timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f'server exited with status {process.returncode}')
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'server not listening on {host}:{port} after {timeout}s')
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scenario', choices=list(SCENARIOS), default='read')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--catalog', type=int, default=10_000, help='categories seeded before the run')
+    parser.add_argument('--settings', default='django_app.settings_api')
+    parser.add_argument('--url', help='test a running server, seeded with this --catalog, instead')
+    parser.add_argument('--output', help='write the summary as JSON to this file')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        process = None
+        if args.url:
+            address = urlsplit(args.url)
+            host, port = address.hostname, address.port or 80
+        else:
+            host, port = '127.0.0.1', free_port()
+            started = time.perf_counter()
+            process = subprocess.Popen(  # pylint: disable=consider-using-with
+                [sys.executable, '-m', 'benchmarks.http_load', '--serve',
+                 '--port', str(port), '--catalog', str(args.catalog)],
+                env={
+                    **os.environ,
+                    'DJANGO_SETTINGS_MODULE': args.settings,
+                    'DJANGO_DATABASE_NAME': os.path.join(directory, 'db.sqlite3'),
+                }
+            )
+        try:
+            wait_for_server(host, port, process)
+            if process is not None:
+                print(f'seeded {args.catalog} categories, server up in '
+                      f'{time.perf_counter() - started:.1f}s')
+
+            operations, weights = zip(*SCENARIOS[args.scenario])
+            results: List[Dict[str, Dict[str, list]]] = [{} for _ in range(args.clients)]
+            deadline = time.perf_counter() + args.seconds
+            threads = [
+                threading.Thread(target=client, args=(
+                    host, port, Scenario(args.catalog, random.Random(index)),
+                    operations, weights, deadline, results[index]
+                )) for index in range(args.clients)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    print(f'scenario {args.scenario}, {args.clients} clients, {args.seconds:.0f}s')
+    summary = report(results, args.seconds)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({'scenario': args.scenario, 'clients': args.clients,
+                       'seconds': args.seconds, 'catalog': args.catalog,
+                       'endpoints': summary}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
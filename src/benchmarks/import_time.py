@@ -0,0 +1,66 @@
+"""
+Cold start of a worker measured with `python -X importtime`: total import
+time of each startup step, run in a fresh interpreter (--runs times, best
+kept), and the modules with the largest cumulative import time.
+
+    PYTHONPATH=src python -m benchmarks.import_time --top 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+STEPS = {
+    'settings': 'import django_app.settings',
+    'django.setup()': 'import django; django.setup()',
+    'wsgi application': 'import django_app.wsgi',
+    'first request': (
+        'import django; django.setup()\n'
+        'from django.urls import resolve; resolve("/categories/")'
+    ),
+}
+
+
+def import_times(statement: str, settings: str) -> List[Tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        env={**os.environ, 'DJANGO_SETTINGS_MODULE': settings},
+        capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(statement: str, settings: str, runs: int) -> Tuple[float, Dict[str, int]]:
+    best, best_modules = None, {}
+    for _ in range(runs):
+        modules = import_times(statement, settings)
+        total = sum(self_us for _, self_us, _ in modules) / 1e3
+        if best is None or total < best:
+            best, best_modules = total, {name: cumulative for name, _, cumulative in modules}
+    return best, best_modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--settings', default='django_app.settings_api')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    for label, statement in STEPS.items():
+        total, modules = measure(statement, args.settings, args.runs)
+        print(f'{label:>18}: {total:7.1f} ms imports ({len(modules)} modules)')
+    print(f'\nslowest imports for "first request" ({args.settings}):')
+    for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{cumulative / 1e3:9.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Search latency of CategoryInMemoryRepository (a list of Category entities)
+against CategoryColumnarInMemoryRepository (NumPy columns) with --total rows.
+Requires the optional "columnar" dependencies (numpy).
+
+    PYTHONPATH=src python -m benchmarks.inmemory_columnar --total 1000000
+"""
+import argparse
+import datetime
+import random
+import time
+import uuid
+
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter, CategoryRepository
+from core.category.infra.in_memory.columnar import (
+    CategoryColumnarInMemoryRepository,
+    from_micros,
+)
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def make_columns(total: int):
+    rnd = random.Random(42)
+    words = ['movie', 'music', 'series', 'documentary', 'kids', 'sports', 'news']
+    start = 1_672_531_200_000_000  # 2023-01-01 in microseconds
+    return (
+        [str(uuid.UUID(int=rnd.getrandbits(128), version=4)) for _ in range(total)],
+        [f'{rnd.choice(words)} {rnd.randrange(total // 10 or 1)}' for _ in range(total)],
+        [None] * total,
+        [rnd.random() < 0.8 for _ in range(total)],
+        [start + rnd.randrange(365 * 24 * 3600) * 1_000_000 for _ in range(total)],
+    )
+
+
+def make_entity(category_id, name, description, is_active, created_at) -> Category:
+    # the columns are already valid: skipping __init__ (and the validator)
+    # keeps building a million entities in seconds instead of minutes
+    entity_id = UniqueEntityId.__new__(UniqueEntityId)
+    object.__setattr__(entity_id, 'id', category_id)
+    category = Category.__new__(Category)
+    category._set('unique_entity_id', entity_id)  # pylint: disable=protected-access
+    category._set('name', name)  # pylint: disable=protected-access
+    category._set('description', description)  # pylint: disable=protected-access
+    category._set('is_active', is_active)  # pylint: disable=protected-access
+    category._set('created_at', created_at)  # pylint: disable=protected-access
+    return category
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    columns = make_columns(args.total)
+
+    list_repo = CategoryInMemoryRepository()
+    list_repo.items = [
+        make_entity(category_id, name, description, is_active, from_micros(created_at))
+        for category_id, name, description, is_active, created_at in zip(*columns)
+    ]
+    columnar_repo = CategoryColumnarInMemoryRepository()
+    columnar_repo.bulk_load(*columns)
+
+    since = from_micros(sorted(columns[4])[args.total // 2])
+    scenarios = {
+        'default page': {},
+        'sort by name, page 50': {'sort': 'name', 'page': 50},
+        'filter "mu"': {'filter': 'mu'},
+        'is_active + created_at_from': {
+            'filter': CategoryFilter(is_active=True, created_at_from=since),
+        },
+    }
+    for label, params in scenarios.items():
+        search_params = CategoryRepository.SearchParams(**params)
+        expected = list_repo.search(search_params)
+        result = columnar_repo.search(search_params)
+        assert result.total == expected.total and result.items == expected.items, label
+
+        list_time = best_of(lambda p=search_params: list_repo.search(p), args.repeat)
+        columnar_time = best_of(lambda p=search_params: columnar_repo.search(p), args.repeat)
+        print(
+            f'{label:>28}: list {list_time * 1e3:9.2f} ms'
+            f' | columnar {columnar_time * 1e3:8.2f} ms'
+            f' | {list_time / columnar_time:6.1f}x  ({args.total} rows)'
+        )
+
+
+if __name__ == '__main__':
+    main()
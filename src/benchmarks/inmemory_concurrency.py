@@ -0,0 +1,93 @@
+"""
+Throughput of a shared in-memory category repository with --readers threads
+searching and --writers threads updating for --seconds: one lock around
+every call against CategoryCopyOnWriteInMemoryRepository.
+
+    PYTHONPATH=src python -m benchmarks.inmemory_concurrency --items 10000
+"""
+import argparse
+import itertools
+import threading
+import time
+
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.repositories import (
+    CategoryCopyOnWriteInMemoryRepository,
+    CategoryInMemoryRepository,
+)
+
+
+class CategoryLockedInMemoryRepository(CategoryInMemoryRepository):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def insert(self, entity):
+        with self._lock:
+            super().insert(entity)
+
+    def update(self, entity):
+        with self._lock:
+            super().update(entity)
+
+    def search(self, input_params):
+        with self._lock:
+            return super().search(input_params)
+
+
+def run(repo, categories, args):
+    for category in categories:
+        repo.insert(category)
+    stop = threading.Event()
+    counts = {'reads': 0, 'writes': 0}
+    params = CategoryRepository.SearchParams(filter='1', sort='name')
+
+    def read():
+        done = 0
+        while not stop.is_set():
+            repo.search(params)
+            done += 1
+        counts['reads'] += done
+
+    def write(offset):
+        done = 0
+        for category in itertools.cycle(categories[offset::args.writers]):
+            if stop.is_set():
+                break
+            repo.update(category)
+            done += 1
+        counts['writes'] += done
+
+    threads = [threading.Thread(target=read) for _ in range(args.readers)] + \
+        [threading.Thread(target=write, args=(offset,)) for offset in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return counts['reads'] / args.seconds, counts['writes'] / args.seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=10_000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=1)
+    parser.add_argument('--seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    categories = [Category(name=f'category {index}') for index in range(args.items)]
+    for label, repo_class in (
+        ('global lock', CategoryLockedInMemoryRepository),
+        ('copy-on-write', CategoryCopyOnWriteInMemoryRepository),
+    ):
+        reads, writes = run(repo_class(), categories, args)
+        print(f'{label:>14}: {reads:8.1f} searches/s  {writes:8.1f} updates/s '
+              f'({args.readers} readers, {args.writers} writers, {args.items} items)')
+
+
+if __name__ == '__main__':
+    main()
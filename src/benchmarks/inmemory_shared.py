@@ -0,0 +1,56 @@
+"""
+CategorySharedMemoryRepository with --total categories: insert throughput,
+cost for a second attachment (another worker) to load the segment, and how
+long a single write takes to show up in that attachment.
+
+    PYTHONPATH=src python -m benchmarks.inmemory_shared --total 20000
+"""
+import argparse
+import time
+import uuid
+
+from core.category.domain.entities import Category
+from core.category.infra.in_memory.shared import CategorySharedMemoryRepository
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=20_000)
+    parser.add_argument('--writes', type=int, default=100)
+    args = parser.parse_args()
+
+    name = f'bench_categories_{uuid.uuid4().hex[:8]}'
+    categories = [Category(name=f'category {index}') for index in range(args.total)]
+    repo = CategorySharedMemoryRepository(name, capacity=args.total + args.writes)
+    try:
+        start = time.perf_counter()
+        for category in categories:
+            repo.insert(category)
+        insert_time = time.perf_counter() - start
+
+        worker = CategorySharedMemoryRepository(name)
+        start = time.perf_counter()
+        worker.refresh()
+        attach_time = time.perf_counter() - start
+
+        visible = []
+        for category in categories[:args.writes]:
+            category.update(f'{category.name} updated', None)
+            repo.update(category)
+            start = time.perf_counter()
+            assert worker.find_by_id(category.id).name == category.name
+            visible.append(time.perf_counter() - start)
+        worker.close()
+
+        print(f'{args.total} categories, segment {repo._shm.size / 2 ** 20:.1f} MiB')  # pylint: disable=protected-access
+        print(f'     inserts: {args.total / insert_time:10.0f} /s')
+        print(f' worker load: {attach_time * 1e3:10.1f} ms')
+        print(f'  visibility: {sorted(visible)[len(visible) // 2] * 1e6:10.1f} us '
+              f'(median over {args.writes} updates)')
+    finally:
+        repo.close()
+        repo.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Warm start from a snapshot: time to write --total categories and to load
+them back into a CategoryColumnarInMemoryRepository ready to serve searches.
+
+    PYTHONPATH=src python -m benchmarks.inmemory_snapshot --total 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.inmemory_columnar import make_columns
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+from core.category.infra.in_memory.snapshot import load_snapshot, write_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    repo = CategoryColumnarInMemoryRepository()
+    columns = list(make_columns(args.total))
+    columns[2] = [f'description {index}' if index % 3 else None
+                  for index in range(args.total)]
+    repo.bulk_load(*columns)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'categories.snapshot')
+        start = time.perf_counter()
+        write_snapshot(path, repo)
+        write_time = time.perf_counter() - start
+
+        load_times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            loaded = load_snapshot(path)
+            load_times.append(time.perf_counter() - start)
+
+        params = CategoryRepository.SearchParams(sort='name', page=10)
+        assert loaded.search(params).items == repo.search(params).items
+        size = os.path.getsize(path)
+
+    print(f'{args.total} categories, snapshot {size / 2 ** 20:.1f} MiB')
+    print(f'write: {write_time * 1e3:8.1f} ms')
+    print(f' load: {min(load_times) * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
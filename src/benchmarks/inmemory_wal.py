@@ -0,0 +1,60 @@
+"""
+Insert throughput of CategoryInMemoryRepository alone and wrapped by
+CategoryDurableInMemoryRepository: one fsync per write, group commit with
+writers waiting for their fsync, and group commit without waiting.
+
+    PYTHONPATH=src python -m benchmarks.inmemory_wal --threads 8
+"""
+import argparse
+import tempfile
+import threading
+import time
+
+from core.category.domain.entities import Category
+from core.category.infra.in_memory.durable import CategoryDurableInMemoryRepository
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def run(repo, categories, threads: int) -> float:
+    chunks = [categories[index::threads] for index in range(threads)]
+
+    def write(chunk):
+        for category in chunk:
+            repo.insert(category)
+
+    workers = [threading.Thread(target=write, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return len(categories) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--total', type=int, default=5_000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    categories = [Category(name=f'category {index}') for index in range(args.total)]
+    scenarios = {
+        'in-memory only': None,
+        'wal, fsync per write': {'sync_interval': 0},
+        'wal, group commit': {'sync_interval': 0.002},
+        'wal, group commit, no wait': {'sync_interval': 0.002, 'wait_for_sync': False},
+    }
+    for label, options in scenarios.items():
+        with tempfile.TemporaryDirectory() as directory:
+            if options is None:
+                repo = CategoryInMemoryRepository()
+            else:
+                repo = CategoryDurableInMemoryRepository(directory, **options)
+            rate = run(repo, categories, args.threads)
+            if options is not None:
+                repo.close()
+        print(f'{label:>28}: {rate:10.0f} inserts/s ({args.threads} threads)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+# pylint: disable=import-outside-toplevel
+"""
+Microbenchmarks for the seedwork and category hot paths. Each benchmark is
+timed with timeit (garbage collector off), calibrated so one measurement
+runs for at least --min-time seconds, repeated --repeat times. The fastest
+repeat is what gets compared: slower ones measure interference from the
+rest of the machine, not the code.
+
+    pdm run bench --output baseline.json
+    pdm run bench --compare baseline.json --threshold 0.1
+
+Progress and the comparison go to stderr, the JSON report to stdout unless
+--output is given. With --compare the exit status is 1 when any benchmark
+got slower than the baseline by more than --threshold (0.1 is 10%); only
+compare runs made on the same, otherwise idle, machine.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# name -> (factory, dataset sizes); the factory prepares the data for one
+# size outside the timing and returns the callable to time
+BENCHMARKS: Dict[str, Tuple[Callable[..., Callable[[], object]], Sequence[Optional[int]]]] = {}
+
+SEARCH_SIZES = (100, 1_000, 10_000)
+
+
+def benchmark(name: str, sizes: Sequence[Optional[int]] = (None,)):
+    def register(factory):
+        BENCHMARKS[name] = (factory, sizes)
+        return factory
+    return register
+
+
+def _categories(total: int) -> List:
+    from core.category.domain.entities import Category
+
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        Category(
+            name=f'category {index}',
+            description=f'description {index}' if index % 2 else None,
+            is_active=index % 3 != 0,
+            created_at=start + datetime.timedelta(seconds=index)
+        )
+        for index in range(total)
+    ]
+
+
+@benchmark('category.create')
+def category_create(_size):
+    from core.category.domain.entities import Category
+    return lambda: Category(name='Movie', description='some description', is_active=True)
+
+
+@benchmark('unique_entity_id.generate')
+def unique_entity_id_generate(_size):
+    from core.__seedwork.domain.value_objects import UniqueEntityId
+    return UniqueEntityId
+
+
+@benchmark('unique_entity_id.from_str')
+def unique_entity_id_from_str(_size):
+    from core.__seedwork.domain.value_objects import UniqueEntityId
+    value = str(UniqueEntityId())
+    return lambda: UniqueEntityId(value)
+
+
+@benchmark('search_params.normalize')
+def search_params_normalize(_size):
+    from core.category.domain.repositories import CategoryRepository
+    return lambda: CategoryRepository.SearchParams(
+        page='2', per_page='15', sort='name', sort_dir='DESC', filter='movie'
+    )
+
+
+@benchmark('in_memory.search.filter_sort', SEARCH_SIZES)
+def in_memory_search_filter_sort(size):
+    from core.category.domain.repositories import CategoryRepository
+    from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+    repo = CategoryInMemoryRepository()
+    repo.items = _categories(size)
+    params = CategoryRepository.SearchParams(page=2, per_page=15, sort='name', filter='1')
+    return lambda: repo.search(params)
+
+
+@benchmark('in_memory.search.default', SEARCH_SIZES)
+def in_memory_search_default(size):
+    from core.category.domain.repositories import CategoryRepository
+    from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+    repo = CategoryInMemoryRepository()
+    repo.items = _categories(size)
+    params = CategoryRepository.SearchParams()
+    return lambda: repo.search(params)
+
+
+@benchmark('model_mapper.to_entity')
+def model_mapper_to_entity(_size):
+    from core.category.infra.django_app.mappers import CategoryModelMapper
+
+    model = CategoryModelMapper.to_model(_categories(1)[0])
+    return lambda: CategoryModelMapper.to_entity(model)
+
+
+@benchmark('model_mapper.to_model')
+def model_mapper_to_model(_size):
+    from core.category.infra.django_app.mappers import CategoryModelMapper
+
+    category = _categories(1)[0]
+    return lambda: CategoryModelMapper.to_model(category)
+
+
+@benchmark('output_mapper.to_output')
+def output_mapper_to_output(_size):
+    from core.category.application.dto import CategoryOutputMapper
+
+    mapper = CategoryOutputMapper.without_child()
+    category = _categories(1)[0]
+    return lambda: mapper.to_output(category)
+
+
+def measure(func: Callable[[], object], min_time: float, repeat: int) -> Dict[str, float]:
+    timer = timeit.Timer(func)
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+    timings = [total / loops * 1e9 for total in timer.repeat(repeat, loops)]
+    return {
+        'median_ns': statistics.median(timings),
+        'min_ns': min(timings),
+        'stdev_ns': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+
+def run(pattern: str, min_time: float, repeat: int, sizes: Optional[List[int]]) -> Dict[str, Dict]:
+    results = {}
+    for name, (factory, default_sizes) in BENCHMARKS.items():
+        if pattern not in name:
+            continue
+        for size in (sizes if sizes and default_sizes != (None,) else default_sizes):
+            key = name if size is None else f'{name}[{size}]'
+            results[key] = measure(factory(size), min_time, repeat)
+            print(f'{key:>40}: {_format(results[key]["min_ns"])}', file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    regressions = []
+    print(f'{"benchmark":>40} {"baseline":>10} {"current":>10} {"change":>8}', file=sys.stderr)
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before, after = baseline[key]['min_ns'], result['min_ns']
+        change = after / before - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f'{key:>40} {_format(before)} {_format(after)} {change:+8.1%}{flag}', file=sys.stderr)
+    return regressions
+
+
+def _format(nanoseconds: float) -> str:
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if nanoseconds >= scale:
+            return f'{nanoseconds / scale:7.2f} {unit:<2}'
+    return f'{nanoseconds:7.0f} ns'
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--filter', default='', help='only benchmarks whose name contains it')
+    parser.add_argument('--sizes', type=int, nargs='+', help='dataset sizes (default per benchmark)')
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='baseline JSON written by an earlier --output')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+    import django
+    django.setup()
+
+    results = run(args.filter, args.min_time, args.repeat, args.sizes)
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'min_time': args.min_time,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            regressions = compare(results, json.load(file)['results'], args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) over {args.threshold:.0%}: '
+                  f'{", ".join(regressions)}', file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
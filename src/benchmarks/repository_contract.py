@@ -0,0 +1,57 @@
+# pylint: disable=import-outside-toplevel
+"""
+Runs the CategoryRepository contract workload
+(core.category.tests.repository_contract) against every registered backend,
+checks that each backend returns the same results as the first one and
+reports the latency per operation and the Python heap (tracemalloc) it
+holds after the inserts (beyond the entities handed to it) and at its
+peak. SQLite and shared memory segments allocate outside the Python heap
+and are not counted.
+
+    PYTHONPATH=src python -m benchmarks.repository_contract --size 5000
+
+The exit status is 1 when any backend disagrees with the reference.
+"""
+import argparse
+import sys
+
+from core.category.tests.repository_contract import BACKENDS, run_backends
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    args = parser.parse_args()
+
+    if 'django' in args.backends:
+        from benchmarks._django import setup_django
+        setup_django()
+
+    report = run_backends(args.backends, args.size, args.seed)
+    operations = list(report['runs'][report['reference']].latencies)
+    print(f'{args.size} categories, mean latency per call in us, '
+          f'Python heap in MiB (reference: {report["reference"]})')
+    print(f'{"backend":>14} ' + ' '.join(f'{operation:>10}' for operation in operations)
+          + f' {"heap":>8} {"peak":>8}  result')
+    for name, run in report['runs'].items():
+        latencies = ' '.join(
+            f'{sum(run.latencies[operation]) / len(run.latencies[operation]) * 1e6:10.1f}'
+            for operation in operations
+        )
+        mismatches = report['mismatches'].get(name, [])
+        print(f'{name:>14} {latencies} {run.memory["after_insert"] / 2 ** 20:8.2f} '
+              f'{run.memory["peak"] / 2 ** 20:8.2f}  '
+              f'{"reference" if name == report["reference"] else "MISMATCH" if mismatches else "ok"}')
+    for name, reason in report['skipped'].items():
+        print(f'{name:>14} skipped: {reason}')
+    for name, mismatches in report['mismatches'].items():
+        for mismatch in mismatches[:10]:
+            print(f'{name}: {mismatch}')
+    if any(report['mismatches'].values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
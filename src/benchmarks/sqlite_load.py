@@ -0,0 +1,111 @@
+# pylint: disable=import-outside-toplevel
+"""
+Concurrent read/write load on a file SQLite database with the "default" and
+"production" database profiles (DJANGO_DATABASE_PROFILE). Each thread plays
+requests: open/close the connection the way Django does around a request,
+then list a page of categories (--readers) or insert one (--writers).
+
+    PYTHONPATH=src python -m benchmarks.sqlite_load --readers 8 --writers 4
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+def run_profile(args):
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import OperationalError, close_old_connections
+    from core.category.domain.entities import Category
+    from core.category.domain.repositories import CategoryRepository
+    from core.category.infra.django_app.repositories import (
+        CategoryDjangoQueryRepository,
+        CategoryDjangoRepository,
+    )
+
+    call_command('migrate', verbosity=0)
+    write_repo = CategoryDjangoRepository()
+    read_repo = CategoryDjangoQueryRepository()
+    for index in range(args.seed):
+        write_repo.insert(Category(name=f'category {index}'))
+    close_old_connections()
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    params = CategoryRepository.SearchParams(per_page=15)
+
+    def request(operation, counter):
+        while not stop.is_set():
+            close_old_connections()
+            try:
+                operation()
+                key = counter
+            except OperationalError:
+                key = 'locked'
+            finally:
+                close_old_connections()
+            with lock:
+                counts[key] += 1
+
+    threads = [
+        threading.Thread(target=request, args=(lambda: read_repo.search(params), 'reads'))
+        for _ in range(args.readers)
+    ] + [
+        threading.Thread(target=request, args=(
+            lambda: write_repo.insert(Category(name='new category')), 'writes'
+        )) for _ in range(args.writers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"{os.environ['DJANGO_DATABASE_PROFILE']:>10}: "
+        f"{counts['reads'] / args.seconds:8.0f} reads/s "
+        f"{counts['writes'] / args.seconds:8.0f} writes/s "
+        f"{counts['locked']:6d} 'database is locked' errors"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--seed', type=int, default=500)
+    parser.add_argument('--profile')
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+
+    # one process per profile: the settings are read once, at django.setup()
+    for profile in ('default', 'production'):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                'DJANGO_SETTINGS_MODULE': 'django_app.settings',
+                'DJANGO_DATABASE_PROFILE': profile,
+                'DJANGO_DATABASE_NAME': os.path.join(directory, 'db.sqlite3'),
+            }
+            subprocess.run(
+                [sys.executable, '-m', 'benchmarks.sqlite_load', '--profile', profile,
+                 '--readers', str(args.readers), '--writers', str(args.writers),
+                 '--seconds', str(args.seconds), '--seed', str(args.seed)],
+                env=env, check=True
+            )
+
+
+if __name__ == '__main__':
+    main()
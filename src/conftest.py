@@ -0,0 +1,16 @@
+from importlib import import_module
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):  # pylint: disable=redefined-outer-name
+    # --nomigrations builds the test database from the models, which leaves
+    # out what migrations create with SQL (the category FTS5 index)
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+    migration = import_module(
+        'core.category.infra.django_app.migrations.0003_category_fulltext'
+    ).Migration
+    with django_db_blocker.unblock(), connection.schema_editor() as schema_editor:
+        for operation in migration.operations:
+            operation.database_forwards('category', schema_editor, None, None)
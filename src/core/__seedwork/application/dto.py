@@ -1,6 +1,6 @@
 
-from dataclasses import dataclass
-from typing import Generic, List, Optional, Type, TypeVar
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from core.__seedwork.domain.repositories import SearchResult
 
@@ -13,20 +13,85 @@ class SearchInput(Generic[Filter]):
     per_page: Optional[int] = None
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
-    filter: Optional[str] = None
+    filter: Optional[Filter] = None
 
 
 Item = TypeVar('Item')
 
 
+class ColumnarItems(Sequence[Item]):
+    __slots__ = ('schema', 'names', 'columns')
+
+    schema: Type[Item]
+    names: Tuple[str, ...]
+    columns: Tuple[Sequence[Any], ...]
+
+    def __init__(self, schema: Type[Item], columns: Sequence[Sequence[Any]]) -> None:
+        self.schema = schema
+        self.names = tuple(_field.name for _field in fields(schema))  # type: ignore
+        self.columns = tuple(columns)
+        if len(self.columns) != len(self.names):
+            raise ValueError(
+                f'Expected {len(self.names)} columns for {schema.__name__}, got {len(self.columns)}'
+            )
+
+    @staticmethod
+    def from_objects(schema: Type[Item], objects: Iterable[Any]) -> 'ColumnarItems[Item]':
+        names = [_field.name for _field in fields(schema)]  # type: ignore
+        objects = objects if isinstance(objects, (list, tuple)) else list(objects)
+        return ColumnarItems(
+            schema,
+            [tuple(getattr(obj, name) for obj in objects) for name in names]
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, index):  # type: ignore
+        if isinstance(index, slice):
+            return ColumnarItems(self.schema, [column[index] for column in self.columns])
+        return self.schema(*(column[index] for column in self.columns))
+
+    def __iter__(self) -> Iterator[Item]:
+        schema = self.schema
+        return (schema(*row) for row in zip(*self.columns))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnarItems):
+            return self.schema is other.schema and self.columns == other.columns
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                item == other_item for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'ColumnarItems({self.schema.__name__}, {list(self)!r})'
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        names = self.names
+        return [dict(zip(names, row)) for row in zip(*self.columns)]
+
+
 @dataclass(frozen=True, slots=True)
 class PaginationOutput(Generic[Item]):
-    items: List[Item]
+    items: Sequence[Item]
     total: int
     current_page: int
     per_page: int
     last_page: int
 
+    def to_dict(self):
+        return {
+            'items': self.items.to_dicts()
+            if isinstance(self.items, ColumnarItems)
+            else [asdict(item) for item in self.items],  # type: ignore
+            'total': self.total,
+            'current_page': self.current_page,
+            'per_page': self.per_page,
+            'last_page': self.last_page
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class PaginationOutputMapper:
@@ -36,7 +101,7 @@ class PaginationOutputMapper:
     def from_child(output_child: Type[PaginationOutput]):
         return PaginationOutputMapper(output_child)
 
-    def to_output(self, items: List[Item], result: SearchResult) -> PaginationOutput[Item]:
+    def to_output(self, items: Sequence[Item], result: SearchResult) -> PaginationOutput[Item]:
         return self.output_child(
             items=items,
             total=result.total,
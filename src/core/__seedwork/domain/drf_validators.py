@@ -0,0 +1,48 @@
+from abc import ABC
+from rest_framework.fields import BooleanField, CharField
+from rest_framework.serializers import Serializer
+from django.conf import settings
+from .validators import PropsValidated, ValidatorFieldsInterface
+
+if not settings.configured:
+    settings.configure(USE_I18N=False)
+
+
+class DRFValidator(ValidatorFieldsInterface[PropsValidated], ABC):  # pylint: disable=too-few-public-methods
+
+    def validate(self, data: Serializer) -> bool:
+        if data.is_valid():
+            self.validated_data = dict(
+                data.validated_data  # type: ignore
+            )
+            return True
+        self.errors = {
+            field: [str(_error) for _error in _errors]
+            for field, _errors in data.errors.items()
+        }
+        return False
+
+
+class StrictCharField(CharField):
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail('invalid')
+        return super().to_internal_value(data)
+
+
+class StrictBooleanField(BooleanField):
+    def to_internal_value(self, data):
+        try:
+            if data is True:
+                return True
+            if data is False:
+                return False
+            if data is None and self.allow_null:
+                return None
+
+        except TypeError:
+            pass
+
+        self.fail('invalid', input=data)
+        return None
@@ -0,0 +1,191 @@
+from abc import ABC
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+class Expression(ABC):  # pylint: disable=too-few-public-methods
+
+    def __and__(self, other: 'Expression') -> 'Expression':
+        return And((self, other))
+
+    def __or__(self, other: 'Expression') -> 'Expression':
+        return Or((self, other))
+
+    def __invert__(self) -> 'Expression':
+        return Not(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Condition(Expression):
+    field: str
+    operator: str
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class And(Expression):
+    operands: Tuple[Expression, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Or(Expression):
+    operands: Tuple[Expression, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Not(Expression):
+    operand: Expression
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    name: str
+
+    def eq(self, value: Any) -> Condition:  # pylint: disable=invalid-name
+        return Condition(self.name, 'eq', value)
+
+    def ne(self, value: Any) -> Condition:  # pylint: disable=invalid-name
+        return Condition(self.name, 'ne', value)
+
+    def in_(self, values: Iterable[Any]) -> Condition:
+        return Condition(self.name, 'in', frozenset(values))
+
+    def contains(self, value: str) -> Condition:
+        return Condition(self.name, 'contains', value)
+
+    def icontains(self, value: str) -> Condition:
+        return Condition(self.name, 'icontains', value.lower())
+
+    def startswith(self, value: str) -> Condition:
+        return Condition(self.name, 'startswith', value)
+
+    def gt(self, value: Any) -> Condition:  # pylint: disable=invalid-name
+        return Condition(self.name, 'gt', value)
+
+    def gte(self, value: Any) -> Condition:
+        return Condition(self.name, 'gte', value)
+
+    def lt(self, value: Any) -> Condition:  # pylint: disable=invalid-name
+        return Condition(self.name, 'lt', value)
+
+    def lte(self, value: Any) -> Condition:
+        return Condition(self.name, 'lte', value)
+
+    def range(self, start: Any = None, end: Any = None) -> Expression:
+        conditions = []
+        if start is not None:
+            conditions.append(self.gte(start))
+        if end is not None:
+            conditions.append(self.lte(end))
+        return And(tuple(conditions))
+
+
+# "{v}" is the attribute value, "{p}" the bound parameter. Operators other than
+# eq/ne/in never match a None attribute.
+_OPERATORS: Dict[str, Tuple[str, bool]] = {
+    'eq': ('{v} == {p}', False),
+    'ne': ('{v} != {p}', False),
+    'in': ('{v} in {p}', False),
+    'contains': ('{p} in {v}', True),
+    'icontains': ('{p} in {v}.lower()', True),
+    'startswith': ('{v}.startswith({p})', True),
+    'gt': ('{v} > {p}', True),
+    'gte': ('{v} >= {p}', True),
+    'lt': ('{v} < {p}', True),
+    'lte': ('{v} <= {p}', True),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFilter:
+    predicate: Callable[[Any], bool]
+    apply: Callable[[Iterable[Any]], List[Any]]
+
+    def __call__(self, item: Any) -> bool:
+        return self.predicate(item)
+
+
+class FilterCompiler:
+    # Expressions are compiled into one generated function per *shape*
+    # (fields, operators and nesting, without the values), so searches that
+    # only differ by their values reuse the same code object.
+
+    __slots__ = ('_factories', '_lock')
+
+    def __init__(self) -> None:
+        self._factories: Dict[Any, Callable[..., CompiledFilter]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def compile(self, expression: Expression) -> CompiledFilter:
+        values: List[Any] = []
+        shape = self._shape(expression, values)
+        factory = self._factories.get(shape)
+        if factory is None:
+            with self._lock:
+                factory = self._factories.get(shape)
+                if factory is None:
+                    factory = self._build_factory(shape, len(values))
+                    self._factories[shape] = factory
+        return factory(*values)
+
+    def _shape(self, expression: Expression, values: List[Any]) -> Any:
+        if isinstance(expression, Condition):
+            if expression.operator not in _OPERATORS:
+                raise ValueError(f"Unknown filter operator '{expression.operator}'")
+            if not expression.field.isidentifier():
+                raise ValueError(f"Invalid filter field '{expression.field}'")
+            values.append(expression.value)
+            return (expression.field, expression.operator)
+        if isinstance(expression, (And, Or)):
+            return (
+                type(expression).__name__.lower(),
+                tuple(self._shape(operand, values) for operand in expression.operands)
+            )
+        if isinstance(expression, Not):
+            return ('not', self._shape(expression.operand, values))
+        raise TypeError(f'Unsupported filter expression {expression!r}')
+
+    def _build_factory(self, shape: Any, total_values: int) -> Callable[..., CompiledFilter]:
+        counter = iter(range(total_values))
+        source = self._source(shape, counter)
+        params = ', '.join(f'_p{index}' for index in range(total_values))
+        code = (
+            f'def factory({params}):\n'
+            f'    def predicate(item):\n'
+            f'        return {source}\n'
+            f'    def apply(items):\n'
+            f'        return [item for item in items if {source}]\n'
+            f'    return CompiledFilter(predicate, apply)\n'
+        )
+        namespace: Dict[str, Any] = {'CompiledFilter': CompiledFilter}
+        exec(compile(code, '<filter>', 'exec'), namespace)  # pylint: disable=exec-used
+        return namespace['factory']
+
+    def _source(self, shape: Any, counter) -> str:
+        kind = shape[0]
+        if kind in ('and', 'or'):
+            operands = [self._source(operand, counter) for operand in shape[1]]
+            if not operands:
+                return 'True' if kind == 'and' else 'False'
+            return '(' + f' {kind} '.join(operands) + ')'
+        if kind == 'not':
+            return f'(not {self._source(shape[1], counter)})'
+
+        field, operator = shape
+        index = next(counter)
+        template, null_safe = _OPERATORS[operator]
+        if not null_safe:
+            return '(' + template.format(v=f'item.{field}', p=f'_p{index}') + ')'
+        return f'((_v{index} := item.{field}) is not None and ' + \
+            template.format(v=f'_v{index}', p=f'_p{index}') + ')'
+
+
+default_compiler = FilterCompiler()
+
+
+def compile_filter(expression: Expression) -> CompiledFilter:
+    return default_compiler.compile(expression)
@@ -4,10 +4,12 @@ from abc import ABC
 import abc
 from dataclasses import Field, dataclass, field
 import math
+import threading
 from typing import Any, List, Optional, TypeVar, Generic
 
 from core.__seedwork.domain.entities import Entity
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Expression, compile_filter
 
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
@@ -92,6 +94,8 @@ class SearchParams(Generic[Filter]):
         self.sort_dir = 'asc' if sort_dir not in ['asc', 'desc'] else sort_dir
 
     def _normalize_filter(self):
+        if isinstance(self.filter, Expression):
+            return
         self.filter = None if self.filter == "" or self.filter is None else str(  # type: ignore
             self.filter
         )
@@ -175,6 +179,39 @@ class InMemoryRepository(RepositoryInterface[ET], ABC):
         return entity
 
 
+class CopyOnWriteInMemoryRepository(InMemoryRepository[ET], ABC):
+    # Writers copy "items" under a lock and publish the new list with one
+    # assignment; readers work on whichever list they picked up, so they
+    # never block and never see a half-applied write.
+
+    def __init__(self, items: Optional[List[ET]] = None) -> None:
+        super().__init__(list(items) if items is not None else [])
+        self._write_lock = threading.Lock()
+
+    def insert(self, entity: ET) -> None:
+        with self._write_lock:
+            self.items = [*self.items, entity]
+
+    def update(self, entity: ET) -> None:
+        with self._write_lock:
+            items = list(self.items)
+            items[self._index(items, entity.id)] = entity
+            self.items = items
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        with self._write_lock:
+            items = list(self.items)
+            del items[self._index(items, str(entity_id))]
+            self.items = items
+
+    @staticmethod
+    def _index(items: List[ET], entity_id: str) -> int:
+        for index, item in enumerate(items):
+            if item.id == entity_id:
+                return index
+        raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+
 class InMemorySearchableRepository(
     Generic[ET, Filter],
     InMemoryRepository[ET],
@@ -187,7 +224,9 @@ class InMemorySearchableRepository(
 ):
 
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
-        items_filtered = self._apply_filter(self.items, input_params.filter)
+        items_filtered = compile_filter(input_params.filter).apply(self.items) \
+            if isinstance(input_params.filter, Expression) \
+            else self._apply_filter(self.items, input_params.filter)
         items_sorted = self._apply_sort(
             items_filtered, input_params.sort, input_params.sort_dir
         )
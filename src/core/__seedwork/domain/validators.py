@@ -1,16 +1,19 @@
-
-
 from abc import ABC
 import abc
 from dataclasses import dataclass
+from importlib import import_module
 from typing import Any, Dict, Generic, List, TypeVar
-from rest_framework.fields import BooleanField, CharField
-from rest_framework.serializers import Serializer
-from django.conf import settings
 from .exceptions import ValidationException
 
-if not settings.configured:
-    settings.configure(USE_I18N=False)
+# DRF (and settings.configure for use outside Django) is only imported by the
+# DRF-backed validators, on first access to one of these names
+_DRF_VALIDATORS = ('DRFValidator', 'StrictBooleanField', 'StrictCharField')
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DRF_VALIDATORS:
+        return getattr(import_module('core.__seedwork.domain.drf_validators'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 @dataclass(frozen=True, slots=True)
@@ -60,43 +63,3 @@ class ValidatorFieldsInterface(ABC, Generic[PropsValidated]):
     @abc.abstractmethod
     def validate(self, data: Any) -> bool:
         raise NotImplementedError()
-
-
-class DRFValidator(ValidatorFieldsInterface[PropsValidated], ABC):  # pylint: disable=too-few-public-methods
-
-    def validate(self, data: Serializer) -> bool:
-        if data.is_valid():
-            self.validated_data = dict(
-                data.validated_data  # type: ignore
-            )
-            return True
-        self.errors = {
-            field: [str(_error) for _error in _errors]
-            for field, _errors in data.errors.items()
-        }
-        return False
-
-
-class StrictCharField(CharField):
-
-    def to_internal_value(self, data):
-        if not isinstance(data, str):
-            self.fail('invalid')
-        return super().to_internal_value(data)
-
-
-class StrictBooleanField(BooleanField):
-    def to_internal_value(self, data):
-        try:
-            if data is True:
-                return True
-            if data is False:
-                return False
-            if data is None and self.allow_null:
-                return None
-
-        except TypeError:
-            pass
-
-        self.fail('invalid', input=data)
-        return None
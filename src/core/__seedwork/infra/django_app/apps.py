@@ -0,0 +1,53 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class SeedworkConfig(AppConfig):
+    name = 'core.__seedwork.infra.django_app'
+    label = 'seedwork'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created  # pylint: disable=import-outside-toplevel
+        from django.db.models.signals import post_delete, post_save  # pylint: disable=import-outside-toplevel
+        from . import routers, sqlite  # pylint: disable=import-outside-toplevel
+        connection_created.connect(sqlite.apply_pragmas)
+        post_save.connect(routers.record_write, dispatch_uid='read_your_writes_save')
+        post_delete.connect(routers.record_write, dispatch_uid='read_your_writes_delete')
+        install_collectors()
+        if getattr(settings, 'SAMPLING_PROFILER_ENABLED', False):
+            start_sampling_profiler()
+
+
+def install_collectors() -> None:
+    # instrumentation collectors enabled in the settings; none leaves the
+    # no-op collector in place
+    from core.__seedwork.infra import instrumentation  # pylint: disable=import-outside-toplevel
+    collectors = []
+    if getattr(settings, 'METRICS_ENABLED', False):
+        from core.__seedwork.infra.metrics import MetricsCollector  # pylint: disable=import-outside-toplevel
+        collectors.append(MetricsCollector())
+    if getattr(settings, 'SERVER_TIMING_ENABLED', False):
+        from .server_timing import ServerTimingCollector  # pylint: disable=import-outside-toplevel
+        collectors.append(ServerTimingCollector())
+    if len(collectors) > 1:
+        instrumentation.set_collector(instrumentation.CompositeCollector(*collectors))
+    else:
+        instrumentation.set_collector(collectors[0] if collectors else None)
+
+
+def start_sampling_profiler():
+    # background sampler of the request threads writing rotated collapsed
+    # stack files; stopped (and flushed) at exit
+    import atexit  # pylint: disable=import-outside-toplevel
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+    from core.__seedwork.infra import profiling  # pylint: disable=import-outside-toplevel
+    sampler = profiling.RotatingStackSampler(
+        settings.SAMPLING_PROFILER_INTERVAL,
+        profiling.active_threads,
+        Path(settings.SAMPLING_PROFILER_DIR),
+        rotate_seconds=settings.SAMPLING_PROFILER_ROTATE_SECONDS,
+        keep=settings.SAMPLING_PROFILER_KEEP
+    )
+    sampler.start()
+    atexit.register(sampler.stop)
+    return sampler
@@ -0,0 +1,39 @@
+from django.db.models import Q
+
+from core.__seedwork.domain.filters import And, Condition, Expression, Not, Or
+
+_LOOKUPS = {
+    'eq': 'exact',
+    'in': 'in',
+    'contains': 'contains',
+    'icontains': 'icontains',
+    'startswith': 'startswith',
+    'gt': 'gt',
+    'gte': 'gte',
+    'lt': 'lt',
+    'lte': 'lte',
+}
+
+
+def expression_to_q(expression: Expression) -> Q:
+    if isinstance(expression, Condition):
+        if expression.operator == 'ne':
+            return ~Q(**{expression.field: expression.value})
+        if expression.operator not in _LOOKUPS:
+            raise ValueError(f"Unknown filter operator '{expression.operator}'")
+        return Q(**{f'{expression.field}__{_LOOKUPS[expression.operator]}': expression.value})
+    if isinstance(expression, And):
+        condition = Q()
+        for operand in expression.operands:
+            condition &= expression_to_q(operand)
+        return condition
+    if isinstance(expression, Or):
+        if not expression.operands:
+            return Q(pk__in=[])
+        condition = expression_to_q(expression.operands[0])
+        for operand in expression.operands[1:]:
+            condition |= expression_to_q(operand)
+        return condition
+    if isinstance(expression, Not):
+        return ~expression_to_q(expression.operand)
+    raise TypeError(f'Unsupported filter expression {expression!r}')
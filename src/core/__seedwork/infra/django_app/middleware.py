@@ -0,0 +1,247 @@
+import hmac
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+import tracemalloc
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core.__seedwork.infra import metrics, profiling
+from core.__seedwork.infra.django_app import routers
+from core.__seedwork.infra.django_app.queries import count_queries
+from core.__seedwork.infra.django_app.server_timing import (
+    current_timings, header_value, request_timings
+)
+
+PRIMARY_COOKIE = 'primary_until'
+
+logger = logging.getLogger(__name__)
+
+
+class ReadYourWritesMiddleware:
+    # after a request that wrote to the primary, the client's reads stay on
+    # the primary for READ_YOUR_WRITES_SECONDS so replica lag never hides
+    # its own writes
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with routers.request_scope(primary=self._is_pinned(request)) as state:
+            response = self.get_response(request)
+        if state['wrote']:
+            seconds = getattr(settings, 'READ_YOUR_WRITES_SECONDS', 5)
+            response.set_cookie(
+                PRIMARY_COOKIE, str(time.time() + seconds),
+                max_age=seconds, httponly=True, samesite='Lax'
+            )
+        return response
+
+    @staticmethod
+    def _is_pinned(request) -> bool:
+        try:
+            return float(request.COOKIES.get(PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+
+class MetricsMiddleware:
+    # request count and latency per route, and the SQL run while serving
+    # it; goes first in MIDDLEWARE so the timing covers the whole stack
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'METRICS_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with count_queries() as queries:
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        route = match.route if match is not None else 'unmatched'
+        metrics.HTTP_REQUESTS.inc(request.method, route, str(response.status_code))
+        metrics.HTTP_DURATION.observe(duration, request.method, route)
+        for alias, (count, total) in queries.by_alias.items():
+            metrics.DB_QUERIES.inc(alias, value=count)
+            metrics.DB_DURATION.inc(alias, value=total)
+        return response
+
+
+class ServerTimingMiddleware:
+    # Server-Timing header with the time spent validating the input, in
+    # the use case, in SQL, rendering the response and in total; the
+    # first two come from ServerTimingCollector
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'SERVER_TIMING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with request_timings() as timings, count_queries() as queries:
+            response = self.get_response(request)
+        timings['db'] = queries.duration
+        timings['total'] = time.perf_counter() - start
+        response['Server-Timing'] = header_value(timings)
+        return response
+
+    def process_template_response(self, _request, response):
+        # DRF responses are rendered right after this hook returns
+        timings = current_timings()
+        if timings is None:
+            return response
+        start = time.perf_counter()
+
+        def rendered(_response):
+            timings['render'] = time.perf_counter() - start
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class QueryLogMiddleware:
+    # logs the SQL of requests running more than QUERY_LOG_MAX_QUERIES
+    # queries, spending more than QUERY_LOG_MAX_SECONDS in them or running
+    # one statement QUERY_LOG_REPEATED_QUERIES times (an N+1)
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'QUERY_LOG_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.max_queries = getattr(settings, 'QUERY_LOG_MAX_QUERIES', 10)
+        self.max_seconds = getattr(settings, 'QUERY_LOG_MAX_SECONDS', 0.1)
+        self.repeated_queries = getattr(settings, 'QUERY_LOG_REPEATED_QUERIES', 5)
+
+    def __call__(self, request):
+        with count_queries(capture=True) as queries:
+            response = self.get_response(request)
+        repeated = queries.repeated(self.repeated_queries)
+        if queries.count > self.max_queries or queries.duration > self.max_seconds or repeated:
+            logger.warning(
+                '%s %s ran %d queries in %.1f ms%s\n%s',
+                request.method, request.path, queries.count, queries.duration * 1e3,
+                ''.join(f'\n  possible N+1, {count} times: {sql}' for sql, count in repeated),
+                queries.report()
+            )
+        return response
+
+
+class SamplingProfilerMiddleware:
+    # marks the threads serving requests for the sampler started by
+    # SeedworkConfig when SAMPLING_PROFILER_ENABLED; goes first in
+    # MIDDLEWARE so the whole stack is sampled
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'SAMPLING_PROFILER_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with profiling.serving():
+            return self.get_response(request)
+
+
+class AllocationTrackingMiddleware:
+    # traces Python allocations with tracemalloc while a request runs and
+    # logs and records the peak and net (still allocated at the end) bytes
+    # and the modules holding the most. Tracing slows every allocation down,
+    # so it is opt-in and one request is traced at a time.
+    #
+    # tracemalloc is process wide: requests running on other threads at the
+    # same time are traced too and their allocations end up in the numbers.
+    # They are per request only with a single worker thread (e.g. one gunicorn
+    # sync worker per process); the log line and the "concurrent" metric label
+    # tell how many other requests overlapped.
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'ALLOCATION_TRACKING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.frames = getattr(settings, 'ALLOCATION_TRACKING_FRAMES', 25)
+        self.top = getattr(settings, 'ALLOCATION_TRACKING_TOP', 10)
+        self._lock = threading.Lock()
+        # requests started so far and running now, to count the overlaps
+        self._counter_lock = threading.Lock()
+        self._started = 0
+        self._in_flight = 0
+
+    def __call__(self, request):
+        with self._counter_lock:
+            self._started += 1
+            self._in_flight += 1
+        try:
+            if tracemalloc.is_tracing() or not self._lock.acquire(blocking=False):
+                return self.get_response(request)
+            try:
+                return self._traced(request)
+            finally:
+                self._lock.release()
+        finally:
+            with self._counter_lock:
+                self._in_flight -= 1
+
+    def _traced(self, request):
+        with self._counter_lock:
+            started, running = self._started, self._in_flight - 1
+        tracemalloc.start(self.frames)
+        try:
+            response = self.get_response(request)
+            net, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        concurrent = running + self._started - started
+
+        match = request.resolver_match
+        route = match.route if match is not None else 'unmatched'
+        labels = (request.method, route, 'true' if concurrent else 'false')
+        metrics.HTTP_PROCESS_ALLOCATED.observe(net, *labels)
+        metrics.HTTP_PROCESS_PEAK_ALLOCATED.observe(peak, *labels)
+        logger.info(
+            'while serving %s %s the process allocated %.1f KiB at peak, %.1f KiB still held '
+            '(%d concurrent requests included):\n%s',
+            request.method, request.get_full_path(), peak / 1024, net / 1024, concurrent,
+            '\n'.join(
+                f'  {size / 1024:10.1f} KiB {count:7d} blocks  {module}'
+                for module, size, count in profiling.allocation_sites(snapshot, self.top)
+            )
+        )
+        return response
+
+
+class ProfilingMiddleware:
+    # runs requests carrying an X-Profile header equal to PROFILING_TOKEN
+    # under cProfile and a stack sampler, saves <id>.pstats and
+    # <id>.collapsed (flamegraph input) to PROFILING_DIR and returns the
+    # id in X-Profile-Id; goes last in MIDDLEWARE so the profile is about
+    # the view
+
+    def __init__(self, get_response) -> None:
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.token = getattr(settings, 'PROFILING_TOKEN', '')
+        self.directory = Path(getattr(settings, 'PROFILING_DIR', 'profiles'))
+        self.interval = getattr(settings, 'PROFILING_SAMPLE_INTERVAL', 0.001)
+
+    def __call__(self, request):
+        token = request.headers.get('X-Profile')
+        # bytes: compare_digest() rejects non-ASCII str, which any client can send
+        if token is None or not self.token or not hmac.compare_digest(token.encode(), self.token.encode()):
+            return self.get_response(request)
+
+        with profiling.profiling(self.interval) as profile:
+            response = self.get_response(request)
+        path = re.sub(r'[^\w-]+', '_', request.path).strip('_') or 'root'
+        name = f'{time.strftime("%Y%m%dT%H%M%S")}-{request.method}-{path}-{uuid.uuid4().hex[:8]}'
+        files = profile.save(self.directory, name)
+        logger.info('profiled %s %s: %s', request.method, request.path, ', '.join(map(str, files)))
+        response['X-Profile-Id'] = name
+        return response
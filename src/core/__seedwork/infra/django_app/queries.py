@@ -0,0 +1,97 @@
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.db import connections
+
+from core.__seedwork.infra.profiling import qualname
+
+
+@dataclass(slots=True)
+class Query:
+    alias: str
+    sql: str
+    duration: float
+    caller: Optional[str]
+
+
+class QueryCounter:
+    # connection.execute_wrapper counting queries and their duration per
+    # database alias; with capture it also keeps each query and the
+    # application function that ran it
+
+    def __init__(self, capture: bool = False) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.by_alias: Dict[str, list] = {}
+        self.capture = capture
+        self.queries: List[Query] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            alias = context['connection'].alias
+            self.count += 1
+            self.duration += duration
+            totals = self.by_alias.setdefault(alias, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            if self.capture:
+                self.queries.append(Query(alias, sql, duration, caller()))
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        # the same statement run threshold times or more, the shape of an
+        # N+1: parameters are placeholders, so only the values differ
+        counts = Counter(query.sql for query in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+    def report(self) -> str:
+        return '\n'.join(
+            f'  {query.duration * 1e3:8.3f} ms  {query.alias}  {query.caller}: {query.sql}'
+            for query in self.queries
+        )
+
+
+def caller() -> Optional[str]:
+    # the innermost public application function on the stack, e.g. the
+    # repository method; private helpers such as _get() are skipped
+    frame = sys._getframe(2)  # pylint: disable=protected-access
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        code = frame.f_code
+        if (
+            module.startswith('core.') and not module.startswith('core.__seedwork.infra')
+            and not code.co_name.startswith(('_', '<'))
+        ):
+            return f'{module}.{qualname(frame)}'
+        frame = frame.f_back
+    return None
+
+
+@contextmanager
+def count_queries(capture: bool = False) -> Iterator[QueryCounter]:
+    # counts the queries run by this thread on every configured database
+    counter = QueryCounter(capture)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryCounter]:
+    # query budget for tests:
+    #     with assert_max_queries(2):
+    #         use_case.execute(input_param)
+    with count_queries(capture=True) as counter:
+        yield counter
+    if counter.count > limit:
+        raise AssertionError(
+            f'{counter.count} queries, expected at most {limit}:\n{counter.report()}'
+        )
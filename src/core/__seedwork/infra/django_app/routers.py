@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import random
+from typing import Dict, Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# set for the duration of a request by ReadYourWritesMiddleware: "primary"
+# pins the reads of a client that wrote recently, "wrote" the ones that
+# follow a write in the same request
+_request_state: ContextVar[Optional[Dict[str, bool]]] = ContextVar('request_state', default=None)
+
+
+@contextmanager
+def request_scope(primary: bool = False) -> Iterator[Dict[str, bool]]:
+    state = {'primary': primary, 'wrote': False}
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+def record_write(**_kwargs) -> None:
+    # post_save/post_delete receiver (see SeedworkConfig.ready): only a
+    # write that went through pins the reads, not routing one, which also
+    # happens for the existence check before an update or delete
+    state = _request_state.get()
+    if state is not None:
+        state['wrote'] = True
+
+
+class ReadReplicaRouter:
+    # reads go to one of settings.DATABASE_REPLICAS, writes to the primary
+    # ("default"); without replicas every query stays on the primary
+
+    def db_for_read(self, model, **hints) -> Optional[str]:  # pylint: disable=unused-argument
+        replicas = getattr(settings, 'DATABASE_REPLICAS', None)
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        state = _request_state.get()
+        if state is not None and (state['primary'] or state['wrote']):
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints) -> Optional[str]:  # pylint: disable=unused-argument
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:  # pylint: disable=unused-argument
+        databases = {DEFAULT_DB_ALIAS, *getattr(settings, 'DATABASE_REPLICAS', [])}
+        if obj1._state.db in databases and obj2._state.db in databases:  # pylint: disable=protected-access
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:  # pylint: disable=unused-argument
+        return None
@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from core.__seedwork.infra.instrumentation import LAYER_HTTP, LAYER_USE_CASE, Collector
+
+# durations in seconds recorded for the request served by this context
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar('server_timing', default=None)
+
+_METRICS = {(LAYER_HTTP, 'validate'): 'validate'}
+
+
+class ServerTimingCollector(Collector):
+    # instrumentation collector adding validation and use case time to the
+    # current request's timings; a no-op outside ServerTimingMiddleware
+
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        timings = _timings.get()
+        if timings is None:
+            return
+        metric = 'use_case' if layer == LAYER_USE_CASE else _METRICS.get((layer, name))
+        if metric is not None:
+            timings[metric] = timings.get(metric, 0.0) + duration
+
+
+def current_timings() -> Optional[Dict[str, float]]:
+    return _timings.get()
+
+
+@contextmanager
+def request_timings() -> Iterator[Dict[str, float]]:
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def header_value(timings: Dict[str, float]) -> str:
+    # Server-Timing wants milliseconds
+    return ', '.join(f'{metric};dur={duration * 1e3:.3f}' for metric, duration in timings.items())
@@ -0,0 +1,22 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+
+from core.__seedwork.infra import metrics
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    if not getattr(settings, 'METRICS_ENABLED', False):
+        raise Http404()
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token and not hmac.compare_digest(
+        request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode()
+    ):
+        response = HttpResponse(status=401)
+        response['WWW-Authenticate'] = 'Bearer'
+        return response
+    return HttpResponse(
+        metrics.REGISTRY.render(metrics.cache_hit_ratios()),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -0,0 +1,96 @@
+from collections import Counter
+import math
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    # mirrors SQLite's "unicode61 remove_diacritics 2" tokenizer closely enough
+    # for both backends to agree on which documents match
+    if not text:
+        return []
+    return _TOKEN_RE.findall(normalize(text))
+
+
+class InvertedIndex:
+
+    __slots__ = ('postings', 'doc_terms', 'doc_lengths', 'total_length', 'k1', 'b')
+
+    postings: Dict[str, Dict[str, int]]
+    doc_terms: Dict[str, Tuple[str, ...]]
+    doc_lengths: Dict[str, int]
+    total_length: int
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.postings = {}
+        self.doc_terms = {}
+        self.doc_lengths = {}
+        self.total_length = 0
+        self.k1 = k1
+        self.b = b
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def copy(self) -> 'InvertedIndex':
+        # the copy can be changed without affecting this index
+        index = InvertedIndex(self.k1, self.b)
+        index.postings = {term: dict(docs) for term, docs in self.postings.items()}
+        index.doc_terms = dict(self.doc_terms)
+        index.doc_lengths = dict(self.doc_lengths)
+        index.total_length = self.total_length
+        return index
+
+    def add(self, doc_id: str, texts: Iterable[Optional[str]]) -> None:
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        terms = [term for text in texts for term in tokenize(text)]
+        frequencies = Counter(terms)
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+        self.doc_terms[doc_id] = tuple(frequencies)
+        self.doc_lengths[doc_id] = len(terms)
+        self.total_length += len(terms)
+
+    def remove(self, doc_id: str) -> None:
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in self.doc_terms.pop(doc_id):
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+
+    def search(self, text: str) -> Dict[str, float]:
+        terms = set(tokenize(text))
+        if not terms or not self.doc_lengths:
+            return {}
+        postings = [self.postings.get(term) for term in terms]
+        if not all(postings):
+            return {}
+        postings.sort(key=len)
+        matched = set(postings[0]).intersection(*postings[1:])  # type: ignore
+
+        total_docs = len(self.doc_lengths)
+        avg_length = self.total_length / total_docs or 1
+        scores = dict.fromkeys(matched, 0.0)
+        for docs in postings:
+            idf = math.log(1 + (total_docs - len(docs) + 0.5) / (len(docs) + 0.5))  # type: ignore
+            for doc_id in matched:
+                frequency = docs[doc_id]  # type: ignore
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores
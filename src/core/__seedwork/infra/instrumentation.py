@@ -0,0 +1,174 @@
+from abc import ABC
+import abc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from core.__seedwork.application.use_cases import UseCase
+from core.__seedwork.domain.repositories import RepositoryInterface
+
+LAYER_HTTP = 'http'
+LAYER_USE_CASE = 'use_case'
+LAYER_REPOSITORY = 'repository'
+
+T = TypeVar('T')
+
+
+class Collector(ABC):
+
+    @abc.abstractmethod
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        raise NotImplementedError()
+
+    def cache(self, name: str, hits: int, misses: int) -> None:
+        pass
+
+
+class NullCollector(Collector):  # pylint: disable=too-few-public-methods
+
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        pass
+
+
+class CompositeCollector(Collector):
+
+    def __init__(self, *collectors: Collector) -> None:
+        self.collectors = collectors
+
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        for collector in self.collectors:
+            collector.record(layer, name, duration, error)
+
+    def cache(self, name: str, hits: int, misses: int) -> None:
+        for collector in self.collectors:
+            collector.cache(name, hits, misses)
+
+
+@dataclass(slots=True)
+class CallStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+
+class StatsCollector(Collector):
+    # call count, total/max duration and exceptions by type per
+    # (layer, name); enough for tests and ad hoc diagnosis
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stats: Dict[Tuple[str, str], CallStats] = {}
+        self.caches: Dict[str, Tuple[int, int]] = {}
+
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        with self._lock:
+            stats = self.stats.get((layer, name))
+            if stats is None:
+                stats = self.stats[(layer, name)] = CallStats()
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            if error is not None:
+                error_name = type(error).__name__
+                stats.errors[error_name] = stats.errors.get(error_name, 0) + 1
+
+    def cache(self, name: str, hits: int, misses: int) -> None:
+        with self._lock:
+            total_hits, total_misses = self.caches.get(name, (0, 0))
+            self.caches[name] = (total_hits + hits, total_misses + misses)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.caches.clear()
+
+
+_NULL_COLLECTOR = NullCollector()
+_collector: Collector = _NULL_COLLECTOR
+
+
+def get_collector() -> Collector:
+    return _collector
+
+
+def set_collector(collector: Optional[Collector]) -> Collector:
+    # returns the previous collector so callers can restore it
+    global _collector  # pylint: disable=global-statement
+    previous = _collector
+    _collector = collector if collector is not None else _NULL_COLLECTOR
+    return previous
+
+
+def record_cache(name: str, hits: int = 0, misses: int = 0) -> None:
+    collector = _collector
+    if collector is not _NULL_COLLECTOR:
+        collector.cache(name, hits, misses)
+
+
+def timed(layer: str, name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorate(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            collector = _collector
+            if collector is _NULL_COLLECTOR:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                collector.record(layer, name, time.perf_counter() - start, error)
+                raise
+            collector.record(layer, name, time.perf_counter() - start, None)
+            return result
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def span(layer: str, name: str) -> Iterator[None]:
+    # times a block the way timed() times a call
+    collector = _collector
+    if collector is _NULL_COLLECTOR:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as error:
+        collector.record(layer, name, time.perf_counter() - start, error)
+        raise
+    collector.record(layer, name, time.perf_counter() - start, None)
+
+
+def layer_of(cls: type) -> Optional[str]:
+    if issubclass(cls, UseCase):
+        return LAYER_USE_CASE
+    if issubclass(cls, RepositoryInterface):
+        return LAYER_REPOSITORY
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def instrumented(cls: Type[T], layer: Optional[str] = None) -> Type[T]:
+    # subclass of cls whose public methods report to the collector; use
+    # cases only time execute(), repositories every public method
+    layer = layer or layer_of(cls)
+    if layer is None:
+        return cls
+    if layer == LAYER_USE_CASE:
+        names = ['execute']
+    else:
+        names = [
+            name for name in dir(cls)
+            if not name.startswith('_') and inspect.isfunction(inspect.getattr_static(cls, name))
+        ]
+    namespace: Dict[str, Any] = {
+        name: timed(layer, f'{cls.__name__}.{name}')(getattr(cls, name)) for name in names
+    }
+    namespace.update(__slots__=(), __module__=cls.__module__, __qualname__=cls.__qualname__)
+    return type(cls.__name__, (cls,), namespace)  # type: ignore
@@ -0,0 +1,239 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.__seedwork.infra.instrumentation import LAYER_REPOSITORY, LAYER_USE_CASE, Collector
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+Key = Tuple[str, Tuple[str, ...]]  # metric name, label values
+
+
+class _Shard:
+    # the samples of one thread: only that thread writes to it, so
+    # recording takes no lock
+    __slots__ = ('counters', 'histograms')
+
+    def __init__(self) -> None:
+        self.counters: Dict[Key, float] = {}
+        # bucket counts (not cumulative), +Inf count, then the sum
+        self.histograms: Dict[Key, List[float]] = {}
+
+    def merge(self, other: '_Shard') -> None:
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, values in list(other.histograms.items()):
+            target = self.histograms.get(key)
+            if target is None:
+                self.histograms[key] = list(values)
+            else:
+                for index, value in enumerate(values):
+                    target[index] += value
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    registry: 'Registry'
+    name: str
+    help: str
+    kind: str
+    labels: Tuple[str, ...]
+    buckets: Tuple[float, ...] = ()
+
+    def inc(self, *label_values: str, value: float = 1) -> None:
+        counters = self.registry.shard().counters
+        key = (self.name, label_values)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, value: float, *label_values: str) -> None:
+        histograms = self.registry.shard().histograms
+        key = (self.name, label_values)
+        data = histograms.get(key)
+        if data is None:
+            data = histograms[key] = [0] * (len(self.buckets) + 2)
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+
+class Registry:
+    # Metrics are recorded into per-thread shards and only merged when
+    # rendered; shards of finished threads are folded into one so
+    # thread-per-connection servers do not grow the list forever.
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        self._retired = _Shard()
+        self.metrics: Dict[str, Metric] = {}
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Metric:
+        return self._register(Metric(self, name, help_text, 'counter', tuple(labels)))
+
+    def histogram(
+        self, name: str, help_text: str, labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Metric:
+        return self._register(
+            Metric(self, name, help_text, 'histogram', tuple(labels), tuple(sorted(buckets)))
+        )
+
+    def shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def collect(self) -> _Shard:
+        with self._lock:
+            alive = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    alive.append((thread, shard))
+                else:
+                    self._retired.merge(shard)
+            self._shards = alive
+            merged = _Shard()
+            merged.merge(self._retired)
+            for _, shard in alive:
+                merged.merge(shard)
+        return merged
+
+    def reset(self) -> None:
+        with self._lock:
+            for _, shard in self._shards:
+                shard.counters.clear()
+                shard.histograms.clear()
+            self._retired = _Shard()
+
+    def render(self, extra: Optional[List[str]] = None) -> str:
+        # Prometheus text exposition format, version 0.0.4
+        samples = self.collect()
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            if metric.kind == 'counter':
+                for (name, values), value in sorted(samples.counters.items()):
+                    if name == metric.name:
+                        lines.append(f'{name}{_labels(metric.labels, values)} {_number(value)}')
+                continue
+            for (name, values), data in sorted(samples.histograms.items()):
+                if name != metric.name:
+                    continue
+                cumulative = 0
+                for bound, count in zip((*metric.buckets, '+Inf'), data):
+                    cumulative += count
+                    labels = _labels((*metric.labels, 'le'), (*values, _number(bound)))
+                    lines.append(f'{name}_bucket{labels} {_number(cumulative)}')
+                lines.append(f'{name}_sum{_labels(metric.labels, values)} {_number(data[-1])}')
+                lines.append(f'{name}_count{_labels(metric.labels, values)} {_number(cumulative)}')
+        lines.extend(extra or [])
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric: Metric) -> Metric:
+        existing = self.metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self.metrics[metric.name] = metric
+        return metric
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return f'{{{pairs}}}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    if isinstance(value, str):
+        return value
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    'http_requests_total', 'HTTP requests by method, route and status.', ('method', 'route', 'status')
+)
+HTTP_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', 'HTTP request latency by method and route.', ('method', 'route')
+)
+USE_CASE_DURATION = REGISTRY.histogram(
+    'use_case_duration_seconds', 'UseCase.execute latency.', ('use_case',)
+)
+REPOSITORY_DURATION = REGISTRY.histogram(
+    'repository_duration_seconds', 'Repository method latency.', ('method',)
+)
+ERRORS = REGISTRY.counter(
+    'instrumented_errors_total', 'Exceptions raised by use cases and repositories.',
+    ('layer', 'name', 'exception')
+)
+CACHE_HITS = REGISTRY.counter('cache_hits_total', 'Cache hits.', ('cache',))
+CACHE_MISSES = REGISTRY.counter('cache_misses_total', 'Cache misses.', ('cache',))
+DB_QUERIES = REGISTRY.counter(
+    'db_queries_total', 'SQL queries executed while serving requests.', ('database',)
+)
+DB_DURATION = REGISTRY.counter(
+    'db_query_seconds_total', 'Time spent in SQL queries while serving requests.', ('database',)
+)
+BYTES_BUCKETS = tuple(2.0 ** power for power in range(16, 30, 2))  # 64 KiB to 256 MiB
+# tracemalloc counts the whole process: with requests running concurrently
+# (concurrent="true") their allocations are included
+HTTP_PROCESS_ALLOCATED = REGISTRY.histogram(
+    'http_request_process_allocated_bytes',
+    'Memory allocated by the process while a tracked request ran and still held at its end.',
+    ('method', 'route', 'concurrent'), BYTES_BUCKETS
+)
+HTTP_PROCESS_PEAK_ALLOCATED = REGISTRY.histogram(
+    'http_request_process_peak_allocated_bytes',
+    'Peak memory allocated by the process while a tracked request ran.',
+    ('method', 'route', 'concurrent'), BYTES_BUCKETS
+)
+
+_LAYER_HISTOGRAMS = {LAYER_USE_CASE: USE_CASE_DURATION, LAYER_REPOSITORY: REPOSITORY_DURATION}
+
+
+class MetricsCollector(Collector):
+    # instrumentation collector feeding the registry above
+
+    def record(self, layer: str, name: str, duration: float, error: Optional[BaseException]) -> None:
+        histogram = _LAYER_HISTOGRAMS.get(layer)
+        if histogram is not None:
+            histogram.observe(duration, name)
+        if error is not None:
+            ERRORS.inc(layer, name, type(error).__name__)
+
+    def cache(self, name: str, hits: int, misses: int) -> None:
+        if hits:
+            CACHE_HITS.inc(name, value=hits)
+        if misses:
+            CACHE_MISSES.inc(name, value=misses)
+
+
+def cache_hit_ratios(registry: Registry = REGISTRY) -> List[str]:
+    # gauge derived from the two counters at render time
+    samples = registry.collect().counters
+    lines = ['# HELP cache_hit_ratio Cache hits over lookups.', '# TYPE cache_hit_ratio gauge']
+    for (name, values), hits in sorted(samples.items()):
+        if name != CACHE_HITS.name:
+            continue
+        misses = samples.get((CACHE_MISSES.name, values), 0)
+        lines.append(f'cache_hit_ratio{_labels(("cache",), values)} {_number(hits / (hits + misses))}')
+    for (name, values), misses in sorted(samples.items()):
+        if name == CACHE_MISSES.name and (CACHE_HITS.name, values) not in samples:
+            lines.append(f'cache_hit_ratio{_labels(("cache",), values)} 0')
+    return lines
@@ -0,0 +1,114 @@
+from bisect import bisect_left, insort
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.__seedwork.infra.fulltext import normalize
+
+_SEPARATOR = '\x00'
+
+
+class PrefixIndex:
+    # keys are "<normalized label>\0<id>" kept sorted, so a prefix lookup is
+    # one bisect plus a short forward scan. Writers copy keys and labels under
+    # a lock and publish them together with one assignment; complete() reads
+    # whichever pair it picked up without locking
+
+    __slots__ = ('entries', 'is_built', '_view', '_lock', '_build_lock', '_pending')
+
+    entries: Dict[str, str]
+    is_built: bool
+
+    def __init__(self) -> None:
+        self.entries = {}
+        self.is_built = False
+        self._view: Tuple[List[str], Dict[str, str]] = ([], {})
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        # writes seen while a build loads its items, replayed on the new index
+        self._pending: Optional[List[Tuple[str, Optional[str]]]] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def keys(self) -> List[str]:
+        return self._view[0]
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        return self._view[1]
+
+    def build(self, load: Callable[[], Iterable[Tuple[str, str]]]) -> None:
+        # upserts and removals arriving while load() runs are replayed on the
+        # new index before it is published, so none is lost in between
+        with self._build_lock:
+            with self._lock:
+                self._pending = []
+            try:
+                labels = dict(load())
+                entries = {item_id: self._key(item_id, label) for item_id, label in labels.items()}
+                keys = sorted(entries.values())
+            except BaseException:
+                with self._lock:
+                    self._pending = None
+                raise
+            with self._lock:
+                pending, self._pending = self._pending or [], None
+                self.entries = entries
+                for item_id, label in pending:
+                    self._discard(keys, labels, item_id)
+                    if label is not None:
+                        self._insert(keys, labels, item_id, label)
+                self._view = (keys, labels)
+                self.is_built = True
+
+    def upsert(self, item_id: str, label: str) -> None:
+        # before the first build there is nothing to update: the build loads it
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((item_id, label))
+            if self.is_built:
+                keys, labels = list(self.keys), dict(self.labels)
+                self._discard(keys, labels, item_id)
+                self._insert(keys, labels, item_id, label)
+                self._view = (keys, labels)
+
+    def remove(self, item_id: str) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((item_id, None))
+            if item_id in self.entries:
+                keys, labels = list(self.keys), dict(self.labels)
+                self._discard(keys, labels, item_id)
+                self._view = (keys, labels)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        keys, labels = self._view
+        normalized = normalize(prefix)
+        position = bisect_left(keys, normalized)
+        found = []
+        for key in keys[position:position + limit]:
+            if not key.startswith(normalized):
+                break
+            item_id = key[key.rindex(_SEPARATOR) + 1:]
+            label = labels.get(item_id)
+            if label is not None:
+                found.append((item_id, label))
+        return found
+
+    def _insert(self, keys: List[str], labels: Dict[str, str], item_id: str, label: str) -> None:
+        key = self._key(item_id, label)
+        insort(keys, key)
+        self.entries[item_id] = key
+        labels[item_id] = label
+
+    def _discard(self, keys: List[str], labels: Dict[str, str], item_id: str) -> None:
+        key = self.entries.pop(item_id, None)
+        if key is None:
+            return
+        del keys[bisect_left(keys, key)]
+        del labels[item_id]
+
+    @staticmethod
+    def _key(item_id: str, label: str) -> str:
+        return f'{normalize(label)}{_SEPARATOR}{item_id}'
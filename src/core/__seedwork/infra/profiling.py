@@ -0,0 +1,195 @@
+from collections import Counter
+from contextlib import contextmanager
+import cProfile
+import datetime
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+from types import FrameType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# threads currently serving a request (see serving())
+ACTIVE_THREADS: Set[int] = set()
+
+# the directory holding the core package; allocation sites are paths under it
+SOURCE_ROOT = Path(__file__).resolve().parents[3]
+
+
+def qualname(frame: FrameType) -> str:
+    # code objects only carry co_qualname from Python 3.11; before that
+    # methods are named after the class of their first argument
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', None)
+    if name is not None:
+        return name
+    if code.co_argcount and code.co_varnames[0] in ('self', 'cls'):
+        owner = frame.f_locals.get(code.co_varnames[0])
+        if owner is not None:
+            owner = owner if isinstance(owner, type) else type(owner)
+            return f'{owner.__name__}.{code.co_name}'
+    return code.co_name
+
+
+def collapse(frame: Optional[FrameType]) -> str:
+    # one line of the collapsed stack format read by flamegraph tools:
+    # root first, frames joined by ';'
+    names: List[str] = []
+    while frame is not None:
+        names.append(f'{frame.f_globals.get("__name__", "?")}:{qualname(frame)}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def format_collapsed(stacks: Dict[str, int]) -> str:
+    return ''.join(f'{stack} {count}\n' for stack, count in sorted(stacks.items()))
+
+
+class StackSampler:
+    # samples the stacks of some threads every interval seconds from a
+    # thread of its own; cheap enough to run while serving
+
+    def __init__(self, interval: float, thread_ids: Callable[[], Iterable[int]]) -> None:
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        stacks = [collapse(frames[ident]) for ident in self.thread_ids() if ident in frames]
+        with self._lock:
+            self.stacks.update(stacks)
+
+    def drain(self) -> Counter:
+        # the stacks sampled since the previous drain
+        with self._lock:
+            stacks, self.stacks = self.stacks, Counter()
+        return stacks
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+class RotatingStackSampler(StackSampler):
+    # always-on variant: every rotate_seconds the stacks sampled so far are
+    # written to <directory>/<prefix>-<time>.collapsed, keeping the newest
+    # keep files
+
+    def __init__(
+        self, interval: float, thread_ids: Callable[[], Iterable[int]], directory: Path,
+        rotate_seconds: float = 60, keep: int = 60, prefix: Optional[str] = None
+    ) -> None:
+        super().__init__(interval, thread_ids)
+        self.directory = directory
+        self.rotate_seconds = rotate_seconds
+        self.keep = keep
+        self.prefix = prefix or f'stacks-{os.getpid()}'
+
+    def rotate(self) -> Optional[Path]:
+        stacks = self.drain()
+        if not stacks:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.datetime.now().strftime('%Y%m%dT%H%M%S%f')
+        path = self.directory / f'{self.prefix}-{stamp}.collapsed'
+        path.write_text(format_collapsed(stacks), encoding='utf-8')
+        for old in sorted(self.directory.glob(f'{self.prefix}-*.collapsed'))[:-self.keep]:
+            old.unlink(missing_ok=True)
+        return path
+
+    def _run(self) -> None:
+        rotate_at = time.monotonic() + self.rotate_seconds
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= rotate_at:
+                self.rotate()
+                rotate_at = time.monotonic() + self.rotate_seconds
+        self.rotate()
+
+
+@contextmanager
+def serving() -> Iterator[None]:
+    # marks the calling thread as one RotatingStackSampler should sample
+    ident = threading.get_ident()
+    ACTIVE_THREADS.add(ident)
+    try:
+        yield
+    finally:
+        ACTIVE_THREADS.discard(ident)
+
+
+def active_threads() -> Iterable[int]:
+    return tuple(ACTIVE_THREADS)
+
+
+class Profile:
+    # deterministic profile (cProfile) and sampled stacks of one call;
+    # the stacks are filled in when profiling() ends
+
+    def __init__(self, profiler: cProfile.Profile) -> None:
+        self.profiler = profiler
+        self.stacks: Counter = Counter()
+
+    def save(self, directory: Path, name: str) -> List[Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+        pstats_path = directory / f'{name}.pstats'
+        collapsed_path = directory / f'{name}.collapsed'
+        self.profiler.dump_stats(pstats_path)
+        collapsed_path.write_text(format_collapsed(self.stacks), encoding='utf-8')
+        return [pstats_path, collapsed_path]
+
+
+@contextmanager
+def profiling(interval: float = 0.001) -> Iterator[Profile]:
+    # profiles the block on the calling thread
+    ident = threading.get_ident()
+    sampler = StackSampler(interval, lambda: (ident,))
+    profile = Profile(cProfile.Profile())
+    sampler.start()
+    profile.profiler.enable()
+    try:
+        yield profile
+    finally:
+        profile.profiler.disable()
+        sampler.stop()
+        profile.stacks = sampler.drain()
+
+
+def allocation_sites(
+    snapshot: tracemalloc.Snapshot, top: int = 10, root: Path = SOURCE_ROOT
+) -> List[Tuple[str, int, int]]:
+    # (module, bytes, blocks) of the live allocations grouped by the
+    # innermost frame in our own code (e.g. core/category/infra/django_app/
+    # mappers.py, even when Django made the allocation), or by the
+    # innermost file for allocations our code did not lead to
+    prefix = f'{root}{os.sep}'
+    sites: Dict[str, List[int]] = {}
+    for trace in snapshot.traces:
+        frames = trace.traceback
+        filename = frames[-1].filename
+        for frame in reversed(frames):
+            if frame.filename.startswith(prefix):
+                filename = frame.filename[len(prefix):]
+                break
+        totals = sites.setdefault(filename, [0, 0])
+        totals[0] += trace.size
+        totals[1] += 1
+    ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+    return [(filename, size, count) for filename, (size, count) in ranked[:top]]
@@ -0,0 +1,150 @@
+import glob
+import json
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+# Each record is "<length><crc32>" followed by a JSON payload. A crash can
+# leave a torn record at the end of a segment: replay stops reading that
+# segment at the first record that is short or fails its checksum.
+_RECORD_HEADER = struct.Struct('<II')
+_SEGMENT_PATTERN = 'wal.*.log'
+
+
+class WriteAheadLog:
+    # Appends go to the current segment's buffer. With wait_for_sync, wait()
+    # fsyncs up to the writer's record: writers arriving while an fsync runs
+    # queue on the sync lock and the next fsync covers all of them (group
+    # commit). Without it, a flusher thread fsyncs every "sync_interval"
+    # seconds and up to that much of acknowledged writes can be lost.
+
+    def __init__(
+        self, directory: str, sync_interval: float = 0.005, wait_for_sync: bool = True
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.sync_interval = sync_interval
+        self.wait_for_sync = wait_for_sync
+        self._condition = threading.Condition()
+        self._sync_lock = threading.Lock()
+        self._appended = 0
+        self._synced = 0
+        self._closed = False
+        self._replayable = self.segments()
+        next_number = self._number(self._replayable[-1]) + 1 if self._replayable else 1
+        self._file = self._open_segment(next_number)
+        self._flusher = threading.Thread(target=self._flush_loop, name='wal-flusher', daemon=True)
+        self._flusher.start()
+
+    def segments(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, _SEGMENT_PATTERN)), key=self._number)
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        # records of the segments that existed when the log was opened
+        for path in self._replayable:
+            with open(path, 'rb') as file:
+                data = file.read()
+            offset = 0
+            while offset + _RECORD_HEADER.size <= len(data):
+                length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+                payload = data[offset + _RECORD_HEADER.size:offset + _RECORD_HEADER.size + length]
+                if len(payload) != length or zlib.crc32(payload) != checksum:
+                    break
+                yield json.loads(payload)
+                offset += _RECORD_HEADER.size + length
+
+    def append(self, record: Dict[str, Any]) -> int:
+        payload = json.dumps(record, separators=(',', ':')).encode()
+        with self._condition:
+            if self._closed:
+                raise ValueError('Write-ahead log is closed')
+            self._file.write(_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+            self._file.write(payload)
+            self._appended += 1
+            sequence = self._appended
+        if self.sync_interval <= 0:
+            self.sync(sequence)
+        return sequence
+
+    def wait(self, sequence: int) -> None:
+        if not self.wait_for_sync:
+            return
+        with self._condition:
+            if self._synced >= sequence or self._closed:
+                return
+        self.sync(sequence)
+
+    def sync(self, sequence: Optional[int] = None) -> None:
+        # fsync runs outside the append lock: writers keep appending to the
+        # next batch meanwhile
+        with self._sync_lock:
+            with self._condition:
+                if self._closed or self._synced >= (sequence or self._appended):
+                    return
+                self._file.flush()
+                target = self._appended
+            os.fsync(self._file.fileno())
+            with self._condition:
+                self._synced = max(self._synced, target)
+                self._condition.notify_all()
+
+    def rotate(self) -> List[str]:
+        # starts a new segment and returns the previous ones, which can be
+        # removed once their records are part of a snapshot
+        with self._sync_lock, self._condition:
+            self._close_segment()
+            self._file = self._open_segment(self._number(self._file.name) + 1)
+            self._replayable = []
+            return [path for path in self.segments() if path != self._file.name]
+
+    def remove(self, segments: List[str]) -> None:
+        for path in segments:
+            os.remove(path)
+        self._fsync_directory()
+
+    def close(self) -> None:
+        with self._sync_lock, self._condition:
+            if self._closed:
+                return
+            self._close_segment()
+            self._closed = True
+            self._condition.notify_all()
+        self._flusher.join()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait(self.sync_interval if self.sync_interval > 0 else None)
+                if self._closed:
+                    return
+                pending = self._synced < self._appended
+            if pending:
+                self.sync()
+
+    def _close_segment(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._synced = self._appended
+        self._condition.notify_all()
+
+    def _open_segment(self, number: int):
+        file = open(  # pylint: disable=consider-using-with
+            os.path.join(self.directory, f'wal.{number:08d}.log'), 'ab'
+        )
+        self._fsync_directory()
+        return file
+
+    def _fsync_directory(self) -> None:
+        if hasattr(os, 'O_DIRECTORY'):
+            descriptor = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+
+    @staticmethod
+    def _number(path: Optional[str]) -> int:
+        return int(os.path.basename(path).split('.')[1])  # type: ignore
@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from model_bakery import baker
+import pytest
+
+from core.__seedwork.infra import metrics
+from core.__seedwork.infra.django_app.middleware import AllocationTrackingMiddleware
+from core.category.infra.django_app.models import CategoryModel
+
+
+@pytest.mark.django_db
+class TestAllocationTrackingMiddlewareInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        overrides = override_settings(ALLOCATION_TRACKING_ENABLED=True)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        metrics.REGISTRY.reset()
+        self.addCleanup(metrics.REGISTRY.reset)
+        self.client = Client()
+
+    def test_logs_and_records_allocations(self):
+        baker.make(CategoryModel, _quantity=50)
+        with self.assertLogs('core.__seedwork.infra.django_app.middleware', 'INFO') as logs:
+            response = self.client.get('/categories/?per_page=50')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['items']), 50)
+
+        self.assertIn('while serving GET /categories/?per_page=50 the process allocated',
+                      logs.output[0])
+        self.assertIn('(0 concurrent requests included)', logs.output[0])
+        self.assertIn('core/category/', logs.output[0])
+        body = metrics.REGISTRY.render()
+        labels = '{method="GET",route="categories/",concurrent="false"}'
+        self.assertIn(f'http_request_process_peak_allocated_bytes_count{labels} 1', body)
+        self.assertIn(f'http_request_process_allocated_bytes_count{labels} 1', body)
+
+    def test_counts_concurrent_requests(self):
+        # the traced request waits for another one to start and finish
+        other_started = threading.Event()
+        other_done = threading.Event()
+
+        def view(request):
+            if request.path == '/traced/':
+                other_started.wait(5)
+                other_done.wait(5)
+            else:
+                other_started.set()
+            return HttpResponse()
+
+        middleware = AllocationTrackingMiddleware(view)
+        factory = RequestFactory()
+        with self.assertLogs('core.__seedwork.infra.django_app.middleware', 'INFO') as logs:
+            traced = threading.Thread(target=middleware, args=(factory.get('/traced/'),))
+            traced.start()
+            deadline = time.monotonic() + 5
+            while not middleware._lock.locked() and time.monotonic() < deadline:  # pylint: disable=protected-access
+                time.sleep(0.001)
+            middleware(factory.get('/other/'))
+            other_done.set()
+            traced.join()
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('while serving GET /traced/', logs.output[0])
+        self.assertIn('(1 concurrent requests included)', logs.output[0])
+        self.assertIn(
+            'http_request_process_allocated_bytes_count'
+            '{method="GET",route="unmatched",concurrent="true"} 1',
+            metrics.REGISTRY.render()
+        )
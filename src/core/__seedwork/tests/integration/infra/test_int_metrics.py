@@ -0,0 +1,61 @@
+import unittest
+
+from django.test import Client, override_settings
+import pytest
+
+from core.__seedwork.infra import metrics
+from core.__seedwork.infra.django_app.apps import install_collectors
+
+
+@pytest.mark.django_db
+class TestMetricsEndpointInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.enable(METRICS_ENABLED=True)
+        metrics.REGISTRY.reset()
+        self.addCleanup(metrics.REGISTRY.reset)
+        self.client = Client()
+
+    def enable(self, **options):
+        # the collectors are picked when the app is ready
+        self.addCleanup(install_collectors)
+        overrides = override_settings(**options)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        install_collectors()
+
+    def test_exposes_request_use_case_repository_and_db_metrics(self):
+        response = self.client.post(
+            '/categories/', {'name': 'Movie'}, content_type='application/json'
+        )
+        category_id = response.json()['id']
+        self.client.get(f'/categories/{category_id}/')
+        self.client.get('/categories/autocomplete/?prefix=mo')
+        self.client.get('/categories/autocomplete/?prefix=mo')
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        body = response.content.decode()
+
+        self.assertIn('http_requests_total{method="POST",route="categories/",status="201"} 1', body)
+        self.assertIn(
+            'http_request_duration_seconds_count{method="GET",route="categories/<uuid:id>/"} 1', body
+        )
+        self.assertIn('use_case_duration_seconds_count{use_case="CreateCategoryUseCase.execute"} 1', body)
+        self.assertIn('repository_duration_seconds_count{method="CategoryDjangoRepository.insert"} 1', body)
+        self.assertIn('db_queries_total{database="default"}', body)
+        self.assertIn('cache_hit_ratio{cache="category_name_index"}', body)
+
+    def test_not_found_when_disabled(self):
+        self.enable(METRICS_ENABLED=False)
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+    def test_requires_the_token_when_set(self):
+        self.enable(METRICS_TOKEN='secret')
+        for headers in ({}, {'HTTP_AUTHORIZATION': 'Bearer wrong'}, {'HTTP_AUTHORIZATION': 'secret'}):
+            response = self.client.get('/metrics', **headers)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
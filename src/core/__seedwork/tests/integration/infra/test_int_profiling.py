@@ -0,0 +1,40 @@
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+
+from django.test import Client, override_settings
+import pytest
+
+
+@pytest.mark.django_db
+class TestProfilingMiddlewareInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        overrides = override_settings(
+            PROFILING_ENABLED=True, PROFILING_TOKEN='secret', PROFILING_DIR=self.directory
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.client = Client()
+
+    def test_profiles_requests_with_the_token(self):
+        response = self.client.get('/categories/', HTTP_X_PROFILE='secret')
+        self.assertEqual(response.status_code, 200)
+        profile_id = response['X-Profile-Id']
+        self.assertIn('-GET-categories-', profile_id)
+
+        stats = pstats.Stats(str(self.directory / f'{profile_id}.pstats'))
+        functions = {name for _, _, name in stats.stats}
+        self.assertTrue({'get', 'execute', 'search'} <= functions)
+        self.assertTrue((self.directory / f'{profile_id}.collapsed').exists())
+
+    def test_ignores_requests_without_the_token(self):
+        for headers in ({}, {'HTTP_X_PROFILE': 'wrong'}, {'HTTP_X_PROFILE': 'sécret'}):
+            response = self.client.get('/categories/', **headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.has_header('X-Profile-Id'))
+        self.assertEqual(list(self.directory.iterdir()), [])
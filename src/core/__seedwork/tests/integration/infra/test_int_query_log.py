@@ -0,0 +1,49 @@
+import unittest
+
+from django.test import Client, override_settings
+import pytest
+from model_bakery import baker
+
+from core.__seedwork.infra.django_app.queries import count_queries
+from core.category.infra.django_app.mappers import CategoryModelMapper
+from core.category.infra.django_app.models import CategoryModel
+from core.category.infra.django_app.repositories import CategoryDjangoRepository
+
+
+@pytest.mark.django_db
+class TestQueryLogMiddlewareInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        overrides = override_settings(QUERY_LOG_ENABLED=True)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.client = Client()
+        self.logger = 'core.__seedwork.infra.django_app.middleware'
+
+    def test_quiet_under_the_limits(self):
+        with self.assertNoLogs(self.logger):
+            self.client.get('/categories/')
+
+    def test_logs_requests_over_the_query_limit(self):
+        overrides = override_settings(QUERY_LOG_MAX_QUERIES=1)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        baker.make(CategoryModel)
+        with self.assertLogs(self.logger, 'WARNING') as logs:
+            self.client.get('/categories/')
+        self.assertIn('GET /categories/ ran 2 queries', logs.output[0])
+        self.assertIn('CategoryDjangoQueryRepository.search: SELECT COUNT(*)', logs.output[0])
+
+
+@pytest.mark.django_db
+class TestQueryCounterCaptureInt(unittest.TestCase):
+
+    def test_captures_queries_with_the_repository_method(self):
+        model = baker.make(CategoryModel)
+        with count_queries(capture=True) as queries:
+            CategoryDjangoRepository().update(CategoryModelMapper.to_entity(model))
+        self.assertEqual(queries.count, 2)
+        self.assertEqual(
+            [query.caller for query in queries.queries],
+            ['core.category.infra.django_app.repositories.CategoryDjangoRepository.update'] * 2
+        )
@@ -0,0 +1,42 @@
+import unittest
+import uuid
+
+from django.test import Client
+import pytest
+
+from core.__seedwork.infra.django_app.middleware import PRIMARY_COOKIE
+
+
+@pytest.mark.django_db
+class TestReadYourWritesMiddlewareInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = Client()
+
+    def test_writes_set_the_cookie(self):
+        response = self.client.post(
+            '/categories/', {'name': 'Movie'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+        category_id = response.json()['id']
+        for response in (
+            Client().put(f'/categories/{category_id}/', {'name': 'Series'},
+                         content_type='application/json'),
+            Client().delete(f'/categories/{category_id}/'),
+        ):
+            self.assertIn(response.status_code, (200, 204))
+            self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+    def test_writes_to_a_missing_category_do_not_set_the_cookie(self):
+        # the existence check runs on the primary, but nothing was written
+        client = Client(raise_request_exception=False)
+        category_id = uuid.uuid4()
+        for response in (
+            client.put(f'/categories/{category_id}/', {'name': 'Series'},
+                       content_type='application/json'),
+            client.delete(f'/categories/{category_id}/'),
+        ):
+            self.assertGreaterEqual(response.status_code, 400)
+            self.assertNotIn(PRIMARY_COOKIE, response.cookies)
@@ -0,0 +1,49 @@
+import re
+import unittest
+
+from django.test import Client, override_settings
+import pytest
+
+from core.__seedwork.infra.django_app.apps import install_collectors
+
+
+@pytest.mark.django_db
+class TestServerTimingInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # the collectors are picked when the app is ready
+        self.addCleanup(install_collectors)
+        overrides = override_settings(SERVER_TIMING_ENABLED=True)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        install_collectors()
+        self.client = Client()
+
+    def metrics(self, response):
+        return dict(re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing']))
+
+    def test_header_on_create(self):
+        response = self.client.post(
+            '/categories/', {'name': 'Movie'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+        timings = self.metrics(response)
+        self.assertEqual(list(timings), ['validate', 'use_case', 'render', 'db', 'total'])
+        self.assertGreater(float(timings['db']), 0)
+        self.assertGreaterEqual(
+            float(timings['total']), float(timings['use_case']) + float(timings['validate'])
+        )
+
+    def test_header_on_validation_error(self):
+        response = self.client.post('/categories/', {}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('validate', self.metrics(response))
+        self.assertNotIn('use_case', self.metrics(response))
+
+    def test_no_header_when_disabled(self):
+        overrides = override_settings(SERVER_TIMING_ENABLED=False)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        response = Client().get('/categories/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Server-Timing'))
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import override_settings
+import pytest
+
+
+@pytest.mark.django_db
+class TestSqlitePragmasInt(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.connection = DatabaseWrapper({
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(directory.name, 'db.sqlite3'),
+            'OPTIONS': {},
+            'TIME_ZONE': None,
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': False,
+            'AUTOCOMMIT': True,
+        })
+        self.addCleanup(self.connection.close)
+
+    def _pragma(self, name: str):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_on_connection_created(self):
+        with override_settings(SQLITE_PRAGMAS={
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 1234,
+        }):
+            self.assertEqual(self._pragma('journal_mode'), 'wal')
+            self.assertEqual(self._pragma('synchronous'), 1)
+            self.assertEqual(self._pragma('busy_timeout'), 1234)
+
+    def test_no_pragmas_by_default(self):
+        with override_settings(SQLITE_PRAGMAS={}):
+            self.assertEqual(self._pragma('journal_mode'), 'delete')
+            self.assertEqual(self._pragma('synchronous'), 2)
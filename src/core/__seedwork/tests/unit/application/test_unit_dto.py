@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+import unittest
+
+from core.__seedwork.application.dto import ColumnarItems, PaginationOutput
+
+
+@dataclass(frozen=True, slots=True)
+class StubOutput:
+    id: str  # pylint: disable=invalid-name
+    name: str
+
+
+class TestColumnarItems(unittest.TestCase):
+
+    def test_throw_error_when_columns_do_not_match_schema(self):
+        with self.assertRaises(ValueError) as assert_error:
+            ColumnarItems(StubOutput, [('1',)])
+        self.assertEqual(
+            assert_error.exception.args[0],
+            'Expected 2 columns for StubOutput, got 1'
+        )
+
+    def test_from_objects(self):
+        items = [StubOutput(id='1', name='a'), StubOutput(id='2', name='b')]
+        columnar = ColumnarItems.from_objects(StubOutput, items)
+        self.assertEqual(columnar.names, ('id', 'name'))
+        self.assertEqual(columnar.columns, (('1', '2'), ('a', 'b')))
+
+        columnar = ColumnarItems.from_objects(StubOutput, [])
+        self.assertEqual(len(columnar), 0)
+        self.assertEqual(list(columnar), [])
+
+    def test_sequence_protocol(self):
+        columnar = ColumnarItems(StubOutput, [('1', '2', '3'), ('a', 'b', 'c')])
+        self.assertEqual(len(columnar), 3)
+        self.assertEqual(columnar[1], StubOutput(id='2', name='b'))
+        self.assertEqual(columnar[-1], StubOutput(id='3', name='c'))
+        self.assertEqual(list(columnar[1:]), [
+            StubOutput(id='2', name='b'),
+            StubOutput(id='3', name='c'),
+        ])
+        self.assertEqual(list(columnar), [
+            StubOutput(id='1', name='a'),
+            StubOutput(id='2', name='b'),
+            StubOutput(id='3', name='c'),
+        ])
+
+    def test_equality(self):
+        columnar = ColumnarItems(StubOutput, [('1',), ('a',)])
+        self.assertEqual(columnar, [StubOutput(id='1', name='a')])
+        self.assertEqual([StubOutput(id='1', name='a')], columnar)
+        self.assertEqual(columnar, ColumnarItems(StubOutput, [('1',), ('a',)]))
+        self.assertNotEqual(columnar, [StubOutput(id='1', name='b')])
+        self.assertNotEqual(columnar, [])
+
+    def test_to_dicts(self):
+        columnar = ColumnarItems(StubOutput, [('1', '2'), ('a', 'b')])
+        self.assertEqual(columnar.to_dicts(), [
+            {'id': '1', 'name': 'a'},
+            {'id': '2', 'name': 'b'},
+        ])
+
+
+class TestPaginationOutput(unittest.TestCase):
+
+    def test_to_dict(self):
+        expected = {
+            'items': [{'id': '1', 'name': 'a'}],
+            'total': 1,
+            'current_page': 1,
+            'per_page': 15,
+            'last_page': 1,
+        }
+        output = PaginationOutput(
+            items=[StubOutput(id='1', name='a')],
+            total=1,
+            current_page=1,
+            per_page=15,
+            last_page=1
+        )
+        self.assertEqual(output.to_dict(), expected)
+
+        output = PaginationOutput(
+            items=ColumnarItems(StubOutput, [('1',), ('a',)]),
+            total=1,
+            current_page=1,
+            per_page=15,
+            last_page=1
+        )
+        self.assertEqual(output.to_dict(), expected)
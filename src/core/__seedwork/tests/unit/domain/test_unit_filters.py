@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+import datetime
+from typing import Optional
+import unittest
+
+from core.__seedwork.domain.filters import (
+    And,
+    CompiledFilter,
+    Condition,
+    Field,
+    FilterCompiler,
+    Not,
+    Or,
+    compile_filter
+)
+
+
+@dataclass
+class StubItem:
+    name: str
+    price: float
+    description: Optional[str] = None
+
+
+class TestField(unittest.TestCase):
+
+    def test_conditions(self):
+        price = Field('price')
+        self.assertEqual(price.eq(1), Condition('price', 'eq', 1))
+        self.assertEqual(price.in_([1, 2]), Condition('price', 'in', frozenset([1, 2])))
+        self.assertEqual(
+            Field('name').icontains('ABC'), Condition('name', 'icontains', 'abc')
+        )
+        self.assertEqual(price.range(1, None), And((Condition('price', 'gte', 1),)))
+        self.assertEqual(price.range(), And(()))
+
+    def test_operators(self):
+        first = Field('price').eq(1)
+        second = Field('price').eq(2)
+        self.assertEqual(first & second, And((first, second)))
+        self.assertEqual(first | second, Or((first, second)))
+        self.assertEqual(~first, Not(first))
+
+
+class TestFilterCompiler(unittest.TestCase):
+    items = [
+        StubItem(name='Movie', price=10, description='feature films'),
+        StubItem(name='music', price=5),
+        StubItem(name='Documentary', price=20, description='Music docs'),
+    ]
+
+    def test_compile(self):
+        compiled = compile_filter(Field('price').gte(10))
+        self.assertIsInstance(compiled, CompiledFilter)
+        self.assertTrue(compiled(self.items[0]))
+        self.assertFalse(compiled(self.items[1]))
+
+    def test_apply(self):
+        name = Field('name')
+        description = Field('description')
+        price = Field('price')
+        arrange = [
+            {'expression': price.eq(5), 'expected': [1]},
+            {'expression': price.ne(5), 'expected': [0, 2]},
+            {'expression': price.in_([5, 20]), 'expected': [1, 2]},
+            {'expression': name.contains('Mu'), 'expected': []},
+            {'expression': name.icontains('MU'), 'expected': [1]},
+            {'expression': name.startswith('Mo'), 'expected': [0]},
+            {'expression': price.gt(5), 'expected': [0, 2]},
+            {'expression': price.lt(20), 'expected': [0, 1]},
+            {'expression': price.range(5, 10), 'expected': [0, 1]},
+            {'expression': description.icontains('music'), 'expected': [2]},
+            {
+                'expression': name.icontains('mu') | description.icontains('mu'),
+                'expected': [1, 2]
+            },
+            {'expression': ~price.eq(5) & price.lte(10), 'expected': [0]},
+            {'expression': And(()), 'expected': [0, 1, 2]},
+            {'expression': Or(()), 'expected': []},
+        ]
+        for item in arrange:
+            compiled = compile_filter(item['expression'])
+            expected = [self.items[index] for index in item['expected']]
+            self.assertEqual(compiled.apply(self.items), expected, item)
+            self.assertEqual(
+                [entity for entity in self.items if compiled(entity)], expected, item
+            )
+
+    def test_reuses_code_for_same_shape(self):
+        compiler = FilterCompiler()
+        cheap = compiler.compile(Field('price').lte(5) & Field('name').icontains('m'))
+        expensive = compiler.compile(Field('price').lte(20) & Field('name').icontains('d'))
+        self.assertEqual(len(compiler), 1)
+        self.assertIs(cheap.predicate.__code__, expensive.predicate.__code__)
+        self.assertEqual(cheap.apply(self.items), [self.items[1]])
+        self.assertEqual(expensive.apply(self.items), [self.items[2]])
+
+        compiler.compile(Field('price').lte(5) | Field('name').icontains('m'))
+        self.assertEqual(len(compiler), 2)
+
+    def test_works_with_datetimes(self):
+        @dataclass
+        class Dated:
+            created_at: Optional[datetime.datetime]
+
+        now = datetime.datetime.now()
+        items = [Dated(now), Dated(None), Dated(now - datetime.timedelta(days=1))]
+        compiled = compile_filter(Field('created_at').range(now - datetime.timedelta(hours=1)))
+        self.assertEqual(compiled.apply(items), [items[0]])
+
+    def test_invalid_expressions(self):
+        with self.assertRaises(ValueError) as assert_error:
+            compile_filter(Condition('price', 'like', 1))
+        self.assertEqual(assert_error.exception.args[0], "Unknown filter operator 'like'")
+
+        with self.assertRaises(ValueError) as assert_error:
+            compile_filter(Condition('price or True', 'eq', 1))
+        self.assertEqual(
+            assert_error.exception.args[0], "Invalid filter field 'price or True'"
+        )
+
+        with self.assertRaises(TypeError):
+            compile_filter('price = 1')  # type: ignore
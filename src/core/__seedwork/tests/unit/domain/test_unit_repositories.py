@@ -2,12 +2,16 @@
 
 from dataclasses import dataclass
 from typing import List, Optional
+import threading
+import time
 import unittest
 from core.__seedwork.domain.entities import Entity
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Field
 
 from core.__seedwork.domain.repositories import (
     ET,
+    CopyOnWriteInMemoryRepository,
     Filter,
     InMemoryRepository,
     InMemorySearchableRepository,
@@ -41,6 +45,10 @@ class StubInMemoryRepository(InMemoryRepository[StubEntity]):
     pass
 
 
+class StubCopyOnWriteInMemoryRepository(CopyOnWriteInMemoryRepository[StubEntity]):
+    pass
+
+
 class TestInMemoryRepository(unittest.TestCase):
     repo: StubInMemoryRepository
 
@@ -133,6 +141,67 @@ class TestInMemoryRepository(unittest.TestCase):
         self.assertListEqual(self.repo.items, [])
 
 
+class TestCopyOnWriteInMemoryRepository(TestInMemoryRepository):
+    repo: StubCopyOnWriteInMemoryRepository  # type: ignore
+
+    def setUp(self) -> None:
+        self.repo = StubCopyOnWriteInMemoryRepository()
+
+    def test_writes_publish_a_new_list(self):
+        entity = StubEntity(name='test', price=10.0)
+        self.repo.insert(entity)
+        snapshot = self.repo.items
+
+        self.repo.update(StubEntity(unique_entity_id=entity.unique_entity_id,
+                                    name='changed', price=1.0))
+        self.repo.insert(StubEntity(name='other', price=2.0))
+
+        self.assertEqual(snapshot, [entity])
+        self.assertEqual(len(self.repo.items), 2)
+        self.assertEqual(self.repo.items[0].name, 'changed')
+
+    def test_concurrent_writes_and_reads(self):
+        writers, per_writer = 8, 50
+        entities = [[StubEntity(name=f'{writer}-{index}', price=index)
+                     for index in range(per_writer)] for writer in range(writers)]
+        errors = []
+        done = threading.Event()
+
+        def write(batch: List[StubEntity]):
+            try:
+                for entity in batch:
+                    self.repo.insert(entity)
+                for entity in batch[::2]:
+                    self.repo.update(StubEntity(unique_entity_id=entity.unique_entity_id,
+                                                name=entity.name, price=-1))
+                for entity in batch[1::2]:
+                    self.repo.delete(entity.id)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        def read():
+            while not done.is_set():
+                items = self.repo.items
+                if len({item.id for item in items}) != len(items):
+                    errors.append(AssertionError('duplicated items'))
+                time.sleep(0.001)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        threads = [threading.Thread(target=write, args=(batch,)) for batch in entities]
+        for thread in readers + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        expected = {entity.id for batch in entities for entity in batch[::2]}
+        self.assertEqual({item.id for item in self.repo.items}, expected)
+        self.assertTrue(all(item.price == -1 for item in self.repo.items))
+
+
 class TestSearchableRepository(unittest.TestCase):
     def test_throw_error_when_methods_not_implemented(self):
         with self.assertRaises(TypeError) as assert_error:
@@ -384,6 +453,20 @@ class TestInMemorySearchableRepository(unittest.TestCase):
         result = self.repo._apply_filter(items, 'TEST')
         self.assertListEqual([items[0], items[1]], result)
 
+    def test_search_with_filter_expression(self):
+        items = [
+            StubEntity(name='test', price=5),
+            StubEntity(name='TEST', price=10),
+            StubEntity(name='fake', price=10),
+        ]
+        self.repo.items = items
+        expression = Field('name').icontains('test') & Field('price').gte(10)
+
+        result = self.repo.search(SearchParams(filter=expression))
+        self.assertEqual(result.items, [items[1]])
+        self.assertEqual(result.total, 1)
+        self.assertIs(result.filter, expression)
+
     def test_apply_sort(self):
         items = [
             StubEntity(name='b', price=1),
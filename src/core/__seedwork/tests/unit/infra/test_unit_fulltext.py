@@ -0,0 +1,66 @@
+import unittest
+
+from core.__seedwork.infra.fulltext import InvertedIndex, tokenize
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_tokenize(self):
+        arrange = [
+            {'text': None, 'expected': []},
+            {'text': '', 'expected': []},
+            {'text': 'Movie', 'expected': ['movie']},
+            {'text': 'Ação e Ficção', 'expected': ['acao', 'e', 'ficcao']},
+            {'text': 'sci-fi, drama!', 'expected': ['sci', 'fi', 'drama']},
+        ]
+        for item in arrange:
+            self.assertEqual(tokenize(item['text']), item['expected'], item)
+
+
+class TestInvertedIndex(unittest.TestCase):
+    index: InvertedIndex
+
+    def setUp(self) -> None:
+        self.index = InvertedIndex()
+        self.index.add('1', ('Movie', 'feature films'))
+        self.index.add('2', ('Documentary', 'non fiction films'))
+        self.index.add('3', ('Short movie', None))
+
+    def test_add(self):
+        self.assertEqual(len(self.index), 3)
+        self.assertIn('1', self.index)
+        self.assertEqual(self.index.postings['films'], {'1': 1, '2': 1})
+        self.assertEqual(self.index.total_length, 9)
+
+    def test_add_replaces_document(self):
+        self.index.add('1', ('Series', None))
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.postings['films'], {'2': 1})
+        self.assertNotIn('feature', self.index.postings)
+        self.assertEqual(self.index.total_length, 7)
+
+    def test_remove(self):
+        self.index.remove('2')
+        self.index.remove('not-indexed')
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn('documentary', self.index.postings)
+        self.assertEqual(self.index.postings['films'], {'1': 1})
+
+    def test_copy(self):
+        copy = self.index.copy()
+        copy.remove('1')
+        copy.add('4', ['movie films'])
+        self.assertEqual(set(self.index.search('films')), {'1', '2'})
+        self.assertEqual(set(copy.search('films')), {'2', '4'})
+        self.assertEqual(len(self.index), 3)
+
+    def test_search(self):
+        self.assertEqual(self.index.search(''), {})
+        self.assertEqual(self.index.search('unknown'), {})
+        self.assertEqual(set(self.index.search('FILMS')), {'1', '2'})
+        self.assertEqual(set(self.index.search('movie')), {'1', '3'})
+        self.assertEqual(set(self.index.search('movie films')), {'1'})
+
+    def test_search_ranks_shorter_documents_first(self):
+        scores = self.index.search('movie')
+        self.assertGreater(scores['3'], scores['1'])
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+import unittest
+
+from core.__seedwork.application.use_cases import UseCase
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.infra import instrumentation
+from core.__seedwork.infra.instrumentation import (
+    LAYER_REPOSITORY,
+    LAYER_USE_CASE,
+    CompositeCollector,
+    NullCollector,
+    StatsCollector,
+    instrumented,
+    timed,
+)
+from core.category.domain.entities import Category
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+@dataclass(slots=True, frozen=True)
+class StubUseCase(UseCase):
+    value: int
+
+    def execute(self, input_param: int) -> int:
+        if input_param < 0:
+            raise ValueError('negative')
+        return input_param + self.value
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.collector = StatsCollector()
+        previous = instrumentation.set_collector(self.collector)
+        self.addCleanup(instrumentation.set_collector, previous)
+
+    def test_null_collector_by_default(self):
+        instrumentation.set_collector(None)
+        self.assertIsInstance(instrumentation.get_collector(), NullCollector)
+        self.assertEqual(timed('layer', 'name')(lambda: 42)(), 42)
+
+    def test_timed_records_calls_and_errors(self):
+        @timed('layer', 'double')
+        def double(value):
+            if value is None:
+                raise TypeError()
+            return value * 2
+
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(value=3), 6)
+        with self.assertRaises(TypeError):
+            double(None)
+
+        stats = self.collector.stats[('layer', 'double')]
+        self.assertEqual(stats.count, 3)
+        self.assertGreater(stats.total, 0)
+        self.assertGreaterEqual(stats.total, stats.max)
+        self.assertEqual(stats.errors, {'TypeError': 1})
+        self.assertEqual(double.__name__, 'double')
+
+    def test_instrumented_use_case(self):
+        use_case_class = instrumented(StubUseCase)
+        use_case = use_case_class(value=1)
+
+        self.assertIsInstance(use_case, StubUseCase)
+        self.assertEqual(use_case_class.__name__, 'StubUseCase')
+        self.assertIs(instrumented(StubUseCase), use_case_class)
+        self.assertEqual(use_case.execute(1), 2)
+        with self.assertRaises(ValueError):
+            use_case.execute(-1)
+
+        stats = self.collector.stats[(LAYER_USE_CASE, 'StubUseCase.execute')]
+        self.assertEqual((stats.count, stats.errors), (2, {'ValueError': 1}))
+
+    def test_instrumented_repository(self):
+        repo = instrumented(CategoryInMemoryRepository)()
+        category = Category(name='Movie')
+        repo.insert(category)
+        repo.find_by_id(category.id)
+        repo.search(repo.SearchParams())
+        with self.assertRaises(NotFoundException):
+            repo.delete('fake id')
+
+        self.assertEqual(
+            {name: stats.count for (layer, name), stats in self.collector.stats.items()
+             if layer == LAYER_REPOSITORY},
+            {
+                'CategoryInMemoryRepository.insert': 1,
+                'CategoryInMemoryRepository.find_by_id': 1,
+                'CategoryInMemoryRepository.search': 1,
+                'CategoryInMemoryRepository.delete': 1,
+            }
+        )
+        self.assertEqual(
+            self.collector.stats[(LAYER_REPOSITORY, 'CategoryInMemoryRepository.delete')].errors,
+            {'NotFoundException': 1}
+        )
+
+    def test_classes_outside_the_layers_are_not_wrapped(self):
+        self.assertIs(instrumented(dict), dict)
+
+    def test_composite_collector(self):
+        other = StatsCollector()
+        instrumentation.set_collector(CompositeCollector(self.collector, other))
+        timed('layer', 'name')(lambda: None)()
+
+        self.assertEqual(self.collector.stats[('layer', 'name')].count, 1)
+        self.assertEqual(other.stats[('layer', 'name')].count, 1)
+        self.collector.reset()
+        self.assertEqual(self.collector.stats, {})
@@ -0,0 +1,95 @@
+import threading
+import unittest
+
+from core.__seedwork.infra.instrumentation import LAYER_REPOSITORY, LAYER_USE_CASE
+from core.__seedwork.infra import metrics
+from core.__seedwork.infra.metrics import Registry
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.registry = Registry()
+        self.requests = self.registry.counter('requests_total', 'Requests.', ('route',))
+        self.latency = self.registry.histogram(
+            'latency_seconds', 'Latency.', ('route',), buckets=(0.1, 1.0)
+        )
+
+    def test_render(self):
+        self.requests.inc('/a')
+        self.requests.inc('/a', value=2)
+        self.requests.inc('/b"\n')
+        self.latency.observe(0.05, '/a')
+        self.latency.observe(0.1, '/a')
+        self.latency.observe(0.5, '/a')
+        self.latency.observe(3, '/a')
+
+        self.assertEqual(self.registry.render().splitlines(), [
+            '# HELP requests_total Requests.',
+            '# TYPE requests_total counter',
+            'requests_total{route="/a"} 3',
+            'requests_total{route="/b\\"\\n"} 1',
+            '# HELP latency_seconds Latency.',
+            '# TYPE latency_seconds histogram',
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1"} 3',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+            'latency_seconds_sum{route="/a"} 3.65',
+            'latency_seconds_count{route="/a"} 4',
+        ])
+
+    def test_registering_twice_returns_the_same_metric(self):
+        self.assertIs(self.registry.counter('requests_total', 'Other.', ('route',)), self.requests)
+
+    def test_aggregates_threads_and_keeps_finished_ones(self):
+        def work():
+            for _ in range(1000):
+                self.requests.inc('/a')
+                self.latency.observe(0.5, '/a')
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.requests.inc('/a')
+
+        samples = self.registry.collect()
+        self.assertEqual(samples.counters[('requests_total', ('/a',))], 4001)
+        self.assertEqual(samples.histograms[('latency_seconds', ('/a',))], [0, 4000, 0, 2000.0])
+        # finished threads were folded into one shard
+        self.assertEqual(len(self.registry._shards), 1)  # pylint: disable=protected-access
+        self.assertEqual(self.registry.collect().counters[('requests_total', ('/a',))], 4001)
+
+    def test_reset(self):
+        self.requests.inc('/a')
+        self.registry.reset()
+        self.assertEqual(self.registry.collect().counters, {})
+
+
+class TestMetricsCollector(unittest.TestCase):
+
+    def setUp(self) -> None:
+        metrics.REGISTRY.reset()
+        self.addCleanup(metrics.REGISTRY.reset)
+
+    def test_records_layers_errors_and_caches(self):
+        collector = metrics.MetricsCollector()
+        collector.record(LAYER_USE_CASE, 'CreateCategoryUseCase.execute', 0.002, None)
+        collector.record(LAYER_REPOSITORY, 'Repo.find_by_id', 0.001, KeyError())
+        collector.cache('index', hits=3, misses=1)
+        collector.cache('cold', hits=0, misses=2)
+
+        samples = metrics.REGISTRY.collect()
+        self.assertEqual(
+            samples.histograms[('use_case_duration_seconds', ('CreateCategoryUseCase.execute',))][-1],
+            0.002
+        )
+        self.assertIn(('repository_duration_seconds', ('Repo.find_by_id',)), samples.histograms)
+        self.assertEqual(
+            samples.counters[('instrumented_errors_total', (LAYER_REPOSITORY, 'Repo.find_by_id', 'KeyError'))], 1
+        )
+        self.assertEqual(metrics.cache_hit_ratios()[2:], [
+            'cache_hit_ratio{cache="index"} 0.75',
+            'cache_hit_ratio{cache="cold"} 0',
+        ])
@@ -0,0 +1,92 @@
+import unittest
+
+from core.__seedwork.infra.prefix_index import PrefixIndex
+
+
+class TestPrefixIndex(unittest.TestCase):
+    index: PrefixIndex
+
+    def setUp(self) -> None:
+        self.index = PrefixIndex()
+        self.index.build(lambda: [
+            ('1', 'Movie'),
+            ('2', 'Music'),
+            ('3', 'Ação'),
+            ('4', 'movies'),
+        ])
+
+    def test_build(self):
+        self.assertTrue(self.index.is_built)
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.keys, sorted(self.index.keys))
+
+    def test_complete(self):
+        self.assertEqual(self.index.complete('mov'), [
+            ('1', 'Movie'),
+            ('4', 'movies'),
+        ])
+        self.assertEqual(self.index.complete('M', limit=2), [
+            ('1', 'Movie'),
+            ('4', 'movies'),
+        ])
+        self.assertEqual(self.index.complete('acao'), [('3', 'Ação')])
+        self.assertEqual(self.index.complete('xyz'), [])
+        self.assertEqual(len(self.index.complete('', limit=10)), 4)
+
+    def test_upsert(self):
+        self.index.upsert('5', 'Documentary')
+        self.assertEqual(self.index.complete('doc'), [('5', 'Documentary')])
+
+        self.index.upsert('1', 'Series')
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.complete('mov'), [('4', 'movies')])
+        self.assertEqual(self.index.complete('se'), [('1', 'Series')])
+
+    def test_remove(self):
+        self.index.remove('4')
+        self.index.remove('not-indexed')
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.complete('mov'), [('1', 'Movie')])
+
+    def test_writes_publish_new_keys_and_labels(self):
+        # complete() reads without the lock: a pair it picked up never changes
+        keys, labels = self.index.keys, self.index.labels
+        expected_keys, expected_labels = list(keys), dict(labels)
+        self.index.upsert('5', 'Documentary')
+        self.index.upsert('1', 'Series')
+        self.index.remove('2')
+
+        self.assertEqual(keys, expected_keys)
+        self.assertEqual(labels, expected_labels)
+        self.assertIsNot(self.index.keys, keys)
+        self.assertEqual(self.index.keys, sorted(self.index.keys))
+        self.assertEqual(self.index.complete('s'), [('1', 'Series')])
+
+    def test_writes_during_a_build_are_replayed(self):
+        def load():
+            # written after the items were read
+            self.index.upsert('5', 'Documentary')
+            self.index.upsert('2', 'Series')
+            self.index.remove('1')
+            return [('1', 'Movie'), ('2', 'Music')]
+
+        self.index.build(load)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.complete(''), [('5', 'Documentary'), ('2', 'Series')])
+        self.assertEqual(self.index.keys, sorted(self.index.keys))
+
+    def test_failed_build_keeps_the_index(self):
+        def load():
+            raise RuntimeError('database is down')
+
+        with self.assertRaises(RuntimeError):
+            self.index.build(load)
+        self.assertEqual(len(self.index), 4)
+        self.index.upsert('5', 'Documentary')
+        self.assertEqual(self.index.complete('doc'), [('5', 'Documentary')])
+
+    def test_writes_before_the_first_build_are_left_to_it(self):
+        index = PrefixIndex()
+        index.upsert('1', 'Movie')
+        self.assertFalse(index.is_built)
+        self.assertEqual(len(index), 0)
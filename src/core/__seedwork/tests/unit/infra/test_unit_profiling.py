@@ -0,0 +1,127 @@
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from core.__seedwork.infra.profiling import (
+    RotatingStackSampler,
+    StackSampler,
+    active_threads,
+    allocation_sites,
+    collapse,
+    format_collapsed,
+    profiling,
+    qualname,
+    serving
+)
+
+
+def busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProfilingUnit(unittest.TestCase):
+
+    def test_collapse(self):
+        stack = collapse(sys._getframe())  # pylint: disable=protected-access
+        self.assertTrue(stack.endswith(f'{__name__}:TestProfilingUnit.test_collapse'))
+        self.assertEqual(collapse(None), '')
+
+    def test_qualname(self):
+        frame = sys._getframe()  # pylint: disable=protected-access
+        self.assertEqual(qualname(frame), 'TestProfilingUnit.test_qualname')
+
+    def test_qualname_without_co_qualname(self):
+        # code objects of Python 3.10
+        def frame(varnames, local_vars):
+            code = SimpleNamespace(co_name='update', co_argcount=len(varnames), co_varnames=varnames)
+            return SimpleNamespace(f_code=code, f_locals=local_vars)
+        self.assertEqual(qualname(frame(('self',), {'self': self})), 'TestProfilingUnit.update')
+        self.assertEqual(qualname(frame(('cls',), {'cls': TestProfilingUnit})), 'TestProfilingUnit.update')
+        self.assertEqual(qualname(frame(('entity',), {'entity': self})), 'update')
+        self.assertEqual(qualname(frame((), {})), 'update')
+
+    def test_format_collapsed(self):
+        self.assertEqual(format_collapsed({'b;c': 2, 'a': 1}), 'a 1\nb;c 2\n')
+
+    def test_sampler(self):
+        ident = threading.get_ident()
+        sampler = StackSampler(0.001, lambda: (ident,))
+        sampler.sample()
+        stacks = sampler.drain()
+        self.assertEqual(len(stacks), 1)
+        self.assertIn('TestProfilingUnit.test_sampler', next(iter(stacks)))
+        self.assertEqual(sampler.drain(), {})
+
+    def test_profiling_saves_pstats_and_collapsed_stacks(self):
+        with profiling(0.001) as profile:
+            busy(0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            pstats_path, collapsed_path = profile.save(Path(directory), 'busy')
+            functions = {name for _, _, name in pstats.Stats(str(pstats_path)).stats}
+            self.assertIn('busy', functions)
+            self.assertIn(f'{__name__}:busy', collapsed_path.read_text(encoding='utf-8'))
+
+
+class TestRotatingStackSamplerUnit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_serving(self):
+        with serving():
+            self.assertIn(threading.get_ident(), active_threads())
+        self.assertNotIn(threading.get_ident(), active_threads())
+
+    def test_samples_serving_threads_into_rotated_files(self):
+        sampler = RotatingStackSampler(
+            0.001, active_threads, self.directory, rotate_seconds=0.02, prefix='test'
+        )
+        sampler.start()
+        try:
+            busy(0.02)
+            with serving():
+                busy(0.1)
+        finally:
+            sampler.stop()
+        files = sorted(self.directory.glob('test-*.collapsed'))
+        self.assertGreater(len(files), 1)
+        text = ''.join(path.read_text(encoding='utf-8') for path in files)
+        self.assertIn(f'{__name__}:busy', text)
+        self.assertIn('TestRotatingStackSamplerUnit.test_samples_serving_threads_into_rotated_files', text)
+
+    def test_rotate_keeps_the_newest_files(self):
+        sampler = RotatingStackSampler(0.001, lambda: (threading.get_ident(),), self.directory, keep=2)
+        self.assertIsNone(sampler.rotate())
+        paths = []
+        for _ in range(3):
+            sampler.sample()
+            paths.append(sampler.rotate())
+        self.assertEqual(sorted(self.directory.iterdir()), paths[1:])
+
+
+class TestAllocationSitesUnit(unittest.TestCase):
+
+    def test_groups_live_allocations_by_module(self):
+        tracemalloc.start(10)
+        try:
+            held = [bytearray(1024) for _ in range(100)]
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        sites = allocation_sites(snapshot, top=3)
+        module, size, count = sites[0]
+        self.assertEqual(module, 'core/__seedwork/tests/unit/infra/test_unit_profiling.py')
+        self.assertGreaterEqual(size, 100 * 1024)
+        self.assertGreaterEqual(count, 100)
+        self.assertLessEqual(len(sites), 3)
+        del held
@@ -0,0 +1,20 @@
+import unittest
+
+from core.__seedwork.infra.django_app.queries import Query, QueryCounter
+
+
+class TestQueryCounterUnit(unittest.TestCase):
+
+    def test_repeated(self):
+        counter = QueryCounter(capture=True)
+        counter.queries = [
+            Query('default', 'SELECT 1 WHERE id = %s', 0.001, 'core.x.Repository.find_by_id')
+            for _ in range(5)
+        ] + [Query('default', 'SELECT COUNT(*)', 0.001, 'core.x.Repository.search')]
+        self.assertEqual(counter.repeated(5), [('SELECT 1 WHERE id = %s', 5)])
+        self.assertEqual(counter.repeated(6), [])
+
+    def test_report(self):
+        counter = QueryCounter(capture=True)
+        counter.queries = [Query('default', 'SELECT 1', 0.0015, 'core.x.Repository.search')]
+        self.assertEqual(counter.report(), '     1.500 ms  default  core.x.Repository.search: SELECT 1')
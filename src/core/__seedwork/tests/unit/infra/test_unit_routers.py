@@ -0,0 +1,87 @@
+import time
+import unittest
+
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from core.__seedwork.infra.django_app import routers
+from core.__seedwork.infra.django_app.middleware import (
+    PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+)
+
+
+class TestReadReplicaRouter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        settings = override_settings(DATABASE_REPLICAS=['replica_1', 'replica_2'])
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.router = routers.ReadReplicaRouter()
+
+    def test_reads_go_to_replicas_and_writes_to_primary(self):
+        self.assertIn(self.router.db_for_read(None), ['replica_1', 'replica_2'])
+        self.assertEqual(self.router.db_for_write(None), 'default')
+
+    def test_reads_go_to_primary_without_replicas(self):
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(self.router.db_for_read(None), 'default')
+
+    def test_request_scope(self):
+        with routers.request_scope(primary=True):
+            self.assertEqual(self.router.db_for_read(None), 'default')
+
+        with routers.request_scope() as state:
+            self.assertNotEqual(self.router.db_for_read(None), 'default')
+            self.assertEqual(self.router.db_for_write(None), 'default')
+            self.assertFalse(state['wrote'])
+            routers.record_write()
+            self.assertTrue(state['wrote'])
+            self.assertEqual(self.router.db_for_read(None), 'default')
+        self.assertNotEqual(self.router.db_for_read(None), 'default')
+
+    def test_writes_outside_a_request_do_not_pin_reads(self):
+        routers.record_write()
+        self.assertNotEqual(self.router.db_for_read(None), 'default')
+
+
+class TestReadYourWritesMiddleware(unittest.TestCase):
+
+    def setUp(self) -> None:
+        settings = override_settings(DATABASE_REPLICAS=['replica_1'], READ_YOUR_WRITES_SECONDS=5)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.router = routers.ReadReplicaRouter()
+        self.factory = RequestFactory()
+        self.reads = []
+
+    def _view(self, write: bool):
+        def view(request):  # pylint: disable=unused-argument
+            if write:
+                routers.record_write()
+            self.reads.append(self.router.db_for_read(None))
+            return HttpResponse()
+        return view
+
+    def test_write_sets_cookie(self):
+        response = ReadYourWritesMiddleware(self._view(write=True))(self.factory.post('/'))
+
+        self.assertEqual(self.reads, ['default'])
+        cookie = response.cookies[PRIMARY_COOKIE]
+        self.assertEqual(cookie['max-age'], 5)
+        self.assertGreater(float(cookie.value), time.time())
+
+    def test_read_only_request(self):
+        response = ReadYourWritesMiddleware(self._view(write=False))(self.factory.get('/'))
+
+        self.assertEqual(self.reads, ['replica_1'])
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+
+    def test_client_that_wrote_recently_reads_from_primary(self):
+        middleware = ReadYourWritesMiddleware(self._view(write=False))
+        for value in (str(time.time() + 5), str(time.time() - 1), 'invalid'):
+            request = self.factory.get('/')
+            request.COOKIES[PRIMARY_COOKIE] = value
+            middleware(request)
+
+        self.assertEqual(self.reads, ['default', 'replica_1', 'replica_1'])
@@ -0,0 +1,32 @@
+import unittest
+
+from core.__seedwork.infra.django_app.server_timing import (
+    ServerTimingCollector,
+    header_value,
+    request_timings
+)
+from core.__seedwork.infra.instrumentation import LAYER_HTTP, LAYER_REPOSITORY, LAYER_USE_CASE
+
+
+class TestServerTimingCollectorUnit(unittest.TestCase):
+
+    def test_ignores_records_outside_a_request(self):
+        collector = ServerTimingCollector()
+        collector.record(LAYER_USE_CASE, 'UseCase.execute', 0.1, None)
+        with request_timings() as timings:
+            self.assertEqual(timings, {})
+
+    def test_sums_use_cases_and_validation(self):
+        collector = ServerTimingCollector()
+        with request_timings() as timings:
+            collector.record(LAYER_HTTP, 'validate', 0.001, None)
+            collector.record(LAYER_USE_CASE, 'First.execute', 0.002, None)
+            collector.record(LAYER_USE_CASE, 'Second.execute', 0.003, None)
+            collector.record(LAYER_REPOSITORY, 'Repository.insert', 0.004, None)
+        self.assertEqual(timings, {'validate': 0.001, 'use_case': 0.005})
+
+    def test_header_value(self):
+        self.assertEqual(
+            header_value({'use_case': 0.0012345, 'total': 0.002}),
+            'use_case;dur=1.234, total;dur=2.000'
+        )
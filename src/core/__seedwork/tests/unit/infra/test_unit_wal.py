@@ -0,0 +1,88 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from core.__seedwork.infra.wal import WriteAheadLog
+
+
+class TestWriteAheadLog(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _open(self, **kwargs) -> WriteAheadLog:
+        log = WriteAheadLog(self.directory, **kwargs)
+        self.addCleanup(log.close)
+        return log
+
+    def test_replay_records_of_previous_segments(self):
+        log = self._open()
+        self.assertEqual(list(log.replay()), [])
+        for index in range(3):
+            log.wait(log.append({'index': index}))
+        log.close()
+
+        reopened = self._open()
+        self.assertEqual(list(reopened.replay()), [{'index': 0}, {'index': 1}, {'index': 2}])
+        self.assertEqual(len(reopened.segments()), 2)
+
+    def test_replay_stops_at_torn_record(self):
+        log = self._open(sync_interval=0)
+        log.append({'index': 0})
+        log.append({'index': 1})
+        log.close()
+        path = log.segments()[0]
+        with open(path, 'r+b') as file:
+            file.truncate(os.path.getsize(path) - 3)
+
+        self.assertEqual(list(self._open().replay()), [{'index': 0}])
+
+    def test_replay_stops_at_corrupted_record(self):
+        log = self._open(sync_interval=0)
+        log.append({'index': 0})
+        log.append({'index': 1})
+        log.close()
+        path = log.segments()[0]
+        with open(path, 'r+b') as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b'XX')
+
+        self.assertEqual(list(self._open().replay()), [{'index': 0}])
+
+    def test_rotate_and_remove(self):
+        log = self._open()
+        log.append({'index': 0})
+        rotated = log.rotate()
+        log.append({'index': 1})
+
+        self.assertEqual(len(rotated), 1)
+        self.assertEqual(list(log.replay()), [])
+        log.remove(rotated)
+        log.close()
+
+        self.assertEqual(list(self._open().replay()), [{'index': 1}])
+
+    def test_group_commit(self):
+        log = self._open(sync_interval=0.05)
+
+        def write(index):
+            log.wait(log.append({'index': index}))
+
+        threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        log.close()
+
+        records = list(self._open().replay())
+        self.assertEqual(sorted(record['index'] for record in records), list(range(8)))
+
+    def test_append_after_close(self):
+        log = self._open()
+        log.close()
+        with self.assertRaises(ValueError):
+            log.append({'index': 0})
@@ -2,9 +2,10 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, TypeVar
+from typing import Iterable, Optional, TypeVar
 
 
+from core.__seedwork.application.dto import ColumnarItems
 from core.category.domain.entities import Category
 
 
@@ -40,3 +41,6 @@ class CategoryOutputMapper:
             is_active=category.is_active,  # type: ignore
             created_at=category.created_at  # type: ignore
         )
+
+    def to_columnar(self, categories: Iterable[Category]) -> ColumnarItems[CategoryOutput]:
+        return ColumnarItems.from_objects(CategoryOutput, categories)
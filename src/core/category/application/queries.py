@@ -0,0 +1,30 @@
+from abc import ABC
+import abc
+from typing import List, Tuple
+
+from core.category.domain.repositories import CategoryRepository
+
+
+class CategoryQueryRepository(ABC):
+    # read side: items are already CategoryOutput, no Category is built
+
+    sortable_fields: List[str] = []
+
+    SearchParams = CategoryRepository.SearchParams
+    SearchResult = CategoryRepository.SearchResult
+
+    @abc.abstractmethod
+    def search(self, input_params: SearchParams) -> SearchResult:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_all_names(self) -> List[Tuple[str, str]]:
+        raise NotImplementedError()
+
+
+class CategoryNameIndex(ABC):
+    # prefix lookups over category names for type-ahead: (id, name) pairs
+
+    @abc.abstractmethod
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        raise NotImplementedError()
@@ -1,13 +1,17 @@
 # pylint: disable=no-member
 
 from dataclasses import dataclass, asdict
-from typing import Optional
+from typing import List, Optional, Sequence
 from core.__seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
 from core.__seedwork.application.use_cases import UseCase
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
+from core.category.application.queries import CategoryNameIndex, CategoryQueryRepository
 
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.repositories import CategoryFilter, CategoryRepository
+
+
+_output_mapper = CategoryOutputMapper.without_child()
 
 
 @dataclass(slots=True, frozen=True)
@@ -24,7 +28,7 @@ class CreateCategoryUseCase(UseCase):
         return self.__to_output(category)
 
     def __to_output(self, category: Category) -> 'Output':
-        return CategoryOutputMapper.without_child().to_output(category)
+        return _output_mapper.to_output(category)
 
     @dataclass(slots=True, frozen=True)
     class Input:
@@ -50,7 +54,7 @@ class GetCategoryUseCase(UseCase):
         return self.__to_output(category)
 
     def __to_output(self, category: Category) -> 'Output':
-        return CategoryOutputMapper.without_child().to_output(category)  # type: ignore
+        return _output_mapper.to_output(category)  # type: ignore
 
     @dataclass(slots=True, frozen=True)
     class Input:
@@ -64,25 +68,31 @@ class GetCategoryUseCase(UseCase):
 @dataclass(slots=True, frozen=True)
 class ListCategoriesUseCase(UseCase):
     category_repo: CategoryRepository
+    category_query_repo: Optional[CategoryQueryRepository] = None
 
     def execute(self, input_param: 'Input') -> 'Output':
+        if self.category_query_repo:
+            search_params = self.category_query_repo.SearchParams(
+                **asdict(input_param)
+            )
+            result = self.category_query_repo.search(search_params)
+            return self.__to_output(result.items, result)  # type: ignore
+
         search_params = self.category_repo.SearchParams(
             **asdict(input_param)
         )
         result = self.category_repo.search(search_params)
-        return self.__to_output(result)  # type: ignore
+        items = _output_mapper.to_columnar(result.items)
+        return self.__to_output(items, result)  # type: ignore
 
-    def __to_output(self, result: CategoryRepository.SearchResult):
-        items = list(
-            map(CategoryOutputMapper.without_child().to_output, result.items)
-        )
+    def __to_output(self, items: Sequence[CategoryOutput], result: CategoryRepository.SearchResult):
         return PaginationOutputMapper\
             .from_child(ListCategoriesUseCase.Output)\
             .to_output(items, result)
 
     @dataclass(slots=True, frozen=True)
-    class Input(SearchInput[str]):
-        pass
+    class Input(SearchInput[str | CategoryFilter]):
+        search_mode: Optional[str] = None
 
     @dataclass(slots=True, frozen=True)
     class Output(PaginationOutput[CategoryOutput]):
@@ -106,7 +116,7 @@ class UpdateCategoryUseCase(UseCase):
         return self.__to_output(category)
 
     def __to_output(self, category: Category) -> 'Output':
-        return CategoryOutputMapper.without_child().to_output(category)
+        return _output_mapper.to_output(category)
 
     @dataclass(slots=True, frozen=True)
     class Input:
@@ -132,3 +142,29 @@ class DeleteCategoryUseCase(UseCase):
     @dataclass(slots=True, frozen=True)
     class Input:
         id: str  # pylint: disable=invalid-name
+
+
+@dataclass(slots=True, frozen=True)
+class AutocompleteCategoriesUseCase(UseCase):
+    name_index: CategoryNameIndex
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        items = self.name_index.complete(input_param.prefix, input_param.limit)
+        return AutocompleteCategoriesUseCase.Output(
+            items=[AutocompleteCategoriesUseCase.Item(
+                id=item_id, name=name) for item_id, name in items]
+        )
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        prefix: str
+        limit: int = 10
+
+    @dataclass(slots=True, frozen=True)
+    class Item:
+        id: str  # pylint: disable=invalid-name
+        name: str
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        items: List['AutocompleteCategoriesUseCase.Item']
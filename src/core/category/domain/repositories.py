@@ -1,6 +1,9 @@
 
 
 from abc import ABC
+from dataclasses import dataclass, fields
+import datetime
+from typing import Optional, Tuple
 from core.__seedwork.domain.repositories import (
     SearchParams as DefaultSearchParams,
     SearchResult as DefaultSearchResult,
@@ -9,8 +12,52 @@ from core.__seedwork.domain.repositories import (
 from core.category.domain.entities import Category
 
 
+SEARCH_MODE_FULLTEXT = 'fulltext'
+SORT_RELEVANCE = 'relevance'
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryFilter:
+    name: Optional[str] = None
+    name_prefix: Optional[str] = None
+    is_active: Optional[bool] = None
+    created_at_from: Optional[datetime.datetime] = None
+    created_at_to: Optional[datetime.datetime] = None
+    ids: Optional[Tuple[str, ...]] = None
+
+    def __post_init__(self):
+        if self.ids is not None:
+            object.__setattr__(self, 'ids', tuple(str(_id) for _id in self.ids))
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, _field.name) is None for _field in fields(self))
+
+
+@dataclass(slots=True, kw_only=True)
 class _SearchParams(DefaultSearchParams):  # pylint: disable=too-few-public-methods
-    pass
+    search_mode: Optional[str] = None
+
+    def __post_init__(self):
+        DefaultSearchParams.__post_init__(self)
+        self._normalize_search_mode()
+
+    def _normalize_filter(self):
+        if isinstance(self.filter, dict):
+            self.filter = CategoryFilter(**self.filter)
+        if isinstance(self.filter, CategoryFilter):
+            self.filter = None if self.filter.is_empty() else self.filter
+            return
+        DefaultSearchParams._normalize_filter(self)
+
+    def _normalize_search_mode(self):
+        search_mode = str(self.search_mode).lower()
+        self.search_mode = search_mode if search_mode in [SEARCH_MODE_FULLTEXT] else None
+
+    @property
+    def is_fulltext(self) -> bool:
+        return self.search_mode == SEARCH_MODE_FULLTEXT \
+            and isinstance(self.filter, str) \
+            and bool(self.filter)
 
 
 class _SearchResult(DefaultSearchResult):  # pylint: disable=too-few-public-methods
@@ -1,31 +1,19 @@
+from importlib import import_module
+from typing import Any
 
-from typing import Dict
-from rest_framework import serializers
-from core.__seedwork.domain.validators import DRFValidator, StrictBooleanField, StrictCharField
+# the DRF-backed rules load with the first validation, not with the entity
+_DRF_VALIDATORS = ('CategoryRules', 'CategoryValidator')
 
 
-class CategoryRules(serializers.Serializer):  # pylint: disable=abstract-method
-    name = StrictCharField(max_length=255)
-    description = StrictCharField(
-        required=False,
-        allow_null=True,
-        allow_blank=True
-    )
-    is_active = StrictBooleanField(required=False)
-    created_at = serializers.DateTimeField(required=False)
-
-
-class CategoryValidator(DRFValidator):  # pylint: disable=too-few-public-methods
-
-    def validate(self, data: Dict) -> bool:
-        rules = CategoryRules(
-            data=data if data is not None else {}  # type: ignore
-        )
-        return super().validate(rules)
+def __getattr__(name: str) -> Any:
+    if name in _DRF_VALIDATORS:
+        return getattr(import_module('core.category.domain.drf_validators'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class CategoryValidatorFactory:  # pylint: disable=too-few-public-methods
 
     @staticmethod
     def create():
+        from core.category.domain.drf_validators import CategoryValidator  # pylint: disable=import-outside-toplevel
         return CategoryValidator()
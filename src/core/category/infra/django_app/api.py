@@ -1,17 +1,25 @@
 
 from dataclasses import asdict, dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 
+from core.__seedwork.infra.instrumentation import LAYER_HTTP, span
 from core.__seedwork.infra.serializers import UUIDSerializer
 from core.category.application.dto import CategoryOutput
-from core.category.infra.serializers import CategorySerializer
+from core.category.domain.repositories import SEARCH_MODE_FULLTEXT, CategoryFilter
+from core.category.infra.serializers import (
+    CategoryAutocompleteSerializer,
+    CategoryFilterSerializer,
+    CategorySerializer
+)
 from core.category.application.use_cases import (
+    AutocompleteCategoriesUseCase,
     CreateCategoryUseCase,
     GetCategoryUseCase,
     ListCategoriesUseCase,
@@ -29,8 +37,9 @@ class CategoryResource(APIView):
     delete_use_case: Callable[[], DeleteCategoryUseCase]
 
     def post(self, request: Request):
-        serializer = CategorySerializer(data=request.data)  # type: ignore
-        serializer.is_valid(raise_exception=True)
+        with span(LAYER_HTTP, 'validate'):
+            serializer = CategorySerializer(data=request.data)  # type: ignore
+            serializer.is_valid(raise_exception=True)
 
         input_param = CreateCategoryUseCase.Input(
             **serializer.validated_data)  # type: ignore
@@ -43,24 +52,27 @@ class CategoryResource(APIView):
         if id:
             return self.get_object(id)
 
-        input_param = ListCategoriesUseCase.Input(
-            **request.query_params.dict()  # type: ignore
-        )
+        with span(LAYER_HTTP, 'validate'):
+            input_param = ListCategoriesUseCase.Input(
+                **CategoryResource.parse_list_params(request.query_params.dict())  # type: ignore
+            )
 
         output = self.list_use_case().execute(input_param)
-        return Response(asdict(output))
+        return Response(output.to_dict())
 
     def get_object(self, id: str):   # pylint: disable=redefined-builtin, invalid-name
-        CategoryResource.validate_id(id)
+        with span(LAYER_HTTP, 'validate'):
+            CategoryResource.validate_id(id)
         input_param = GetCategoryUseCase.Input(id)
         output = self.get_use_case().execute(input_param)
         body = CategoryResource.category_to_response(output)
         return Response(body)
 
     def put(self, request: Request, id: str):  # pylint: disable=redefined-builtin, invalid-name
-        CategoryResource.validate_id(id)
-        serializer = CategorySerializer(data=request.data)  # type: ignore
-        serializer.is_valid(raise_exception=True)
+        with span(LAYER_HTTP, 'validate'):
+            CategoryResource.validate_id(id)
+            serializer = CategorySerializer(data=request.data)  # type: ignore
+            serializer.is_valid(raise_exception=True)
 
         input_param = UpdateCategoryUseCase.Input(
             **{'id': id, **serializer.validated_data}  # type: ignore
@@ -70,7 +82,8 @@ class CategoryResource(APIView):
         return Response(body)
 
     def delete(self, _request: Request, id: str):  # pylint: disable=redefined-builtin, invalid-name
-        CategoryResource.validate_id(id)
+        with span(LAYER_HTTP, 'validate'):
+            CategoryResource.validate_id(id)
         input_param = DeleteCategoryUseCase.Input(id=id)
         self.delete_use_case().execute(input_param)
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -80,7 +93,45 @@ class CategoryResource(APIView):
         serializer = CategorySerializer(instance=output)
         return serializer.data
 
+    @staticmethod
+    def parse_list_params(params: Dict[str, str]) -> Dict[str, Any]:
+        filter_params = {
+            key: params.pop(key) for key in list(params) if key in CategoryFilterSerializer().fields
+        }
+        if not filter_params:
+            return params
+        if str(params.get('search_mode')).lower() == SEARCH_MODE_FULLTEXT:
+            # fulltext only searches the "filter" text, it would ignore them
+            raise ValidationError({'search_mode': [
+                f'Fulltext search cannot be combined with {", ".join(sorted(filter_params))}.'
+            ]})
+        serializer = CategoryFilterSerializer(data=filter_params)
+        serializer.is_valid(raise_exception=True)
+        return {
+            **params,
+            'filter': CategoryFilter(
+                name=params.get('filter') or None,
+                **serializer.validated_data  # type: ignore
+            )
+        }
+
     @staticmethod
     def validate_id(id: str):  # pylint: disable=invalid-name,redefined-builtin
         serializer = UUIDSerializer(data={'id': id})  # type: ignore
         serializer.is_valid(raise_exception=True)
+
+
+@dataclass(slots=True)
+class CategoryAutocompleteResource(APIView):
+    autocomplete_use_case: Callable[[], AutocompleteCategoriesUseCase]
+
+    def get(self, request: Request):
+        with span(LAYER_HTTP, 'validate'):
+            serializer = CategoryAutocompleteSerializer(
+                data=request.query_params)  # type: ignore
+            serializer.is_valid(raise_exception=True)
+
+        input_param = AutocompleteCategoriesUseCase.Input(
+            **serializer.validated_data)  # type: ignore
+        output = self.autocomplete_use_case().execute(input_param)
+        return Response(asdict(output))
@@ -6,3 +6,13 @@ class CategoryConfig(AppConfig):
     name = 'core.category.infra.django_app'
     label = 'category'
     verbose_name = 'Categorias'
+
+    def ready(self):
+        from . import autocomplete  # pylint: disable=import-outside-toplevel
+        autocomplete.connect(_category_name_index)
+
+
+def _category_name_index():
+    # resolved on the first write, so startup does not build the container
+    from django_app import container  # pylint: disable=import-outside-toplevel
+    return container.category_name_index()
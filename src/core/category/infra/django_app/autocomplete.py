@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+from core.__seedwork.infra.instrumentation import record_cache
+from core.__seedwork.infra.prefix_index import PrefixIndex
+from core.category.application.queries import CategoryNameIndex, CategoryQueryRepository
+
+
+class CategoryPrefixNameIndex(CategoryNameIndex):
+    # process-local PrefixIndex over CategoryQueryRepository.find_all_names.
+    # Writes made in this process reach it through the ORM signals (see
+    # connect()); writes made by other processes are picked up by rebuilding
+    # it once it is older than max_age seconds. Stale lookups are served
+    # while a rebuild runs.
+
+    def __init__(
+        self,
+        category_query_repo: CategoryQueryRepository,
+        max_age: Optional[float] = None,
+        index: Optional[PrefixIndex] = None
+    ) -> None:
+        self.category_query_repo = category_query_repo
+        self.max_age = settings.CATEGORY_NAME_INDEX_MAX_AGE if max_age is None else max_age
+        self.index = index if index is not None else PrefixIndex()
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        self._refresh()
+        return self.index.complete(prefix, limit)
+
+    def upsert(self, item_id: str, label: str) -> None:
+        self.index.upsert(item_id, label)
+
+    def remove(self, item_id: str) -> None:
+        self.index.remove(item_id)
+
+    def _refresh(self) -> None:
+        built_at = self._built_at
+        fresh = built_at is not None and time.monotonic() - built_at < self.max_age
+        record_cache('category_name_index', hits=int(fresh), misses=int(not fresh))
+        if fresh:
+            return
+        if built_at is None:
+            # nothing to serve yet: wait for whichever thread builds it
+            with self._lock:
+                if self._built_at is None:
+                    self._build()
+        elif self._lock.acquire(blocking=False):
+            try:
+                self._build()
+            finally:
+                self._lock.release()
+
+    def _build(self) -> None:
+        started = time.monotonic()
+        self.index.build(self.category_query_repo.find_all_names)
+        self._built_at = started
+
+
+def connect(name_index: Callable[[], CategoryPrefixNameIndex]) -> None:
+    # keeps the process-local index in step with writes made through the ORM;
+    # bulk_create and QuerySet.update bypass signals and are only picked up
+    # by the next rebuild
+    from .models import CategoryModel  # pylint: disable=import-outside-toplevel
+
+    def on_save(instance: CategoryModel, **_kwargs):
+        name_index().upsert(str(instance.id), instance.name)
+
+    def on_delete(instance: CategoryModel, **_kwargs):
+        name_index().remove(str(instance.id))
+
+    post_save.connect(
+        on_save, sender=CategoryModel, weak=False, dispatch_uid='category_name_index_save'
+    )
+    post_delete.connect(
+        on_delete, sender=CategoryModel, weak=False, dispatch_uid='category_name_index_delete'
+    )
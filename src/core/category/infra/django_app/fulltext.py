@@ -0,0 +1,46 @@
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from core.__seedwork.infra.fulltext import tokenize
+
+# created by migration 0003_category_fulltext: an FTS5 index over
+# categories(name, description) whose rowids map to category ids through
+# KEYS_TABLE
+FTS_TABLE = 'categories_fts'
+KEYS_TABLE = 'categories_fts_keys'
+
+
+def is_supported(connection: BaseDatabaseWrapper) -> bool:
+    return connection.vendor == 'sqlite'
+
+
+def to_match_query(text: str) -> str:
+    return ' '.join(f'"{term}"' for term in tokenize(text))
+
+
+def apply(query: QuerySet, text: str, connection: BaseDatabaseWrapper) -> QuerySet:
+    terms = tokenize(text)
+    if not terms:
+        return query.none().alias(relevance=RawSQL('0', ()))
+
+    if not is_supported(connection):
+        for term in terms:
+            query = query.filter(Q(name__icontains=term) | Q(description__icontains=term))
+        return query.alias(relevance=RawSQL('0', ()))
+
+    match = to_match_query(text)
+    table = query.model._meta.db_table  # pylint: disable=protected-access
+    # the matching ids are one uncorrelated subquery; bm25() is lower for
+    # better matches, negate it so higher is more relevant
+    return query.filter(pk__in=RawSQL(
+        f'SELECT {KEYS_TABLE}.category_id FROM {FTS_TABLE} '
+        f'JOIN {KEYS_TABLE} ON {KEYS_TABLE}.rowid = {FTS_TABLE}.rowid '
+        f'WHERE {FTS_TABLE} MATCH %s',
+        (match,)
+    )).alias(relevance=RawSQL(
+        f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = '
+        f'(SELECT rowid FROM {KEYS_TABLE} WHERE category_id = {table}.id)',
+        (match,)
+    ))
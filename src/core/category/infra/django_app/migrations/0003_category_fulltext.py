@@ -0,0 +1,89 @@
+from django.db import migrations
+
+
+class RunSQLiteSQL(migrations.RunSQL):
+    # FTS5 only exists on SQLite, other databases search with icontains
+    # (see core.category.infra.django_app.fulltext)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'sqlite':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'sqlite':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+# External-content FTS5 index over categories(name, description). Its rowids
+# come from categories_fts_keys, whose INTEGER PRIMARY KEY survives VACUUM
+# (the implicit rowid of "categories", keyed by a UUID, does not); the view
+# gives FTS5 the content by those keys. Triggers keep the index in sync.
+FULLTEXT_SQL = [
+    """
+    CREATE TABLE categories_fts_keys (
+        rowid INTEGER PRIMARY KEY,
+        category_id TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIEW categories_fts_content AS
+    SELECT keys.rowid AS rowid, categories.name AS name, categories.description AS description
+    FROM categories_fts_keys AS keys JOIN categories ON categories.id = keys.category_id
+    """,
+    """
+    CREATE VIRTUAL TABLE categories_fts USING fts5(
+        name, description,
+        content='categories_fts_content',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER categories_fts_ai AFTER INSERT ON categories BEGIN
+        INSERT INTO categories_fts_keys(category_id) VALUES (new.id);
+        INSERT INTO categories_fts(rowid, name, description)
+        VALUES (last_insert_rowid(), new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER categories_fts_ad AFTER DELETE ON categories BEGIN
+        INSERT INTO categories_fts(categories_fts, rowid, name, description)
+        SELECT 'delete', rowid, old.name, old.description
+        FROM categories_fts_keys WHERE category_id = old.id;
+        DELETE FROM categories_fts_keys WHERE category_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER categories_fts_au AFTER UPDATE ON categories BEGIN
+        INSERT INTO categories_fts(categories_fts, rowid, name, description)
+        SELECT 'delete', rowid, old.name, old.description
+        FROM categories_fts_keys WHERE category_id = old.id;
+        UPDATE categories_fts_keys SET category_id = new.id WHERE category_id = old.id;
+        INSERT INTO categories_fts(rowid, name, description)
+        SELECT rowid, new.name, new.description
+        FROM categories_fts_keys WHERE category_id = new.id;
+    END
+    """,
+    "INSERT INTO categories_fts_keys(category_id) SELECT id FROM categories",
+    "INSERT INTO categories_fts(categories_fts) VALUES ('rebuild')",
+]
+
+FULLTEXT_REVERSE_SQL = [
+    "DROP TRIGGER categories_fts_au",
+    "DROP TRIGGER categories_fts_ad",
+    "DROP TRIGGER categories_fts_ai",
+    "DROP TABLE categories_fts",
+    "DROP VIEW categories_fts_content",
+    "DROP TABLE categories_fts_keys",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0002_category_indexes'),
+    ]
+
+    operations = [
+        RunSQLiteSQL(FULLTEXT_SQL, FULLTEXT_REVERSE_SQL),
+    ]
@@ -12,3 +12,9 @@ class CategoryModel(models.Model):
 
     class Meta:
         db_table = "categories"
+        indexes = [
+            models.Index(fields=['name'], name='categories_name_idx'),
+            models.Index(
+                fields=['is_active', 'created_at'], name='categories_active_created_idx'
+            ),
+        ]
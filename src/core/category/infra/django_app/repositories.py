@@ -1,12 +1,20 @@
 # pylint: disable=no-member
 
-from typing import List, TYPE_CHECKING, Type
+from typing import List, TYPE_CHECKING, Tuple, Type
 from django.core.paginator import Paginator
 from django.core import exceptions as django_exceptions
+from django.db import connections, router
+from django.db.models import Q, QuerySet
+from core.__seedwork.application.dto import ColumnarItems
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Expression
+from core.__seedwork.infra.django_app.filters import expression_to_q
 from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.application.dto import CategoryOutput
+from core.category.application.queries import CategoryQueryRepository
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.repositories import SORT_RELEVANCE, CategoryFilter, CategoryRepository
+from core.category.infra.django_app import fulltext
 from core.category.infra.django_app.mappers import CategoryModelMapper
 
 
@@ -14,6 +22,51 @@ if TYPE_CHECKING:
     from core.category.infra.django_app.models import CategoryModel
 
 
+def _category_filter_to_q(category_filter: CategoryFilter) -> Q:
+    condition = Q()
+    if category_filter.name is not None:
+        condition &= Q(name__icontains=category_filter.name)
+    if category_filter.name_prefix is not None:
+        # a range instead of LIKE 'x%' so SQLite can use categories_name_idx
+        condition &= Q(
+            name__gte=category_filter.name_prefix,
+            name__lt=f'{category_filter.name_prefix}\U0010ffff'
+        )
+    if category_filter.is_active is not None:
+        condition &= Q(is_active=category_filter.is_active)
+    if category_filter.created_at_from is not None:
+        condition &= Q(created_at__gte=category_filter.created_at_from)
+    if category_filter.created_at_to is not None:
+        condition &= Q(created_at__lte=category_filter.created_at_to)
+    if category_filter.ids is not None:
+        condition &= Q(pk__in=category_filter.ids)
+    return condition
+
+
+def _apply_search_params(
+    query: QuerySet,
+    input_params: CategoryRepository.SearchParams,
+    sortable_fields: List[str]
+) -> QuerySet:
+    if input_params.is_fulltext:
+        query = fulltext.apply(
+            query, input_params.filter, connections[query.db])  # type: ignore
+        if not input_params.sort or input_params.sort == SORT_RELEVANCE:
+            return query.order_by('-relevance', '-created_at')
+    elif isinstance(input_params.filter, CategoryFilter):
+        query = query.filter(_category_filter_to_q(input_params.filter))
+    elif isinstance(input_params.filter, Expression):
+        query = query.filter(expression_to_q(input_params.filter))
+    elif input_params.filter:
+        query = query.filter(name__icontains=input_params.filter)
+
+    if input_params.sort and input_params.sort in sortable_fields:
+        return query.order_by(
+            input_params.sort if input_params.sort_dir == "asc" else f"-{input_params.sort}"
+        )
+    return query.order_by("-created_at")
+
+
 class CategoryDjangoRepository(CategoryRepository):
 
     sortable_fields: List[str] = ['name', 'created_at']
@@ -36,27 +89,19 @@ class CategoryDjangoRepository(CategoryRepository):
         return [CategoryModelMapper.to_entity(model) for model in self.model.objects.all()]
 
     def update(self, entity: Category) -> None:
-        self._get(entity.id)
+        self._get(entity.id, primary=True)
         model = CategoryModelMapper.to_model(entity)
         model.save()
 
     def delete(self, entity_id: str | UniqueEntityId) -> None:
         id_str = str(entity_id)
-        model = self._get(id_str)
+        model = self._get(id_str, primary=True)
         model.delete()
 
     def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
-        query = self.model.objects.all()
-
-        if input_params.filter:
-            query = query.filter(name__icontains=input_params.filter)
-
-        if input_params.sort and input_params.sort in self.sortable_fields:
-            query = query.order_by(
-                input_params.sort if input_params.sort_dir == "asc" else f"-{input_params.sort}"
-            )
-        else:
-            query = query.order_by("-created_at")
+        query = _apply_search_params(
+            self.model.objects.all(), input_params, self.sortable_fields
+        )
 
         paginator = Paginator(query, input_params.per_page)  # type: ignore
         page_obj = paginator.page(input_params.page)  # type: ignore
@@ -72,10 +117,51 @@ class CategoryDjangoRepository(CategoryRepository):
             filter=input_params.filter
         )
 
-    def _get(self, entity_id: str) -> 'CategoryModel':
+    def _get(self, entity_id: str, primary: bool = False) -> 'CategoryModel':
+        # writes check existence on the primary: a lagging read replica
+        # would miss rows inserted a moment ago
+        objects = self.model.objects
+        if primary:
+            objects = objects.db_manager(router.db_for_write(self.model))
         try:
-            return self.model.objects.get(pk=entity_id)
+            return objects.get(pk=entity_id)
         except (self.model.DoesNotExist, django_exceptions.ValidationError) as exception:
             raise NotFoundException(
                 f"Entity not found using ID '{entity_id}'"
             ) from exception
+
+
+class CategoryDjangoQueryRepository(CategoryQueryRepository):
+
+    sortable_fields: List[str] = CategoryDjangoRepository.sortable_fields
+    columns = ('id', 'name', 'description', 'is_active', 'created_at')
+    model: Type['CategoryModel']
+
+    def __init__(self) -> None:
+        from core.category.infra.django_app.models import CategoryModel # pylint: disable=import-outside-toplevel
+        self.model = CategoryModel
+
+    def find_all_names(self) -> List[Tuple[str, str]]:
+        return [
+            (str(category_id), name)
+            for category_id, name in self.model.objects.values_list('id', 'name').iterator()
+        ]
+
+    def search(self, input_params: CategoryQueryRepository.SearchParams) -> CategoryQueryRepository.SearchResult:
+        query = _apply_search_params(
+            self.model.objects.values_list(*self.columns), input_params, self.sortable_fields
+        )
+
+        paginator = Paginator(query, input_params.per_page)  # type: ignore
+        page_obj = paginator.page(input_params.page)  # type: ignore
+        columns = list(zip(*page_obj.object_list)) or [() for _ in self.columns]
+        columns[0] = tuple(map(str, columns[0]))
+        return CategoryQueryRepository.SearchResult(
+            items=ColumnarItems(CategoryOutput, columns),  # type: ignore
+            total=paginator.count,
+            current_page=input_params.page,  # type: ignore
+            per_page=input_params.per_page,  # type: ignore
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
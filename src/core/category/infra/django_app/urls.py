@@ -1,7 +1,7 @@
 
 from django.urls import path
 from django_app import container
-from .api import CategoryResource
+from .api import CategoryAutocompleteResource, CategoryResource
 
 
 def __init_category_resource():
@@ -15,6 +15,9 @@ def __init_category_resource():
 
 
 urlpatterns = [
+    path('categories/autocomplete/', CategoryAutocompleteResource.as_view(
+        autocomplete_use_case=container.use_case_category_autocomplete_category
+    )),
     path('categories/', CategoryResource.as_view(
         **__init_category_resource()
     )),
@@ -0,0 +1,434 @@
+import datetime
+from itertools import compress
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Expression, compile_filter
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.__seedwork.infra.fulltext import InvertedIndex
+from core.category.domain.entities import Category
+from core.category.domain.repositories import SORT_RELEVANCE, CategoryFilter, CategoryRepository
+from core.category.infra.in_memory.timestamps import from_micros, to_micros
+
+
+class CategoryColumnarInMemoryRepository(CategoryRepository):
+    # Categories are kept column-wise: created_at as int64 microseconds,
+    # is_active as bool and names as codes into a dictionary of distinct
+    # names. Filters, sorting and pagination run on the arrays and only the
+    # returned page is turned into Category entities.
+
+    sortable_fields: List[str] = ["name", "created_at"]
+
+    ids: List[str]
+    descriptions: List[Optional[str]]
+    name_codes: np.ndarray
+    created_at: np.ndarray
+    is_active: np.ndarray
+    alive: np.ndarray
+    size: int
+    names: List[str]
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.ids = []
+        self.descriptions = []
+        self.name_codes = np.zeros(capacity, dtype=np.int32)
+        self.created_at = np.zeros(capacity, dtype=np.int64)
+        self.is_active = np.zeros(capacity, dtype=np.bool_)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.size = 0
+        self.names = []
+        # both lookups are rebuilt on demand, so bulk loads skip them
+        self._name_lookup: Optional[Dict[str, int]] = {}
+        self._rows: Optional[Dict[str, int]] = {}
+        self._deleted = 0
+        self._names_array: Optional[np.ndarray] = None
+        self._names_lower: Optional[np.ndarray] = None
+        self._names_rank: Optional[np.ndarray] = None
+        self._fulltext_index: Optional[InvertedIndex] = None
+        # serializes writes, so copy_columns() sees whole rows
+        self._write_lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self.size - self._deleted
+
+    def insert(self, entity: Category) -> None:
+        with self._write_lock:
+            self._reserve(self.size + 1)
+            row = self.size
+            self.size += 1
+            self.ids.append(entity.id)
+            self.descriptions.append(entity.description)
+            self._write_row(row, entity)
+            if self._rows is not None:
+                self._rows[entity.id] = row
+
+    def bulk_load(
+        self,
+        ids: Sequence[str],
+        names: Sequence[str],
+        descriptions: Sequence[Optional[str]],
+        is_active: Sequence[bool],
+        created_at: Sequence[int]
+    ) -> None:
+        # trusted, already validated data: no Category is built
+        with self._write_lock:
+            codes = [self._name_code(name) for name in names]
+            self._append_rows(ids, codes, descriptions, is_active, created_at)
+
+    def bulk_load_encoded(  # pylint: disable=too-many-arguments
+        self,
+        ids: Sequence[str],
+        names: Sequence[str],
+        name_codes: Sequence[int],
+        descriptions: Sequence[Optional[str]],
+        is_active: Sequence[bool],
+        created_at: Sequence[int]
+    ) -> None:
+        # same as bulk_load, with names already dictionary-encoded: "name_codes"
+        # index into "names" (e.g. the columns of a snapshot)
+        with self._write_lock:
+            if not self.names:
+                self.names = list(names)
+                self._reset_names()
+                self._name_lookup = None
+                codes = name_codes
+            else:
+                remap = np.array([self._name_code(name) for name in names], dtype=np.int32)
+                codes = remap[np.asarray(name_codes, dtype=np.int32)] if len(remap) else name_codes
+            self._append_rows(ids, codes, descriptions, is_active, created_at)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return self._materialize(self._get_row(str(entity_id)))
+
+    def find_all(self) -> List[Category]:
+        return [self._materialize(row) for row in np.flatnonzero(self.alive[:self.size])]
+
+    def update(self, entity: Category) -> None:
+        with self._write_lock:
+            row = self._get_row(entity.id)
+            self.descriptions[row] = entity.description
+            self._write_row(row, entity)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        id_str = str(entity_id)
+        with self._write_lock:
+            row = self._get_row(id_str)
+            del self._rows[id_str]  # type: ignore
+            self.alive[row] = False
+            self._deleted += 1
+            if self._fulltext_index is not None:
+                self._fulltext_index.remove(id_str)
+            if self._deleted > 1024 and self._deleted > self.size // 2:
+                self._compact()
+
+    def copy_columns(self) -> Tuple[
+        List[str], List[str], np.ndarray, List[Optional[str]], np.ndarray, np.ndarray
+    ]:
+        # (ids, names, name_codes, descriptions, is_active, created_at) of the
+        # live rows, copied under the write lock so every column has the
+        # same rows even while other threads write
+        with self._write_lock:
+            rows = np.flatnonzero(self.alive[:self.size])
+            row_list = rows.tolist()
+            return (
+                [self.ids[row] for row in row_list],
+                list(self.names),
+                self.name_codes[rows],
+                [self.descriptions[row] for row in row_list],
+                self.is_active[rows],
+                self.created_at[rows],
+            )
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        rows = np.flatnonzero(self.alive[:self.size] & self._filter_mask(input_params))
+        total = len(rows)
+        start = (input_params.page - 1) * input_params.per_page  # type: ignore
+        limit = start + input_params.per_page  # type: ignore
+
+        if input_params.is_fulltext and (
+            not input_params.sort or input_params.sort == SORT_RELEVANCE
+        ):
+            scores = self._get_fulltext_index().search(input_params.filter)  # type: ignore
+            relevance = np.fromiter(
+                (scores[self.ids[row]] for row in rows), dtype=np.float64, count=total
+            )
+            order = np.lexsort((-self.created_at[rows], -relevance))
+            page_rows = rows[order[start:limit]]
+        else:
+            page_rows = self._sorted_page(
+                rows, input_params.sort, input_params.sort_dir, start, limit
+            )
+
+        return CategoryRepository.SearchResult(
+            items=[self._materialize(row) for row in page_rows],
+            total=total,
+            current_page=input_params.page,  # type: ignore
+            per_page=input_params.per_page,  # type: ignore
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def _filter_mask(self, input_params: CategoryRepository.SearchParams) -> np.ndarray | bool:
+        filter_param = input_params.filter
+        if not filter_param:
+            return True
+        if input_params.is_fulltext:
+            return self._rows_mask(
+                self._get_fulltext_index().search(filter_param))  # type: ignore
+        if isinstance(filter_param, CategoryFilter):
+            return self._category_filter_mask(filter_param)
+        if isinstance(filter_param, Expression):
+            return self._expression_mask(filter_param)
+        return self._name_mask(np.char.find(self._get_names_lower(), filter_param.lower()) >= 0)
+
+    def _category_filter_mask(self, category_filter: CategoryFilter) -> np.ndarray | bool:
+        size = self.size
+        mask: np.ndarray | bool = True
+        if category_filter.name is not None:
+            mask = mask & self._name_mask(
+                np.char.find(self._get_names_lower(), category_filter.name.lower()) >= 0
+            )
+        if category_filter.name_prefix is not None:
+            mask = mask & self._name_mask(
+                np.char.startswith(self._get_names_array(), category_filter.name_prefix)
+            )
+        if category_filter.is_active is not None:
+            mask = mask & (self.is_active[:size] == category_filter.is_active)
+        if category_filter.created_at_from is not None:
+            mask = mask & (self.created_at[:size] >= to_micros(category_filter.created_at_from))
+        if category_filter.created_at_to is not None:
+            mask = mask & (self.created_at[:size] <= to_micros(category_filter.created_at_to))
+        if category_filter.ids is not None:
+            mask = mask & self._rows_mask(category_filter.ids)
+        return mask
+
+    def _expression_mask(self, expression: Expression) -> np.ndarray:
+        # the compiled filter reads the attributes it needs off one reused
+        # row view instead of a Category per row
+        size = self.size
+        predicate = compile_filter(expression).predicate
+        view = _RowView(
+            self.ids, self.names, self.name_codes[:size].tolist(), self.descriptions,
+            self.is_active[:size].tolist(), self.created_at[:size].tolist()
+        )
+        mask = np.zeros(size, dtype=np.bool_)
+        mask[[
+            row for row in compress(range(size), self.alive[:size].tolist())
+            if predicate(view.at(row))
+        ]] = True
+        return mask
+
+    def _name_mask(self, names_mask: np.ndarray) -> np.ndarray:
+        if not len(names_mask):  # pylint: disable=use-implicit-booleaness-not-len
+            return np.zeros(self.size, dtype=np.bool_)
+        return names_mask[self.name_codes[:self.size]]
+
+    def _rows_mask(self, ids) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=np.bool_)
+        index = self._get_rows()
+        rows = [index[_id] for _id in ids if _id in index]
+        mask[rows] = True
+        return mask
+
+    def _sorted_page(
+        self, rows: np.ndarray, sort: str | None, sort_dir: str | None, start: int, limit: int
+    ) -> np.ndarray:
+        if sort and sort not in self.sortable_fields:
+            return rows[start:limit]
+        if not sort:
+            sort, sort_dir = 'created_at', 'desc'
+
+        if sort == 'name':
+            keys = self._get_names_rank()[self.name_codes[rows]].astype(np.int64)
+        else:
+            keys = self.created_at[rows]
+        if sort_dir == 'desc':
+            keys = -keys
+
+        # only the first "limit" keys need ordering: partition, keep every row
+        # tied with the boundary key and sort that (stable, like sorted())
+        if limit < len(keys):
+            boundary = np.partition(keys, limit - 1)[limit - 1]
+            candidates = np.flatnonzero(keys <= boundary)
+            order = candidates[np.argsort(keys[candidates], kind='stable')]
+        else:
+            order = np.argsort(keys, kind='stable')
+        return rows[order[start:limit]]
+
+    def _append_rows(  # pylint: disable=too-many-arguments
+        self,
+        ids: Sequence[str],
+        name_codes: Sequence[int] | np.ndarray,
+        descriptions: Sequence[Optional[str]],
+        is_active: Sequence[bool] | np.ndarray,
+        created_at: Sequence[int] | np.ndarray
+    ) -> None:
+        total = len(ids)
+        self._reserve(self.size + total)
+        start, end = self.size, self.size + total
+        self.ids.extend(ids)
+        self.descriptions.extend(descriptions)
+        self.name_codes[start:end] = name_codes
+        self.is_active[start:end] = is_active
+        self.created_at[start:end] = created_at
+        self.alive[start:end] = True
+        self._rows = None
+        self.size = end
+        self._fulltext_index = None
+
+    def _materialize(self, row: int) -> Category:
+        return Category(
+            unique_entity_id=UniqueEntityId(self.ids[row]),
+            name=self.names[self.name_codes[row]],
+            description=self.descriptions[row],
+            is_active=bool(self.is_active[row]),
+            created_at=from_micros(self.created_at[row])
+        )
+
+    def _write_row(self, row: int, entity: Category) -> None:
+        self.name_codes[row] = self._name_code(entity.name)
+        self.is_active[row] = bool(entity.is_active)
+        self.created_at[row] = to_micros(entity.created_at)  # type: ignore
+        self.alive[row] = True
+        if self._fulltext_index is not None:
+            self._fulltext_index.add(entity.id, (entity.name, entity.description))
+
+    def _name_code(self, name: str) -> int:
+        lookup = self._get_name_lookup()
+        code = lookup.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            lookup[name] = code
+            self._reset_names()
+        return code
+
+    def _reset_names(self) -> None:
+        self._names_array = None
+        self._names_lower = None
+        self._names_rank = None
+
+    def _get_name_lookup(self) -> Dict[str, int]:
+        if self._name_lookup is None:
+            self._name_lookup = {name: code for code, name in enumerate(self.names)}
+        return self._name_lookup
+
+    def _get_names_array(self) -> np.ndarray:
+        if self._names_array is None:
+            self._names_array = np.array(self.names, dtype=np.str_)
+        return self._names_array
+
+    def _get_names_lower(self) -> np.ndarray:
+        if self._names_lower is None:
+            self._names_lower = np.char.lower(self._get_names_array())
+        return self._names_lower
+
+    def _get_names_rank(self) -> np.ndarray:
+        if self._names_rank is None:
+            order = sorted(range(len(self.names)), key=self.names.__getitem__)
+            rank = np.empty(len(self.names), dtype=np.int32)
+            rank[order] = np.arange(len(self.names), dtype=np.int32)
+            self._names_rank = rank
+        return self._names_rank
+
+    def _get_fulltext_index(self) -> InvertedIndex:
+        if self._fulltext_index is None:
+            index = InvertedIndex()
+            for row in np.flatnonzero(self.alive[:self.size]).tolist():
+                index.add(
+                    self.ids[row], (self.names[self.name_codes[row]], self.descriptions[row])
+                )
+            self._fulltext_index = index
+        return self._fulltext_index
+
+    def _get_row(self, entity_id: str) -> int:
+        row = self._get_rows().get(entity_id)
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return row
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.alive)
+        if size <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < size:
+            capacity *= 2
+        for column in ('name_codes', 'created_at', 'is_active', 'alive'):
+            current = getattr(self, column)
+            grown = np.zeros(capacity, dtype=current.dtype)
+            grown[:self.size] = current[:self.size]
+            setattr(self, column, grown)
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self.alive[:self.size])
+        self.ids = [self.ids[row] for row in keep]
+        self.descriptions = [self.descriptions[row] for row in keep]
+        for column in ('name_codes', 'created_at', 'is_active', 'alive'):
+            current = getattr(self, column)
+            compacted = np.zeros(len(current), dtype=current.dtype)
+            compacted[:len(keep)] = current[keep]
+            setattr(self, column, compacted)
+        self.size = len(keep)
+        self._rows = None
+        self._deleted = 0
+
+    def _get_rows(self) -> Dict[str, int]:
+        if self._rows is None:
+            ids = self.ids
+            self._rows = {
+                ids[row]: row for row in np.flatnonzero(self.alive[:self.size]).tolist()
+            }
+        return self._rows
+
+
+class _RowView:  # pylint: disable=too-many-instance-attributes
+    # the Category attributes of one row, read from the columns on access
+
+    __slots__ = ('_ids', '_names', '_name_codes', '_descriptions', '_is_active', '_created_at',
+                 '_row')
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ids: List[str],
+        names: List[str],
+        name_codes: List[int],
+        descriptions: List[Optional[str]],
+        is_active: List[bool],
+        created_at: List[int]
+    ) -> None:
+        self._ids = ids
+        self._names = names
+        self._name_codes = name_codes
+        self._descriptions = descriptions
+        self._is_active = is_active
+        self._created_at = created_at
+        self._row = 0
+
+    def at(self, row: int) -> '_RowView':  # pylint: disable=invalid-name
+        self._row = row
+        return self
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        return self._ids[self._row]
+
+    @property
+    def name(self) -> str:
+        return self._names[self._name_codes[self._row]]
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._descriptions[self._row]
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active[self._row]
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return from_micros(self._created_at[self._row])
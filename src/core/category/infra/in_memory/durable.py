@@ -0,0 +1,137 @@
+import datetime
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.__seedwork.infra.wal import WriteAheadLog
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+from core.category.infra.in_memory.snapshot import restore, write_snapshot
+
+SNAPSHOT_FILE = 'categories.snapshot'
+
+
+class CategoryDurableInMemoryRepository(CategoryRepository):
+    # Wraps an in-memory repository: reads go straight to it, writes are
+    # appended to a write-ahead log in "directory" and then applied, so
+    # memory never holds a change the log is missing.
+    # Opening the repository recovers it from the last snapshot plus the
+    # log; compact() folds the log into a new snapshot.
+
+    repository: CategoryRepository
+    log: WriteAheadLog
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        directory: str,
+        repository: Optional[CategoryRepository] = None,
+        sync_interval: float = 0.005,
+        wait_for_sync: bool = True,
+        compact_every: Optional[int] = None
+    ) -> None:
+        self.repository = repository if repository is not None else CategoryInMemoryRepository()
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._since_compaction = 0
+
+        if os.path.exists(self.snapshot_path):
+            restore(self.snapshot_path, self.repository)
+        self.log = WriteAheadLog(directory, sync_interval, wait_for_sync)
+        for record in self.log.replay():
+            self._replay(record)
+
+    @property
+    def sortable_fields(self) -> List[str]:  # type: ignore
+        return self.repository.sortable_fields
+
+    def insert(self, entity: Category) -> None:
+        self._write(self.repository.insert, entity, {'op': 'insert', 'entity': _dump(entity)})
+
+    def update(self, entity: Category) -> None:
+        self._write(
+            self.repository.update, entity, {'op': 'update', 'entity': _dump(entity)}, existing=entity.id
+        )
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        self._write(
+            self.repository.delete, entity_id, {'op': 'delete', 'id': str(entity_id)}, existing=entity_id
+        )
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return self.repository.find_by_id(entity_id)
+
+    def find_all(self) -> List[Category]:
+        return self.repository.find_all()
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        return self.repository.search(input_params)
+
+    def compact(self) -> None:
+        # the snapshot is taken right after the rotation, under the write
+        # lock, so it holds exactly the records of the rotated segments
+        with self._lock:
+            segments = self.log.rotate()
+            write_snapshot(self.snapshot_path, self.repository)
+            self._since_compaction = 0
+        self.log.remove(segments)
+
+    def close(self) -> None:
+        self.log.close()
+
+    def _write(
+        self, apply, argument, record: Dict[str, Any], existing: Optional[str | UniqueEntityId] = None
+    ) -> None:
+        with self._lock:
+            # a write to a missing entity fails before it is logged
+            if existing is not None:
+                self.repository.find_by_id(existing)
+            sequence = self.log.append(record)
+            apply(argument)
+            self._since_compaction += 1
+            should_compact = self.compact_every is not None \
+                and self._since_compaction >= self.compact_every
+        # waiting outside the lock lets other writers join the same fsync
+        self.log.wait(sequence)
+        if should_compact:
+            self.compact()
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        # replay is idempotent: after a crash between writing a snapshot and
+        # removing the old segments, their records are applied once more
+        if record['op'] == 'delete':
+            try:
+                self.repository.delete(record['id'])
+            except NotFoundException:
+                pass
+            return
+        entity = _load(record['entity'])
+        try:
+            self.repository.find_by_id(entity.id)
+        except NotFoundException:
+            self.repository.insert(entity)
+        else:
+            self.repository.update(entity)
+
+
+def _dump(entity: Category) -> Dict[str, Any]:
+    return {
+        'id': entity.id,
+        'name': entity.name,
+        'description': entity.description,
+        'is_active': entity.is_active,
+        'created_at': entity.created_at.isoformat(),  # type: ignore
+    }
+
+
+def _load(data: Dict[str, Any]) -> Category:
+    return Category(
+        unique_entity_id=UniqueEntityId(data['id']),
+        name=data['name'],
+        description=data['description'],
+        is_active=data['is_active'],
+        created_at=datetime.datetime.fromisoformat(data['created_at'])
+    )
@@ -1,24 +1,172 @@
 
 
-from typing import List
-from core.__seedwork.domain.repositories import InMemorySearchableRepository
+from typing import List, Optional, Tuple
+from core.__seedwork.infra.fulltext import InvertedIndex
+from core.__seedwork.domain.filters import And, Expression, Field, compile_filter
+from core.__seedwork.domain.repositories import (
+    CopyOnWriteInMemoryRepository,
+    InMemorySearchableRepository,
+)
+from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.repositories import SORT_RELEVANCE, CategoryFilter, CategoryRepository
 
 
 class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepository):
     sortable_fields: List[str] = ["name", "created_at"]
 
-    def _apply_filter(self, items: List[Category], filter_param: str | None = None) -> List:
-        if filter_param:
-            filter_obj = filter(
-                lambda i: filter_param.lower() in i.name.lower(),
-                items
+    _fulltext_index: Optional[InvertedIndex] = None
+    _fulltext_items: Optional[List[Category]] = None
+
+    def insert(self, entity: Category) -> None:
+        super().insert(entity)
+        if self._is_fulltext_index_fresh(len(self.items) - 1):
+            self._fulltext_index.add(  # type: ignore
+                entity.id, (entity.name, entity.description))
+
+    def update(self, entity: Category) -> None:
+        super().update(entity)
+        if self._is_fulltext_index_fresh(len(self.items)):
+            self._fulltext_index.add(  # type: ignore
+                entity.id, (entity.name, entity.description))
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        super().delete(entity_id)
+        if self._is_fulltext_index_fresh(len(self.items) + 1):
+            self._fulltext_index.remove(str(entity_id))  # type: ignore
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        if not input_params.is_fulltext:
+            return super().search(input_params)
+
+        items, index = self._fulltext_snapshot()
+        scores = index.search(input_params.filter)  # type: ignore
+        items_filtered = [item for item in items if item.id in scores]
+        if not input_params.sort or input_params.sort == SORT_RELEVANCE:
+            items_sorted = sorted(
+                self._apply_sort(items_filtered, None, None),
+                key=lambda item: scores[item.id],
+                reverse=True
             )
-            return list(filter_obj)
+        else:
+            items_sorted = self._apply_sort(
+                items_filtered, input_params.sort, input_params.sort_dir
+            )
+        items_paginated = self._apply_paginate(
+            items_sorted, input_params.page, input_params.per_page  # type: ignore
+        )
+
+        return CategoryRepository.SearchResult(
+            items=items_paginated,
+            total=len(items_filtered),
+            current_page=input_params.page,  # type: ignore
+            per_page=input_params.per_page,  # type: ignore
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def _apply_filter(
+        self, items: List[Category], filter_param: str | CategoryFilter | None = None
+    ) -> List:
+        if isinstance(filter_param, CategoryFilter):
+            return compile_filter(self._to_expression(filter_param)).apply(items)
+        if filter_param:
+            return compile_filter(Field('name').icontains(filter_param)).apply(items)
         return items
 
     def _apply_sort(self, items: List, sort: str | None, sort_dir: str | None) -> List:
         return super()._apply_sort(items, sort, sort_dir) \
             if sort \
             else super()._apply_sort(items, "created_at", "desc")
+
+    @staticmethod
+    def _to_expression(category_filter: CategoryFilter) -> Expression:
+        name = Field('name')
+        conditions: List[Expression] = []
+        if category_filter.name is not None:
+            conditions.append(name.icontains(category_filter.name))
+        if category_filter.name_prefix is not None:
+            conditions.append(name.startswith(category_filter.name_prefix))
+        if category_filter.is_active is not None:
+            conditions.append(Field('is_active').eq(category_filter.is_active))
+        conditions.append(Field('created_at').range(
+            category_filter.created_at_from, category_filter.created_at_to
+        ))
+        if category_filter.ids is not None:
+            conditions.append(Field('id').in_(category_filter.ids))
+        return And(tuple(conditions))
+
+    def _is_fulltext_index_fresh(self, expected_size: int) -> bool:
+        # the index is built lazily and dropped whenever "items" is replaced
+        # or changed behind the repository's back
+        return self._fulltext_index is not None \
+            and self._fulltext_items is self.items \
+            and len(self._fulltext_index) == expected_size
+
+    def _fulltext_snapshot(self) -> Tuple[List[Category], InvertedIndex]:
+        # the items and the full-text index of those same items
+        if not self._is_fulltext_index_fresh(len(self.items)):
+            self._fulltext_index = self._build_fulltext_index(self.items)
+            self._fulltext_items = self.items
+        return self.items, self._fulltext_index  # type: ignore
+
+    @staticmethod
+    def _build_fulltext_index(items: List[Category]) -> InvertedIndex:
+        index = InvertedIndex()
+        for item in items:
+            index.add(item.id, (item.name, item.description))
+        return index
+
+
+class CategoryCopyOnWriteInMemoryRepository(
+    CategoryInMemoryRepository, CopyOnWriteInMemoryRepository
+):
+    # safe to share between threads. Every write publishes a new "items"
+    # list; once a full-text search has built the index, writes also copy
+    # and update it, and "_fulltext" publishes each list together with its
+    # index in one assignment
+
+    _fulltext: Optional[Tuple[List[Category], InvertedIndex]] = None
+
+    def insert(self, entity: Category) -> None:
+        with self._write_lock:
+            self._publish([*self.items, entity], entity.id, entity)
+
+    def update(self, entity: Category) -> None:
+        with self._write_lock:
+            items = list(self.items)
+            items[self._index(items, entity.id)] = entity
+            self._publish(items, entity.id, entity)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        id_str = str(entity_id)
+        with self._write_lock:
+            items = list(self.items)
+            del items[self._index(items, id_str)]
+            self._publish(items, id_str, None)
+
+    def _publish(self, items: List[Category], entity_id: str, entity: Optional[Category]) -> None:
+        # callers hold the write lock; "entity" is None for a delete
+        fulltext = self._fulltext
+        if fulltext is not None and fulltext[0] is self.items:
+            index = fulltext[1].copy()
+            if entity is None:
+                index.remove(entity_id)
+            else:
+                index.add(entity.id, (entity.name, entity.description))
+            self._fulltext = (items, index)
+        self.items = items
+
+    def _fulltext_snapshot(self) -> Tuple[List[Category], InvertedIndex]:
+        fulltext = self._fulltext
+        items = self.items
+        if fulltext is not None and fulltext[0] is items:
+            return fulltext
+        # built on the list this search picked up and only published if no
+        # write replaced that list meanwhile
+        fulltext = (items, self._build_fulltext_index(items))
+        with self._write_lock:
+            if self.items is items:
+                self._fulltext = fulltext
+        return fulltext
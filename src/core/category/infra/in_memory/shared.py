@@ -0,0 +1,439 @@
+from contextlib import contextmanager
+import dataclasses
+import datetime
+import fcntl
+from multiprocessing import resource_tracker, shared_memory
+import operator
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+# Segment layout: header | journal | records[capacity] | string heap[heap_size]
+#
+# header:  magic, version, generation, count, capacity, heap_used, heap_size
+# journal: ring of (version, row) for the last writes
+# record:  id, alive, is_active, has_description, created_at (microseconds),
+#          version of its last write, name and description heap slices
+#
+# Writers are serialized by an flock on a lock file and make "version" odd
+# while they change the segment (seqlock); readers never lock, they copy what
+# they need and retry if "version" was odd or changed in between. Every write
+# adds 2 to "version"; compaction moves rows and bumps "generation".
+MAGIC = b'CATSHM01'
+_HEADER = struct.Struct('<8s6Q')
+_JOURNAL = struct.Struct('<QQ')
+_JOURNAL_SIZE = 256
+_RECORD = struct.Struct('<36sBBB5xqQQIQI')
+_RECORDS_START = _HEADER.size + _JOURNAL.size * _JOURNAL_SIZE
+_VERSION_OFFSET = 8
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+T = TypeVar('T')
+
+
+_created_segments: Set[str] = set()
+
+
+class SharedMemoryFullException(Exception):
+    pass
+
+
+class _Record:
+    # a live row of the segment whose fields are decoded when read: searches
+    # filter and sort these and only turn the page they return into
+    # Category entities
+    __slots__ = ('_buf', '_values')
+
+    def __init__(self, buf: memoryview, values: Tuple) -> None:
+        self._buf = buf
+        self._values = values
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._values[1])
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        return self._values[0].decode('ascii')
+
+    @property
+    def name(self) -> str:
+        offset, length = self._values[6], self._values[7]
+        return bytes(self._buf[offset:offset + length]).decode()
+
+    @property
+    def description(self) -> Optional[str]:
+        if not self._values[3]:
+            return None
+        offset, length = self._values[8], self._values[9]
+        return bytes(self._buf[offset:offset + length]).decode()
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self._values[2])
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return _EPOCH + datetime.timedelta(microseconds=self._values[4])
+
+    @property
+    def created_at_us(self) -> int:
+        return self._values[4]
+
+    def to_entity(self) -> Category:
+        return _restore(self.id, {
+            'name': self.name,
+            'description': self.description,
+            'is_active': self.is_active,
+            'created_at': self.created_at,
+        })
+
+
+class _RecordSearch(CategoryInMemoryRepository):
+    # the in-memory search over _Record items, sorting by the stored
+    # created_at microseconds instead of a datetime built per record
+
+    def _apply_sort(self, items: List, sort: str | None, sort_dir: str | None) -> List:
+        if not sort:
+            sort, sort_dir = 'created_at', 'desc'
+        if sort == 'created_at':
+            return sorted(items, key=operator.attrgetter('created_at_us'), reverse=sort_dir == 'desc')
+        return super()._apply_sort(items, sort, sort_dir)
+
+
+class CategorySharedMemoryRepository(CategoryRepository):
+    # Every process attached to the same segment sees the same categories.
+    # Processes only keep an id -> row index, kept current from the journal
+    # (or rebuilt after a compaction or a long pause); lookups and searches
+    # read the records in the segment and decode the categories they return.
+
+    sortable_fields: List[str] = CategoryInMemoryRepository.sortable_fields
+
+    def __init__(self, name: str, capacity: int = 100_000, heap_size: int = 32 * 2 ** 20) -> None:
+        self.name = name
+        self._lock_file = open(  # pylint: disable=consider-using-with
+            os.path.join(tempfile.gettempdir(), f'{name}.lock'), 'a+b'
+        )
+        with self._locked():
+            try:
+                self._shm = shared_memory.SharedMemory(name=name)
+                # attaching registers the segment with the resource tracker,
+                # which would unlink it when this process exits: only the
+                # process that created it keeps it registered
+                if name not in _created_segments:
+                    resource_tracker.unregister(self._shm._name, 'shared_memory')  # pylint: disable=protected-access
+            except FileNotFoundError:
+                self._shm = shared_memory.SharedMemory(
+                    name=name, create=True,
+                    size=_RECORDS_START + capacity * _RECORD.size + heap_size
+                )
+                _HEADER.pack_into(self._shm.buf, 0, MAGIC, 0, 0, 0, capacity, 0, heap_size)
+                _created_segments.add(name)
+        if bytes(self._shm.buf[:8]) != MAGIC:
+            raise ValueError(f"'{name}' is not a category shared memory segment")
+
+        self._version = -1
+        self._generation = -1
+        self._rows: Dict[str, int] = {}
+        # threads of this process: the flock does not exclude them from
+        # each other and _rows is updated in place
+        self._lock = threading.RLock()
+
+    def insert(self, entity: Category) -> None:
+        with self._writing() as version:
+            _, _, count, capacity, _, _ = self._header()
+            if count == capacity:
+                self._compact()
+                _, _, count, capacity, _, _ = self._header()
+                if count == capacity:
+                    raise SharedMemoryFullException(f"'{self.name}' has no free records")
+            strings = self._store_strings(entity)
+            _, _, count, _, _, _ = self._header()
+            self._write_record(count, entity, version, strings)
+            self._set_header(count=count + 1)
+
+    def update(self, entity: Category) -> None:
+        with self._writing() as version:
+            self._get_row(entity.id)
+            # storing the strings may compact the segment and move the row
+            strings = self._store_strings(entity)
+            self._write_record(self._get_row(entity.id), entity, version, strings)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        with self._writing() as version:
+            row = self._get_row(str(entity_id))
+            # "alive" is the byte right after the id
+            self._shm.buf[self._record_offset(row) + 36] = 0
+            self._journal(version, row)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        id_str = str(entity_id)
+
+        def read() -> Optional[Category]:
+            with self._lock:
+                self._refresh()
+                row = self._rows.get(id_str)
+            if row is None:
+                return None
+            record = _Record(self._shm.buf, _RECORD.unpack_from(self._shm.buf, self._record_offset(row)))
+            return record.to_entity() if record.alive and record.id == id_str else None
+
+        entity = self._read(read)
+        if entity is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return entity
+
+    def find_all(self) -> List[Category]:
+        return self._read(lambda: [record.to_entity() for record in self._records()])
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        # the in-memory search over records read from the segment; full-text
+        # searches index the records they scan
+        def read() -> CategoryRepository.SearchResult:
+            view = _RecordSearch()
+            view.items = self._records()
+            result = view.search(input_params)
+            return dataclasses.replace(result, items=[record.to_entity() for record in result.items])
+
+        return self._read(read)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._refresh()
+
+    def close(self) -> None:
+        with self._lock:
+            self._rows = {}
+            self._shm.close()
+            self._lock_file.close()
+
+    def unlink(self) -> None:
+        # removes the segment for every process, the last one to stop calls it
+        self._shm.unlink()
+        _created_segments.discard(self.name)
+        lock_path = self._lock_file.name
+        if os.path.exists(lock_path):
+            os.remove(lock_path)
+
+    def _read(self, read: Callable[[], T]) -> T:
+        # seqlock read: runs read() until no write overlapped it; decoding
+        # fields torn by a concurrent write may fail, that is only an error
+        # when no write happened
+        while True:
+            version = self._read_version()
+            if version % 2:
+                time.sleep(0)
+                continue
+            try:
+                result = read()
+            except (UnicodeDecodeError, ValueError, OverflowError):
+                if self._read_version() == version:
+                    raise
+                continue
+            if self._read_version() == version:
+                return result
+
+    def _records(self) -> List[_Record]:
+        buf = self._shm.buf
+        _, _, count, capacity, _, _ = self._header()
+        if count > capacity:
+            raise ValueError('torn header')
+        data = bytes(buf[_RECORDS_START:_RECORDS_START + count * _RECORD.size])
+        return [_Record(buf, values) for values in _RECORD.iter_unpack(data) if values[1]]
+
+    def _refresh(self) -> None:
+        # brings the id -> row index up to date; callers hold self._lock
+        while True:
+            version = self._read_version()
+            if version == self._version:
+                return
+            if version % 2:
+                time.sleep(0)
+                continue
+            try:
+                generation = self._header()[1]
+                changed_rows = self._changed_rows(version, generation)
+                records = self._read_ids(changed_rows)
+            except (UnicodeDecodeError, ValueError):
+                continue
+            if self._read_version() == version:
+                break
+
+        rows = {} if changed_rows is None else self._rows
+        for row, category_id, alive in records:
+            if alive:
+                rows[category_id] = row
+            elif rows.get(category_id) == row:
+                del rows[category_id]
+        self._rows = rows
+        self._version = version
+        self._generation = generation
+
+    def _changed_rows(self, version: int, generation: int) -> Optional[List[int]]:
+        # rows written since the last refresh, from the journal; None when
+        # the segment was compacted or too many writes happened meanwhile
+        if self._version < 0 or generation != self._generation \
+                or (version - self._version) // 2 > _JOURNAL_SIZE:
+            return None
+        rows = set()
+        for write_version in range(self._version + 2, version + 2, 2):
+            entry_version, row = _JOURNAL.unpack_from(
+                self._shm.buf, self._journal_offset(write_version)
+            )
+            if entry_version != write_version:
+                return None
+            rows.add(row)
+        return sorted(rows)
+
+    def _read_ids(self, changed_rows: Optional[List[int]]) -> List[Tuple[int, str, bool]]:
+        # (row, id, alive) of the rows written since the last refresh, or of
+        # every row
+        buf = self._shm.buf
+        _, _, count, capacity, _, _ = self._header()
+        if count > capacity:
+            raise ValueError('torn header')
+        if changed_rows is None:
+            data = bytes(buf[_RECORDS_START:_RECORDS_START + count * _RECORD.size])
+            rows = enumerate(_RECORD.iter_unpack(data))
+        else:
+            rows = (
+                (row, _RECORD.unpack_from(buf, self._record_offset(row)))
+                for row in changed_rows if row < count
+            )
+        return [(row, record[0].decode('ascii'), bool(record[1])) for row, record in rows]
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _writing(self) -> Iterator[int]:
+        with self._lock, self._locked():
+            self._refresh()
+            version = self._read_version()
+            self._write_version(version + 1)
+            try:
+                yield version + 2
+            finally:
+                self._write_version(version + 2)
+            self._refresh()
+
+    def _store_strings(self, entity: Category) -> Tuple[int, int, int, int]:
+        name = entity.name.encode()
+        description = entity.description.encode() if entity.description is not None else b''
+        data = name + description
+        _, _, _, capacity, heap_used, heap_size = self._header()
+        if heap_used + len(data) > heap_size:
+            self._compact()
+            _, _, _, capacity, heap_used, heap_size = self._header()
+            if heap_used + len(data) > heap_size:
+                raise SharedMemoryFullException(f"'{self.name}' string heap is full")
+        offset = self._heap_start(capacity) + heap_used
+        self._shm.buf[offset:offset + len(data)] = data
+        self._set_header(heap_used=heap_used + len(data))
+        return offset, len(name), offset + len(name), len(description)
+
+    def _write_record(
+        self, row: int, entity: Category, version: int, strings: Tuple[int, int, int, int]
+    ) -> None:
+        name_offset, name_length, description_offset, description_length = strings
+        _RECORD.pack_into(
+            self._shm.buf, self._record_offset(row),
+            entity.id.encode('ascii'), 1, bool(entity.is_active), entity.description is not None,
+            (entity.created_at - _EPOCH) // datetime.timedelta(microseconds=1),  # type: ignore
+            version, name_offset, name_length, description_offset, description_length
+        )
+        self._journal(version, row)
+
+    def _journal(self, version: int, row: int) -> None:
+        _JOURNAL.pack_into(self._shm.buf, self._journal_offset(version), version, row)
+
+    def _compact(self) -> None:
+        # drops deleted records and unreferenced strings; runs inside
+        # _writing(), readers retry until it is done
+        buf = self._shm.buf
+        _, generation, count, capacity, _, _ = self._header()
+        heap_start = self._heap_start(capacity)
+        start = _RECORDS_START
+        records = list(_RECORD.iter_unpack(bytes(buf[start:start + count * _RECORD.size])))
+        heap = bytearray()
+        packed = []
+        self._rows = {}
+        for record in records:
+            raw_id, alive, is_active, has_description, created_at, record_version, \
+                name_offset, name_length, description_offset, description_length = record
+            if not alive:
+                continue
+            name = bytes(buf[name_offset:name_offset + name_length])
+            description = bytes(buf[description_offset:description_offset + description_length])
+            new_name_offset = heap_start + len(heap)
+            heap += name
+            new_description_offset = heap_start + len(heap)
+            heap += description
+            self._rows[raw_id.decode('ascii')] = len(packed)
+            packed.append(_RECORD.pack(
+                raw_id, alive, is_active, has_description, created_at, record_version,
+                new_name_offset, name_length, new_description_offset, description_length
+            ))
+        data = b''.join(packed)
+        buf[start:start + len(data)] = data
+        buf[heap_start:heap_start + len(heap)] = heap
+        self._set_header(generation=generation + 1, count=len(packed), heap_used=len(heap))
+
+    def _get_row(self, entity_id: str) -> int:
+        row = self._rows.get(entity_id)
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return row
+
+    def _header(self) -> Tuple[int, int, int, int, int, int]:
+        return _HEADER.unpack_from(self._shm.buf, 0)[1:]
+
+    def _set_header(self, **values: int) -> None:
+        fields = dict(zip(
+            ('version', 'generation', 'count', 'capacity', 'heap_used', 'heap_size'),
+            self._header()
+        ))
+        fields.update(values)
+        _HEADER.pack_into(self._shm.buf, 0, MAGIC, *fields.values())
+
+    def _read_version(self) -> int:
+        return struct.unpack_from('<Q', self._shm.buf, _VERSION_OFFSET)[0]
+
+    def _write_version(self, version: int) -> None:
+        struct.pack_into('<Q', self._shm.buf, _VERSION_OFFSET, version)
+
+    @staticmethod
+    def _journal_offset(version: int) -> int:
+        return _HEADER.size + (version // 2 % _JOURNAL_SIZE) * _JOURNAL.size
+
+    @staticmethod
+    def _record_offset(row: int) -> int:
+        return _RECORDS_START + row * _RECORD.size
+
+    @staticmethod
+    def _heap_start(capacity: int) -> int:
+        return _RECORDS_START + capacity * _RECORD.size
+
+
+def _restore(category_id: str, fields: Dict[str, Any]) -> Category:
+    # records were validated when they were written; decoding them skips the
+    # validator, which would dominate loading a large segment
+    category = Category.__new__(Category)
+    object.__setattr__(category, 'unique_entity_id', UniqueEntityId(category_id))
+    for field_name, value in fields.items():
+        object.__setattr__(category, field_name, value)
+    return category
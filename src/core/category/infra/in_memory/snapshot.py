@@ -0,0 +1,229 @@
+from array import array
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from itertools import compress
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Tuple
+
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.timestamps import from_micros, to_micros
+
+if TYPE_CHECKING:
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+
+logger = logging.getLogger(__name__)
+
+# Layout (little endian): header, then the fixed-size columns, then the
+# strings as NUL separated UTF-8 blobs. Loading maps the file and copies
+# each fixed-size column out in one go; only the strings are decoded. numpy
+# is only needed to load into a columnar repository.
+#
+#   header            MAGIC, rows, names, ids/names/descriptions blob sizes
+#   created_at        int64[rows]   microseconds since epoch, UTC
+#   name_codes        int32[rows]   index into the names blob
+#   is_active         bool[rows]
+#   has_description   bool[rows]
+#   ids, names, descriptions blobs
+MAGIC = b'CATSNAP1'
+_HEADER = struct.Struct('<8s5Q')
+_SEPARATOR = '\x00'
+
+
+class InvalidSnapshotException(Exception):
+    pass
+
+
+def write_snapshot(path: str, repository: CategoryRepository) -> int:
+    ids, names, name_codes, descriptions, is_active, created_at = _copy_columns(repository)
+    total = len(ids)
+    if not total == len(name_codes) == len(descriptions) == len(is_active) == len(created_at):
+        raise InvalidSnapshotException('Snapshot columns have different lengths')
+
+    has_description = bytes(description is not None for description in descriptions)
+    blobs = [
+        _join(ids),
+        _join(names),
+        _join(description for description in descriptions if description is not None),
+    ]
+
+    # written next to the target and renamed, readers never see a partial file
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(_HEADER.pack(
+                MAGIC, total, len(names), *(len(blob) for blob in blobs)
+            ))
+            file.write(_pack('q', created_at))
+            file.write(_pack('i', name_codes))
+            file.write(_pack('B', is_active))
+            file.write(has_description)
+            for blob in blobs:
+                file.write(blob)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return total
+
+
+def load_snapshot(
+    path: str, repository: Optional['CategoryColumnarInMemoryRepository'] = None
+) -> 'CategoryColumnarInMemoryRepository':
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+
+    if repository is None:
+        repository = CategoryColumnarInMemoryRepository()
+    ids, names, name_codes, descriptions, is_active, created_at = _read_columns(path)
+    repository.bulk_load_encoded(ids, names, name_codes, descriptions, is_active, created_at)
+    return repository
+
+
+def restore(path: str, repository: CategoryRepository) -> CategoryRepository:
+    # any other repository gets its entities inserted one by one, which is
+    # much slower than loading a columnar repository
+    if hasattr(repository, 'bulk_load_encoded'):
+        return load_snapshot(path, repository)
+    ids, names, name_codes, descriptions, is_active, created_at = _read_columns(path)
+    for row, category_id in enumerate(ids):
+        repository.insert(Category(
+            unique_entity_id=UniqueEntityId(category_id),
+            name=names[name_codes[row]],
+            description=descriptions[row],
+            is_active=bool(is_active[row]),
+            created_at=from_micros(created_at[row])
+        ))
+    return repository
+
+
+class PeriodicSnapshot:
+
+    def __init__(self, repository: CategoryRepository, path: str, interval: float) -> None:
+        self.repository = repository
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='category-snapshot', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, final_snapshot: bool = True) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if final_snapshot:
+            write_snapshot(self.path, self.repository)
+
+    def _run(self) -> None:
+        # a failed snapshot leaves the previous file in place; the next
+        # interval tries again
+        while not self._stopped.wait(self.interval):
+            try:
+                write_snapshot(self.path, self.repository)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Could not write the snapshot '%s'", self.path)
+
+
+_Columns = Tuple[
+    List[str], List[str], Sequence[int], List[Optional[str]], Sequence[bool], Sequence[int]
+]
+
+
+def _copy_columns(repository: CategoryRepository) -> _Columns:
+    # a consistent copy to write from: the columnar repository copies its
+    # columns under its write lock; for the others list() copies the items
+    # in one step (and the copy-on-write repositories never change the
+    # published list)
+    if hasattr(repository, 'copy_columns'):
+        return repository.copy_columns()  # type: ignore
+    categories = list(repository.find_all())
+    lookup: dict = {}
+    name_codes = [lookup.setdefault(category.name, len(lookup)) for category in categories]
+    return (
+        [category.id for category in categories],
+        list(lookup),
+        name_codes,
+        [category.description for category in categories],
+        [bool(category.is_active) for category in categories],
+        [to_micros(category.created_at) for category in categories],  # type: ignore
+    )
+
+
+def _read_columns(path: str) -> _Columns:
+    if os.path.getsize(path) < _HEADER.size:
+        raise InvalidSnapshotException(f"'{path}' is not a category snapshot")
+
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, total, total_names, *blob_sizes = _HEADER.unpack_from(data)
+        if magic != MAGIC or len(data) != _HEADER.size + total * 14 + sum(blob_sizes):
+            raise InvalidSnapshotException(f"'{path}' is not a category snapshot")
+
+        offset = _HEADER.size + total * 14
+        blobs = []
+        for size in blob_sizes:
+            blobs.append(_split(data[offset:offset + size]))
+            offset += size
+        ids, names, present_descriptions = blobs
+        if len(ids) != total or len(names) != total_names:
+            raise InvalidSnapshotException(f"'{path}' is not a category snapshot")
+
+        offset = _HEADER.size
+        created_at = _unpack('q', data[offset:offset + total * 8])
+        offset += total * 8
+        name_codes = _unpack('i', data[offset:offset + total * 4])
+        offset += total * 4
+        is_active = _unpack('B', data[offset:offset + total])
+        offset += total
+        has_description = data[offset:offset + total]
+
+    descriptions: List[Optional[str]] = [None] * total
+    for row, description in zip(compress(range(total), has_description), present_descriptions):
+        descriptions[row] = description
+    return ids, names, name_codes, descriptions, is_active, created_at
+
+
+def _pack(typecode: str, values: Any) -> bytes:
+    # little endian int64 ('q'), int32 ('i') or bool as one byte ('B')
+    if hasattr(values, 'astype'):  # a numpy column of the columnar repository
+        return values.astype(_NUMPY_TYPES[typecode]).tobytes()
+    packed = array(typecode, values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+_NUMPY_TYPES = {'q': '<i8', 'i': '<i4', 'B': '|u1'}
+
+
+def _join(values: Iterable[str]) -> bytes:
+    values = list(values)
+    blob = ''.join(f'{value}{_SEPARATOR}' for value in values).encode()
+    if blob.count(b'\x00') != len(values):
+        raise ValueError('Snapshot strings cannot contain NUL characters')
+    return blob
+
+
+def _split(blob: bytes) -> List[str]:
+    return blob.decode().split(_SEPARATOR)[:-1] if blob else []
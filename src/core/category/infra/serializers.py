@@ -1,7 +1,6 @@
 from rest_framework import ISO_8601, serializers
 
 
-
 class CategorySerializer(serializers.Serializer):  # pylint: disable=abstract-method
     id = serializers.UUIDField(read_only=True)
     name = serializers.CharField()
@@ -10,3 +9,26 @@ class CategorySerializer(serializers.Serializer):  # pylint: disable=abstract-me
     created_at = serializers.DateTimeField(
         read_only=True, format=ISO_8601  # type: ignore
     )
+
+
+class CategoryFilterSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    name_prefix = serializers.CharField(required=False, trim_whitespace=False)
+    is_active = serializers.BooleanField(required=False)
+    created_at_from = serializers.DateTimeField(required=False)
+    created_at_to = serializers.DateTimeField(required=False)
+    ids = serializers.CharField(required=False)
+
+    def validate_ids(self, value: str):
+        field = serializers.UUIDField()
+        return tuple(
+            str(field.run_validation(_id.strip())) for _id in value.split(',') if _id.strip()
+        )
+
+
+class CategoryAutocompleteSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    prefix = serializers.CharField(
+        required=False, allow_blank=True, default='', trim_whitespace=False
+    )
+    limit = serializers.IntegerField(
+        required=False, default=10, min_value=1, max_value=50
+    )
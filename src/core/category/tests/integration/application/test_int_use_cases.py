@@ -5,6 +5,7 @@ from django.utils import timezone
 from model_bakery import baker
 
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.infra.django_app.queries import assert_max_queries
 from core.category.infra.django_app.mappers import CategoryModelMapper
 from core.category.infra.django_app.models import CategoryModel
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
@@ -15,7 +16,10 @@ from core.category.application.use_cases import (
     ListCategoriesUseCase,
     UpdateCategoryUseCase,
 )
-from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from core.category.infra.django_app.repositories import (
+    CategoryDjangoQueryRepository,
+    CategoryDjangoRepository
+)
 
 
 @pytest.mark.django_db
@@ -180,6 +184,17 @@ class TestListCategoriesUseCaseInt(unittest.TestCase):
         return CategoryOutputMapper.without_child().to_output(entity)
 
 
+@pytest.mark.django_db
+class TestListCategoriesUseCaseWithQueryRepoInt(TestListCategoriesUseCaseInt):
+
+    def setUp(self) -> None:
+        self.category_repo = CategoryDjangoRepository()
+        self.use_case = ListCategoriesUseCase(
+            self.category_repo,
+            category_query_repo=CategoryDjangoQueryRepository()
+        )
+
+
 @pytest.mark.django_db
 class TestUpdateCategoryUseCaseInt(unittest.TestCase):
     category_repo: CategoryDjangoRepository
@@ -258,3 +273,47 @@ class TestDeleteCategoryUseCaseInt(unittest.TestCase):
             assert_error.exception.args[0],
             "Entity not found using ID 'fake_id'"
         )
+
+
+@pytest.mark.django_db
+class TestCategoryUseCasesQueryBudgetInt(unittest.TestCase):
+    # update and delete look the category up before writing; insert runs
+    # an UPDATE before its INSERT because the id is assigned by the entity
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoRepository()
+        self.model = baker.make(CategoryModel, name='Movie')
+
+    def test_create(self):
+        with assert_max_queries(2):
+            CreateCategoryUseCase(self.repo).execute(CreateCategoryUseCase.Input(name='Movie'))
+
+    def test_get(self):
+        with assert_max_queries(1):
+            GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input(id=str(self.model.id)))
+
+    def test_list(self):
+        baker.make(CategoryModel, _quantity=20)
+        with assert_max_queries(2):
+            ListCategoriesUseCase(self.repo).execute(ListCategoriesUseCase.Input())
+        with assert_max_queries(2):
+            ListCategoriesUseCase(self.repo, CategoryDjangoQueryRepository()).execute(
+                ListCategoriesUseCase.Input()
+            )
+
+    def test_update(self):
+        with assert_max_queries(3):
+            UpdateCategoryUseCase(self.repo).execute(
+                UpdateCategoryUseCase.Input(id=str(self.model.id), name='Documentary')
+            )
+
+    def test_delete(self):
+        with assert_max_queries(2):
+            DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(id=str(self.model.id)))
+
+    def test_over_budget_lists_the_queries(self):
+        with self.assertRaises(AssertionError) as assert_error:
+            with assert_max_queries(0):
+                GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input(id=str(self.model.id)))
+        self.assertIn('1 queries, expected at most 0', str(assert_error.exception))
+        self.assertIn('CategoryDjangoRepository.find_by_id: SELECT', str(assert_error.exception))
@@ -0,0 +1,64 @@
+import pytest
+from rest_framework.test import APIClient
+
+from django_app import container
+
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+
+
+@pytest.mark.django_db
+class TestCategoryAutocompleteResourceInt:
+
+    repo: CategoryRepository
+    client: APIClient
+
+    def setup_method(self):
+        self.teardown_method()
+        self.repo = container.repository_category_django_orm()
+        self.client = APIClient()
+
+    def teardown_method(self):
+        container.category_name_index.reset()
+        container.use_case_category_autocomplete_category.reset()
+
+    def test_autocomplete(self):
+        movie = Category(name='Movie')
+        music = Category(name='Music')
+        self.repo.insert(movie)
+        self.repo.insert(music)
+        self.repo.insert(Category(name='Documentary'))
+
+        response = self.client.get('/categories/autocomplete/?prefix=m')
+        assert response.status_code == 200
+        assert response.json() == {'items': [
+            {'id': movie.id, 'name': 'Movie'},
+            {'id': music.id, 'name': 'Music'},
+        ]}
+
+        response = self.client.get('/categories/autocomplete/?prefix=m&limit=1')
+        assert response.json() == {'items': [{'id': movie.id, 'name': 'Movie'}]}
+
+    def test_index_follows_writes(self):
+        movie = Category(name='Movie')
+        self.repo.insert(movie)
+        response = self.client.get('/categories/autocomplete/?prefix=mo')
+        assert response.json() == {'items': [{'id': movie.id, 'name': 'Movie'}]}
+
+        movie.update('Series')
+        self.repo.update(movie)
+        documentary = Category(name='Mockumentary')
+        self.repo.insert(documentary)
+        response = self.client.get('/categories/autocomplete/?prefix=mo')
+        assert response.json() == {'items': [
+            {'id': documentary.id, 'name': 'Mockumentary'}
+        ]}
+
+        self.repo.delete(documentary.id)
+        response = self.client.get('/categories/autocomplete/?prefix=mo')
+        assert response.json() == {'items': []}
+
+    def test_invalid_limit(self):
+        response = self.client.get('/categories/autocomplete/?prefix=m&limit=0')
+        assert response.status_code == 400
+        assert 'limit' in response.json()
@@ -1,21 +1,31 @@
 
 # pylint: disable=no-member
 import datetime
+from importlib import import_module
 import unittest
+from django.db import connection
+from django.db.utils import ConnectionDoesNotExist
+from django.test import override_settings
 from django.utils import timezone
 from model_bakery.recipe import seq
 from model_bakery import baker
 import pytest
 
-from core.category.domain.repositories import CategoryRepository
+from core.category.domain.repositories import CategoryFilter, CategoryRepository
 
 
 from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Field
 from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.__seedwork.infra.django_app import routers
 from core.category.domain.entities import Category
 from core.category.infra.django_app.mappers import CategoryModelMapper
 from core.category.infra.django_app.models import CategoryModel
-from core.category.infra.django_app.repositories import CategoryDjangoRepository
+from core.category.infra.django_app.repositories import (
+    CategoryDjangoQueryRepository,
+    CategoryDjangoRepository
+)
+from core.category.application.dto import CategoryOutput, CategoryOutputMapper
 
 
 @pytest.mark.django_db
@@ -434,3 +444,288 @@ class TestCategoryDjangoRepositoryInt(unittest.TestCase):
             sort_dir='asc',
             filter='TEST'
         ))
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoQueryRepositoryInt(unittest.TestCase):
+
+    repo: CategoryDjangoQueryRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoQueryRepository()
+
+    def test_search_returns_outputs(self):
+        models = baker.make(
+            CategoryModel,
+            _quantity=16,
+            created_at=seq(
+                datetime.datetime.now(),
+                datetime.timedelta(days=1)  # type: ignore
+            ),
+        )
+
+        models.reverse()
+
+        search_result = self.repo.search(
+            CategoryDjangoQueryRepository.SearchParams())
+        self.assertEqual(search_result, CategoryRepository.SearchResult(
+            items=[self.from_model_to_output(model) for model in models[:15]],
+            total=16,
+            current_page=1,
+            per_page=15,
+            sort=None,
+            sort_dir=None,
+            filter=None
+        ))
+        self.assertIsInstance(search_result.items[0], CategoryOutput)
+        self.assertIsInstance(search_result.items[0].id, str)
+
+    def test_search_matches_write_side(self):
+        baker.make(CategoryModel, _quantity=3, name='test')
+        baker.make(CategoryModel, _quantity=2, name='fake')
+
+        search_params = CategoryRepository.SearchParams(
+            page=1, per_page=2, sort='name', sort_dir='desc', filter='TEST'
+        )
+        search_result = self.repo.search(search_params)
+        expected = CategoryDjangoRepository().search(search_params)
+
+        self.assertEqual(search_result.total, expected.total)
+        self.assertEqual(search_result.last_page, expected.last_page)
+        self.assertEqual(
+            search_result.items,
+            [CategoryOutputMapper.without_child().to_output(item)
+             for item in expected.items]
+        )
+
+    def from_model_to_output(self, model: CategoryModel) -> CategoryOutput:
+        entity = CategoryModelMapper.to_entity(model)
+        return CategoryOutputMapper.without_child().to_output(entity)
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoRepositoryFulltextInt(unittest.TestCase):
+
+    repo: CategoryDjangoRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoRepository()
+
+    def test_search_ranks_by_relevance(self):
+        categories = [
+            Category(name='Movie', description='feature films'),
+            Category(name='Documentary', description='non fiction films'),
+            Category(name='Short movie'),
+            Category(name='Ação', description='movie night classics'),
+        ]
+        for category in categories:
+            self.repo.insert(category)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='movie', search_mode='fulltext'
+        ))
+        self.assertEqual(result.total, 3)
+        self.assertEqual(
+            [item.id for item in result.items],
+            [categories[2].id, categories[0].id, categories[3].id]
+        )
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='acao', search_mode='fulltext'
+        ))
+        self.assertEqual(result.items, [categories[3]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='films', search_mode='fulltext', sort='name', sort_dir='desc'
+        ))
+        self.assertEqual(result.items, [categories[0], categories[1]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='!!!', search_mode='fulltext'
+        ))
+        self.assertEqual(result.total, 0)
+
+    def test_index_follows_update_and_delete(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        params = CategoryRepository.SearchParams(
+            filter='horror', search_mode='fulltext'
+        )
+        self.assertEqual(self.repo.search(params).total, 0)
+
+        category.update('Horror', None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.search(params).items, [category])
+
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.search(params).total, 0)
+
+    def test_migration_reverses_and_reapplies(self):
+        category = Category(name='Drama')
+        self.repo.insert(category)
+        params = CategoryRepository.SearchParams(filter='drama', search_mode='fulltext')
+        operation = import_module(
+            'core.category.infra.django_app.migrations.0003_category_fulltext'
+        ).Migration.operations[0]
+
+        with connection.cursor() as cursor:
+            for statement in operation.reverse_sql:
+                cursor.execute(statement)
+            cursor.execute("SELECT name FROM sqlite_master WHERE name LIKE 'categories_fts%'")
+            self.assertEqual(cursor.fetchall(), [])
+            # the forward SQL indexes the rows already there
+            for statement in operation.sql:
+                cursor.execute(statement)
+        self.assertEqual(self.repo.search(params).items, [category])
+
+    def test_query_repository_uses_fulltext(self):
+        category = Category(name='Drama', description='stories about people')
+        self.repo.insert(category)
+        self.repo.insert(Category(name='Comedy'))
+
+        result = CategoryDjangoQueryRepository().search(CategoryRepository.SearchParams(
+            filter='people', search_mode='fulltext'
+        ))
+        self.assertEqual(
+            result.items, [CategoryOutputMapper.without_child().to_output(category)]
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCategoryDjangoRepositoryFulltextVacuumInt(unittest.TestCase):
+
+    def test_index_survives_vacuum(self):
+        # VACUUM renumbers the implicit rowids of "categories"
+        repo = CategoryDjangoRepository()
+        categories = [Category(name=name) for name in ['Movie', 'Drama', 'Comedy']]
+        for category in categories:
+            repo.insert(category)
+        repo.delete(categories[0].id)
+        with connection.cursor() as cursor:
+            cursor.execute('VACUUM')
+
+        for category in categories[1:]:
+            result = repo.search(CategoryRepository.SearchParams(
+                filter=category.name, search_mode='fulltext'
+            ))
+            self.assertEqual(result.items, [category])
+        categories[2].update('Horror', None)
+        repo.update(categories[2])
+        result = repo.search(CategoryRepository.SearchParams(
+            filter='horror', search_mode='fulltext'
+        ))
+        self.assertEqual(result.items, [categories[2]])
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoRepositoryCategoryFilterInt(unittest.TestCase):
+
+    repo: CategoryDjangoRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoRepository()
+
+    def test_search_with_category_filter(self):
+        now = timezone.now()
+        categories = [
+            Category(name='Movie', created_at=now - datetime.timedelta(days=2)),
+            Category(
+                name='movie night', is_active=False, created_at=now - datetime.timedelta(days=1)
+            ),
+            Category(name='Documentary', created_at=now),
+            Category(name='Mockumentary', is_active=False,
+                     created_at=now + datetime.timedelta(seconds=1)),
+        ]
+        for category in categories:
+            self.repo.insert(category)
+
+        arrange = [
+            {'filter': CategoryFilter(is_active=True), 'expected': [categories[2], categories[0]]},
+            {'filter': CategoryFilter(is_active=False), 'expected': [categories[3], categories[1]]},
+            {'filter': CategoryFilter(name='MOVIE'), 'expected': [categories[1], categories[0]]},
+            {'filter': CategoryFilter(name_prefix='Mo'), 'expected': [categories[3], categories[0]]},
+            {
+                'filter': CategoryFilter(created_at_from=now - datetime.timedelta(days=1)),
+                'expected': [categories[3], categories[2], categories[1]]
+            },
+            {
+                'filter': CategoryFilter(created_at_to=now - datetime.timedelta(days=1)),
+                'expected': [categories[1], categories[0]]
+            },
+            {
+                'filter': CategoryFilter(ids=(categories[1].id, categories[2].id)),
+                'expected': [categories[2], categories[1]]
+            },
+            {
+                'filter': CategoryFilter(name='mentary', is_active=False, created_at_from=now),
+                'expected': [categories[3]]
+            },
+        ]
+        for item in arrange:
+            result = self.repo.search(CategoryRepository.SearchParams(filter=item['filter']))
+            self.assertEqual(result.items, item['expected'], item['filter'])
+            self.assertEqual(result.total, len(item['expected']))
+            self.assertEqual(result.filter, item['filter'])
+
+    def test_search_with_filter_expression(self):
+        categories = [
+            Category(name='Movie'),
+            Category(name='Music', is_active=False),
+            Category(name='Documentary', description='music docs'),
+        ]
+        for category in categories:
+            self.repo.insert(category)
+
+        name = Field('name')
+        arrange = [
+            {'filter': Field('is_active').eq(False), 'expected': [categories[1]]},
+            {'filter': Field('is_active').ne(False), 'expected': [categories[2], categories[0]]},
+            {
+                'filter': name.icontains('mu') | Field('description').icontains('mu'),
+                'expected': [categories[2], categories[1]]
+            },
+            {
+                'filter': name.startswith('M') & ~name.in_(['Music']),
+                'expected': [categories[0]]
+            },
+        ]
+        for item in arrange:
+            result = self.repo.search(CategoryRepository.SearchParams(
+                filter=item['filter'], sort='name'
+            ))
+            self.assertEqual(result.items, item['expected'], item['filter'])
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoRepositoryReadReplicaInt(unittest.TestCase):
+
+    # "unreachable" is not a configured database: a query routed to the
+    # replica fails with ConnectionDoesNotExist
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoRepository()
+        self.category = Category(name='Movie')
+        self.repo.insert(self.category)
+
+    def test_reads_go_to_replica(self):
+        with override_settings(DATABASE_REPLICAS=['unreachable']):
+            with self.assertRaises(ConnectionDoesNotExist):
+                self.repo.find_by_id(self.category.id)
+            with self.assertRaises(ConnectionDoesNotExist):
+                self.repo.find_all()
+            with self.assertRaises(ConnectionDoesNotExist):
+                self.repo.search(CategoryRepository.SearchParams())
+
+    def test_writes_go_to_primary(self):
+        with override_settings(DATABASE_REPLICAS=['unreachable']):
+            self.category.update('Music', None)
+            self.repo.update(self.category)
+            self.repo.insert(Category(name='Series'))
+            self.repo.delete(self.category.id)
+        self.assertEqual([model.name for model in CategoryModel.objects.all()], ['Series'])
+
+    def test_reads_after_a_write_stay_on_primary(self):
+        with override_settings(DATABASE_REPLICAS=['unreachable']), routers.request_scope():
+            self.category.update('Music', None)
+            self.repo.update(self.category)
+            self.assertEqual(self.repo.find_by_id(self.category.id).name, 'Music')
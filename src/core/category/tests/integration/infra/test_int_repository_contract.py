@@ -0,0 +1,19 @@
+import unittest
+
+import pytest
+
+from core.category.tests.repository_contract import BACKENDS, run_backends
+
+
+@pytest.mark.django_db
+class TestCategoryRepositoryContractInt(unittest.TestCase):
+
+    def test_every_backend_returns_the_same_results(self):
+        report = run_backends(list(BACKENDS), size=200, memory=False)
+
+        self.assertEqual(report['reference'], 'in_memory')
+        self.assertEqual(
+            set(report['runs']) | set(report['skipped']), set(BACKENDS)
+        )
+        for name, mismatches in report['mismatches'].items():
+            self.assertEqual(mismatches, [], name)
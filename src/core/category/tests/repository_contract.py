@@ -0,0 +1,234 @@
+# pylint: disable=import-outside-toplevel
+"""
+Contract suite for CategoryRepository: runs one workload (inserts, lookups,
+updates, deletes, searches with filter/sort/page) against every backend
+registered in BACKENDS and compares the results of each one with the first.
+A new backend is covered by registering a factory with @backend.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import datetime
+import importlib.util
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter, CategoryRepository
+
+# name -> factory of a context manager yielding an empty repository
+BACKENDS: Dict[str, Callable[[int], ContextManager[CategoryRepository]]] = {}
+
+
+def backend(name: str):
+    def register(factory):
+        BACKENDS[name] = contextmanager(factory)
+        return factory
+    return register
+
+
+@backend('in_memory')
+def in_memory(_size: int) -> Iterator[CategoryRepository]:
+    from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+    yield CategoryInMemoryRepository()
+
+
+@backend('copy_on_write')
+def copy_on_write(_size: int) -> Iterator[CategoryRepository]:
+    from core.category.infra.in_memory.repositories import CategoryCopyOnWriteInMemoryRepository
+    yield CategoryCopyOnWriteInMemoryRepository()
+
+
+@backend('columnar')
+def columnar(_size: int) -> Iterator[CategoryRepository]:
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+    yield CategoryColumnarInMemoryRepository()
+
+
+@backend('durable')
+def durable(_size: int) -> Iterator[CategoryRepository]:
+    from core.category.infra.in_memory.durable import CategoryDurableInMemoryRepository
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CategoryDurableInMemoryRepository(directory)
+        try:
+            yield repo
+        finally:
+            repo.close()
+
+
+@backend('shared_memory')
+def shared_memory(size: int) -> Iterator[CategoryRepository]:
+    from core.category.infra.in_memory.shared import CategorySharedMemoryRepository
+    repo = CategorySharedMemoryRepository(
+        f'contract_{uuid.uuid4().hex[:12]}', capacity=size * 2, heap_size=size * 512
+    )
+    try:
+        yield repo
+    finally:
+        repo.close()
+        repo.unlink()
+
+
+@backend('django')
+def django_orm(_size: int) -> Iterator[CategoryRepository]:
+    # needs a configured Django database
+    from core.category.infra.django_app.models import CategoryModel
+    from core.category.infra.django_app.repositories import CategoryDjangoRepository
+    CategoryModel.objects.all().delete()  # pylint: disable=no-member
+    try:
+        yield CategoryDjangoRepository()
+    finally:
+        CategoryModel.objects.all().delete()  # pylint: disable=no-member
+
+
+@dataclass
+class Workload:
+    categories: List[Category]
+    lookups: List[str]
+    updates: List[Category]
+    deletes: List[str]
+    searches: List[CategoryRepository.SearchParams]
+
+
+def make_workload(size: int, seed: int = 0) -> Workload:
+    rng = random.Random(seed)
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    words = ['Movie', 'music', 'Series', 'Kids', 'News', 'sports', 'Documentary', 'Ação']
+    categories = [
+        Category(
+            unique_entity_id=UniqueEntityId(str(uuid.UUID(int=rng.getrandbits(128), version=4))),
+            name=f'{rng.choice(words)} {index}',
+            description=f'description {index}' if index % 2 else None,
+            is_active=index % 3 != 0,
+            created_at=start + datetime.timedelta(seconds=index, microseconds=index % 1000)
+        ) for index in range(size)
+    ]
+    sample = rng.sample(categories, min(size, max(size // 10, 1)))
+    half = len(sample) // 2
+    updates = [
+        Category(
+            unique_entity_id=category.unique_entity_id,
+            name=f'{category.name} updated',
+            description='updated',
+            is_active=not category.is_active,
+            created_at=category.created_at
+        ) for category in sample[:half]
+    ]
+    searches = [
+        CategoryRepository.SearchParams(),
+        CategoryRepository.SearchParams(page=2, per_page=50),
+        CategoryRepository.SearchParams(filter='movie'),
+        CategoryRepository.SearchParams(filter='music', sort='name', sort_dir='desc', page=2),
+        CategoryRepository.SearchParams(sort='name'),
+        CategoryRepository.SearchParams(sort='created_at', sort_dir='asc', per_page=100),
+        CategoryRepository.SearchParams(filter=CategoryFilter(is_active=True), page=3),
+        CategoryRepository.SearchParams(filter=CategoryFilter(name_prefix='Kids'), sort='name'),
+        CategoryRepository.SearchParams(filter='updated', sort='name'),
+        CategoryRepository.SearchParams(filter='no such category'),
+    ]
+    return Workload(
+        categories=categories,
+        lookups=[category.id for category in rng.sample(categories, min(size, 200))],
+        updates=updates,
+        deletes=[category.id for category in sample[half:]],
+        searches=searches,
+    )
+
+
+@dataclass
+class Run:
+    # per operation: list of results to compare and list of latencies
+    results: Dict[str, List[Any]] = field(default_factory=dict)
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    memory: Dict[str, int] = field(default_factory=dict)
+
+    def call(self, operation: str, func: Callable[[], Any], result: Callable[[Any], Any]):
+        start = time.perf_counter()
+        try:
+            value = func()
+        except NotFoundException as exception:
+            self.latencies.setdefault(operation, []).append(time.perf_counter() - start)
+            self.results.setdefault(operation, []).append(('NotFoundException', str(exception)))
+            return
+        self.latencies.setdefault(operation, []).append(time.perf_counter() - start)
+        self.results.setdefault(operation, []).append(result(value))
+
+
+def run_workload(repo: CategoryRepository, workload: Workload, trace_memory: bool = False) -> Run:
+    # tracing memory slows every allocation down: latencies come from a run
+    # without it
+    run = Run()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        for category in workload.categories:
+            run.call('insert', lambda category=category: repo.insert(category), lambda value: value)
+        if trace_memory:
+            run.memory['after_insert'] = tracemalloc.get_traced_memory()[0]
+
+        for entity_id in [*workload.lookups, str(uuid.UUID(int=0, version=4))]:
+            run.call('find_by_id', lambda entity_id=entity_id: repo.find_by_id(entity_id),
+                     lambda value: value.to_dict())
+        for category in workload.updates:
+            run.call('update', lambda category=category: repo.update(category), lambda value: value)
+        for entity_id in workload.deletes:
+            run.call('delete', lambda entity_id=entity_id: repo.delete(entity_id), lambda value: value)
+        run.call('delete', lambda: repo.delete(workload.deletes[0]), lambda value: value)
+        for params in workload.searches:
+            run.call('search', lambda params=params: repo.search(params), _search_result)
+        run.call('find_all', repo.find_all,
+                 lambda value: sorted((entity.to_dict() for entity in value), key=lambda item: item['id']))
+        if trace_memory:
+            run.memory['peak'] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return run
+
+
+def _search_result(result: CategoryRepository.SearchResult) -> Dict[str, Any]:
+    output = result.to_dict()
+    output['items'] = [item.to_dict() for item in result.items]
+    return output
+
+
+def compare(reference: Run, other: Run) -> List[str]:
+    mismatches = []
+    for operation, expected in reference.results.items():
+        actual = other.results.get(operation, [])
+        for index, (want, got) in enumerate(zip(expected, actual)):
+            if want != got:
+                mismatches.append(f'{operation}[{index}]: expected {want!r:.200} got {got!r:.200}')
+        if len(expected) != len(actual):
+            mismatches.append(f'{operation}: {len(actual)} results, expected {len(expected)}')
+    return mismatches
+
+
+def available(name: str) -> Optional[str]:
+    if name == 'columnar' and importlib.util.find_spec('numpy') is None:
+        return 'numpy is not installed'
+    return None
+
+
+def run_backends(names: List[str], size: int, seed: int = 0, memory: bool = True) -> Dict[str, Any]:
+    workload = make_workload(size, seed)
+    runs: Dict[str, Run] = {}
+    skipped: Dict[str, str] = {}
+    for name in names:
+        reason = available(name)
+        if reason:
+            skipped[name] = reason
+            continue
+        with BACKENDS[name](size) as repo:
+            runs[name] = run_workload(repo, workload)
+        if memory:
+            with BACKENDS[name](size) as repo:
+                runs[name].memory = run_workload(repo, workload, trace_memory=True).memory
+    reference = next(iter(runs))
+    mismatches = {name: compare(runs[reference], run) for name, run in runs.items() if name != reference}
+    return {'reference': reference, 'runs': runs, 'skipped': skipped, 'mismatches': mismatches}
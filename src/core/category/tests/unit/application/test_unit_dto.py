@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Optional
 import unittest
 
+from core.__seedwork.application.dto import ColumnarItems
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
 from core.category.domain.entities import Category
 
@@ -46,3 +47,13 @@ class TestCategoryOutputMapper(unittest.TestCase):
                 CategoryOutput
             )
         )
+
+    def test_to_columnar(self):
+        categories = [Category(name='a'), Category(name='b', is_active=False)]
+        items = CategoryOutputMapper.without_child().to_columnar(categories)
+        self.assertIsInstance(items, ColumnarItems)
+        self.assertEqual(
+            list(items),
+            [CategoryOutputMapper.without_child().to_output(category)
+             for category in categories]
+        )
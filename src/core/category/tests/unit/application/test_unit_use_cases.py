@@ -3,6 +3,7 @@
 from datetime import timedelta
 from typing import Optional
 import unittest
+from unittest import mock
 from unittest.mock import patch
 
 from django.utils import timezone
@@ -10,8 +11,10 @@ from core.__seedwork.application.dto import SearchInput
 from core.__seedwork.application.use_cases import UseCase
 from core.__seedwork.domain.exceptions import NotFoundException
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
+from core.category.application.queries import CategoryNameIndex, CategoryQueryRepository
 
 from core.category.application.use_cases import (
+    AutocompleteCategoriesUseCase,
     CreateCategoryUseCase,
     DeleteCategoryUseCase,
     GetCategoryUseCase,
@@ -281,6 +284,45 @@ class TestListCategoriesUseCase(unittest.TestCase):
         ))
 
 
+class TestListCategoriesUseCaseWithQueryRepo(unittest.TestCase):
+
+    def test_execute_uses_query_repo(self):
+        category_repo = CategoryInMemoryRepository()
+        output_item = CategoryOutput(
+            id='114e527b-d222-44f1-86c7-1cb621f44849',
+            name='Movie',
+            description=None,
+            is_active=True,
+            created_at=timezone.now()
+        )
+        query_repo = mock.Mock(CategoryQueryRepository)
+        query_repo.SearchParams = CategoryQueryRepository.SearchParams
+        query_repo.search.return_value = CategoryQueryRepository.SearchResult(
+            items=[output_item],
+            total=1,
+            current_page=1,
+            per_page=15
+        )
+        use_case = ListCategoriesUseCase(
+            category_repo, category_query_repo=query_repo
+        )
+
+        with patch.object(category_repo, 'search') as spy_search:
+            output = use_case.execute(ListCategoriesUseCase.Input(filter='Mo'))
+            spy_search.assert_not_called()
+
+        query_repo.search.assert_called_once_with(
+            CategoryQueryRepository.SearchParams(filter='Mo')
+        )
+        self.assertEqual(output, ListCategoriesUseCase.Output(
+            items=[output_item],
+            total=1,
+            current_page=1,
+            per_page=15,
+            last_page=1
+        ))
+
+
 class TestUpdateCategoryUseCase(unittest.TestCase):
     category_repo: CategoryInMemoryRepository
     use_case: UpdateCategoryUseCase
@@ -407,3 +449,32 @@ class TestDeleteCategoryUseCase(unittest.TestCase):
             assert_error.exception.args[0],
             "Entity not found using ID 'fake_id'"
         )
+
+
+class TestAutocompleteCategoriesUseCase(unittest.TestCase):
+    name_index: mock.Mock
+    use_case: AutocompleteCategoriesUseCase
+
+    def setUp(self) -> None:
+        self.name_index = mock.Mock(CategoryNameIndex)
+        self.name_index.complete.return_value = [('1', 'Movie'), ('2', 'Music')]
+        self.use_case = AutocompleteCategoriesUseCase(self.name_index)
+
+    def test_if_is_instance_a_use_case(self):
+        self.assertIsInstance(self.use_case, UseCase)
+
+    def test_input(self):
+        self.assertEqual(AutocompleteCategoriesUseCase.Input.__annotations__, {
+            'prefix': str,
+            'limit': int,
+        })
+        self.assertEqual(AutocompleteCategoriesUseCase.Input(prefix='m').limit, 10)
+
+    def test_execute(self):
+        output = self.use_case.execute(
+            AutocompleteCategoriesUseCase.Input(prefix='m', limit=2))
+        self.assertEqual(output, AutocompleteCategoriesUseCase.Output(items=[
+            AutocompleteCategoriesUseCase.Item(id='1', name='Movie'),
+            AutocompleteCategoriesUseCase.Item(id='2', name='Music'),
+        ]))
+        self.name_index.complete.assert_called_once_with('m', 2)
@@ -1,13 +1,15 @@
 
 
 from collections import namedtuple
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 import unittest
 from unittest import mock
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
+from core.category.domain.repositories import CategoryFilter
 from core.category.infra.serializers import CategorySerializer
 from core.category.application.dto import CategoryOutput
 from core.category.application.use_cases import (
@@ -272,6 +274,46 @@ class TestCategoryResourceUnit(unittest.TestCase):
 
         self.assertEqual(response.status_code, 204)
 
+    def test_parse_list_params(self):
+        params = {'page': '1', 'filter': 'test'}
+        self.assertEqual(CategoryResource.parse_list_params(dict(params)), params)
+
+        parsed = CategoryResource.parse_list_params({
+            'page': '1',
+            'filter': 'test',
+            'is_active': 'true',
+            'name_prefix': 'Mo',
+            'created_at_from': '2023-01-01T00:00:00Z',
+            'ids': '114e527b-d222-44f1-86c7-1cb621f44849, ',
+        })
+        self.assertEqual(parsed, {
+            'page': '1',
+            'filter': CategoryFilter(
+                name='test',
+                name_prefix='Mo',
+                is_active=True,
+                created_at_from=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                ids=('114e527b-d222-44f1-86c7-1cb621f44849',)
+            )
+        })
+
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.parse_list_params({'is_active': 'x', 'ids': 'fake'})
+        self.assertEqual(
+            set(assert_error.exception.detail.keys()),  # type: ignore
+            {'is_active', 'ids'}
+        )
+
+        params = {'filter': 'movie', 'search_mode': 'fulltext'}
+        self.assertEqual(CategoryResource.parse_list_params(dict(params)), params)
+        with self.assertRaises(ValidationError) as assert_error:
+            CategoryResource.parse_list_params(
+                {'filter': 'movie', 'search_mode': 'FullText', 'is_active': 'true'}
+            )
+        self.assertEqual(assert_error.exception.detail, {  # type: ignore
+            'search_mode': ['Fulltext search cannot be combined with is_active.']
+        })
+
     def __init_all_none(self):
         return {
             'list_use_case': None,
@@ -0,0 +1,53 @@
+import unittest
+from unittest import mock
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from core.category.application.queries import CategoryQueryRepository
+from core.category.infra.django_app.autocomplete import CategoryPrefixNameIndex
+
+
+class TestCategoryPrefixNameIndexUnit(unittest.TestCase):
+    query_repo: mock.Mock
+    name_index: CategoryPrefixNameIndex
+
+    def setUp(self) -> None:
+        self.query_repo = mock.Mock(CategoryQueryRepository)
+        self.query_repo.find_all_names.return_value = [
+            ('1', 'Movie'), ('2', 'Music'), ('3', 'Documentary')
+        ]
+        self.name_index = CategoryPrefixNameIndex(self.query_repo, max_age=60)
+
+    def test_builds_on_first_use(self):
+        self.assertEqual(self.name_index.complete('m'), [('1', 'Movie'), ('2', 'Music')])
+        self.assertEqual(self.name_index.complete('m', limit=1), [('1', 'Movie')])
+        self.query_repo.find_all_names.assert_called_once()
+
+    def test_max_age_from_settings(self):
+        with override_settings(CATEGORY_NAME_INDEX_MAX_AGE=5):
+            self.assertEqual(CategoryPrefixNameIndex(self.query_repo).max_age, 5)
+
+    def test_rebuilds_when_older_than_max_age(self):
+        with patch('core.category.infra.django_app.autocomplete.time.monotonic') as monotonic:
+            monotonic.return_value = 100.0
+            self.name_index.complete('m')
+
+            # another process renamed "Music"
+            self.query_repo.find_all_names.return_value = [
+                ('1', 'Movie'), ('2', 'Series'), ('3', 'Documentary')
+            ]
+            monotonic.return_value = 159.0
+            self.assertEqual(self.name_index.complete('m'), [('1', 'Movie'), ('2', 'Music')])
+
+            monotonic.return_value = 160.0
+            self.assertEqual(self.name_index.complete('m'), [('1', 'Movie')])
+        self.assertEqual(self.query_repo.find_all_names.call_count, 2)
+
+    def test_writes_of_this_process(self):
+        self.name_index.complete('m')
+        self.name_index.upsert('4', 'Mockumentary')
+        self.name_index.remove('1')
+        self.assertEqual(self.name_index.complete('m'), [('4', 'Mockumentary'), ('2', 'Music')])
+        self.query_repo.find_all_names.assert_called_once()
+
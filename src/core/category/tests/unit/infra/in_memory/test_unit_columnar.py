@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta, timezone
+import importlib.util
+import unittest
+import unittest.mock
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.filters import Field
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+if importlib.util.find_spec('numpy'):
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+
+
+@unittest.skipIf(importlib.util.find_spec('numpy') is None, 'numpy is not installed')
+class TestCategoryColumnarInMemoryRepository(unittest.TestCase):
+    repo: 'CategoryColumnarInMemoryRepository'
+
+    def setUp(self) -> None:
+        self.repo = CategoryColumnarInMemoryRepository(capacity=2)
+
+    def _seed(self):
+        created_at = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        names = ['Movie', 'music', 'Series', 'movie night', 'Kids', 'Music',
+                 'Ação', 'news', 'Movie', 'sports']
+        categories = [
+            Category(
+                name=name,
+                description=f'{name} description' if index % 2 else None,
+                is_active=index % 3 != 0,
+                # two pairs share created_at to check the tie order
+                created_at=created_at + timedelta(seconds=index // 2 * 2)
+            ) for index, name in enumerate(names)
+        ]
+        list_repo = CategoryInMemoryRepository()
+        for category in categories:
+            list_repo.insert(category)
+            self.repo.insert(category)
+        return categories, list_repo
+
+    def test_insert_and_find(self):
+        category = Category(name='Movie', description='some', is_active=False)
+        self.repo.insert(category)
+
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        self.assertEqual(self.repo.find_by_id(category.unique_entity_id), category)
+        self.assertEqual(self.repo.find_all(), [category])
+        self.assertEqual(len(self.repo), 1)
+
+    def test_throw_not_found_exception(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(
+            assert_error.exception.args[0], "Entity not found using ID 'fake id'"
+        )
+        with self.assertRaises(NotFoundException):
+            self.repo.update(Category(name='Movie'))
+        with self.assertRaises(NotFoundException):
+            self.repo.delete('fake id')
+
+    def test_update_and_delete(self):
+        categories, _ = self._seed()
+        category = categories[2]
+        category.update('Documentary', 'new description')
+        category.deactivate()
+        self.repo.update(category)
+
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+
+        self.repo.delete(category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(category.id)
+        self.assertEqual(len(self.repo), len(categories) - 1)
+        self.assertNotIn(category, self.repo.find_all())
+
+    def test_compact_keeps_remaining_rows(self):
+        categories = [Category(name=f'category {index}') for index in range(3000)]
+        self.repo.bulk_load(
+            [category.id for category in categories],
+            [category.name for category in categories],
+            [category.description for category in categories],
+            [category.is_active for category in categories],
+            [(category.created_at - datetime(1970, 1, 1, tzinfo=timezone.utc))
+             // timedelta(microseconds=1) for category in categories],
+        )
+        for category in categories[:2000]:
+            self.repo.delete(category.id)
+
+        self.assertLess(self.repo.size, len(categories))
+        self.assertEqual(self.repo.find_all(), categories[2000:])
+        self.assertEqual(self.repo.find_by_id(categories[2999].id), categories[2999])
+
+    def test_search_matches_list_repository(self):
+        categories, list_repo = self._seed()
+        arrange = [
+            {},
+            {'per_page': 3},
+            {'page': 2, 'per_page': 3},
+            {'page': 5, 'per_page': 3},
+            {'sort': 'name'},
+            {'sort': 'name', 'sort_dir': 'desc', 'per_page': 4},
+            {'sort': 'created_at', 'sort_dir': 'asc', 'per_page': 3, 'page': 2},
+            {'sort': 'description'},
+            {'filter': 'MOVIE'},
+            {'filter': 'mu', 'sort': 'name', 'sort_dir': 'desc'},
+            {'filter': 'zzz'},
+            {'filter': CategoryFilter(name='m', is_active=True)},
+            {'filter': CategoryFilter(name_prefix='M')},
+            {'filter': CategoryFilter(
+                created_at_from=categories[2].created_at,
+                created_at_to=categories[6].created_at
+            )},
+            {'filter': CategoryFilter(ids=[categories[0].id, categories[5].id, 'fake'])},
+            {'filter': Field('name').startswith('m') | Field('is_active').eq(False)},
+            {'filter': Field('id').in_([categories[1].id, categories[4].id]), 'sort': 'name'},
+            {'filter': ~Field('description').icontains('MUSIC') & Field('name').ne('Kids')},
+            {'filter': Field('created_at').range(
+                categories[2].created_at, categories[6].created_at)},
+            {'filter': Field('description').eq(None)},
+            {'filter': 'movie', 'search_mode': 'fulltext'},
+            {'filter': 'acao', 'search_mode': 'fulltext'},
+            {'filter': 'description', 'search_mode': 'fulltext', 'per_page': 2},
+            {'filter': 'music', 'search_mode': 'fulltext', 'sort': 'name'},
+        ]
+        for item in arrange:
+            params = CategoryInMemoryRepository.SearchParams(**item)
+            self.assertEqual(
+                self.repo.search(params).to_dict(), list_repo.search(params).to_dict(), item
+            )
+
+    def test_expression_filter_does_not_build_entities(self):
+        categories, _ = self._seed()
+        self.repo.delete(categories[0].id)
+        params = CategoryInMemoryRepository.SearchParams(
+            filter=Field('name').icontains('movie'), per_page=1
+        )
+        with unittest.mock.patch.object(
+            self.repo, '_materialize', wraps=self.repo._materialize  # pylint: disable=protected-access
+        ) as materialize:
+            result = self.repo.search(params)
+        self.assertEqual(result.total, 2)
+        self.assertEqual(result.items, [categories[8]])
+        materialize.assert_called_once()
+
+    def test_insert_with_zero_capacity(self):
+        repo = CategoryColumnarInMemoryRepository(capacity=0)
+        category = Category(name='Movie')
+        repo.insert(category)
+        self.assertEqual(repo.find_all(), [category])
+
+    def test_search_after_changes_matches_list_repository(self):
+        categories, list_repo = self._seed()
+        params = CategoryInMemoryRepository.SearchParams(
+            filter='night', search_mode='fulltext'
+        )
+        self.repo.search(params)
+
+        categories[0].update('Night shift', None)
+        new_category = Category(name='Zebra')
+        for repo in (self.repo, list_repo):
+            repo.update(categories[0])
+            repo.delete(categories[3].id)
+            repo.insert(new_category)
+
+        for item in [{'filter': 'night', 'search_mode': 'fulltext'}, {'sort': 'name'}]:
+            params = CategoryInMemoryRepository.SearchParams(**item)
+            self.assertEqual(
+                self.repo.search(params).to_dict(), list_repo.search(params).to_dict(), item
+            )
@@ -0,0 +1,117 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.category.domain.entities import Category
+
+if importlib.util.find_spec('numpy'):
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+    from core.category.infra.in_memory.durable import CategoryDurableInMemoryRepository
+    from core.category.infra.in_memory.snapshot import write_snapshot
+
+
+@unittest.skipIf(importlib.util.find_spec('numpy') is None, 'numpy is not installed')
+class TestCategoryDurableInMemoryRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _open(self, **kwargs) -> 'CategoryDurableInMemoryRepository':
+        repo = CategoryDurableInMemoryRepository(self.directory, **kwargs)
+        self.addCleanup(repo.close)
+        return repo
+
+    def _write(self, repo):
+        categories = [Category(name='Movie'), Category(name='Music'), Category(name='Kids')]
+        for category in categories:
+            repo.insert(category)
+        categories[1].update('Series', 'some description')
+        repo.update(categories[1])
+        repo.delete(categories[2].id)
+        return categories[:2]
+
+    def test_recover_by_replaying_the_log(self):
+        repo = self._open()
+        categories = self._write(repo)
+        self.assertEqual(repo.find_all(), categories)
+        repo.close()
+
+        recovered = self._open()
+        self.assertEqual(recovered.find_all(), categories)
+        self.assertEqual(
+            recovered.search(recovered.SearchParams(filter='series')).items, [categories[1]]
+        )
+
+    def test_failed_writes_are_not_logged(self):
+        repo = self._open()
+        with self.assertRaises(NotFoundException):
+            repo.update(Category(name='Movie'))
+        with self.assertRaises(NotFoundException):
+            repo.delete('fake id')
+        repo.close()
+
+        self.assertEqual(self._open().find_all(), [])
+
+    def test_writes_the_log_refuses_are_not_applied(self):
+        repo = self._open()
+        category = Category(name='Movie')
+        repo.insert(category)
+
+        def fail(_record):
+            raise OSError('no space left on device')
+        repo.log.append = fail
+        changed = Category(
+            unique_entity_id=category.unique_entity_id, name='Series', created_at=category.created_at
+        )
+        for write, argument in (
+            (repo.insert, Category(name='Music')), (repo.update, changed), (repo.delete, category.id)
+        ):
+            with self.assertRaises(OSError):
+                write(argument)
+        self.assertEqual(repo.find_all(), [category])
+        self.assertEqual(repo.find_by_id(category.id).name, 'Movie')
+
+    def test_compact(self):
+        repo = self._open()
+        categories = self._write(repo)
+        repo.compact()
+        new_category = Category(name='Documentary')
+        repo.insert(new_category)
+        repo.close()
+
+        self.assertTrue(os.path.exists(repo.snapshot_path))
+        self.assertEqual(len(repo.log.segments()), 1)
+        recovered = self._open()
+        self.assertEqual(recovered.find_all(), categories + [new_category])
+
+    def test_replay_over_snapshot_is_idempotent(self):
+        repo = self._open()
+        categories = self._write(repo)
+        segments = repo.log.rotate()
+        # crash before the rotated segments are removed
+        write_snapshot(repo.snapshot_path, repo.repository)
+        repo.close()
+
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(self._open().find_all(), categories)
+
+    def test_compact_every(self):
+        repo = self._open(compact_every=2, wait_for_sync=False)
+        categories = self._write(repo)
+        repo.close()
+
+        self.assertTrue(os.path.exists(repo.snapshot_path))
+        self.assertEqual(self._open().find_all(), categories)
+
+    def test_wraps_columnar_repository(self):
+        repo = self._open(repository=CategoryColumnarInMemoryRepository())
+        categories = self._write(repo)
+        repo.compact()
+        repo.close()
+
+        recovered = self._open(repository=CategoryColumnarInMemoryRepository())
+        self.assertEqual(recovered.find_all(), categories)
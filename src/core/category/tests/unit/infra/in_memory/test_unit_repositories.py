@@ -4,8 +4,12 @@ import unittest
 
 from django.utils import timezone
 from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter
 
-from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+from core.category.infra.in_memory.repositories import (
+    CategoryCopyOnWriteInMemoryRepository,
+    CategoryInMemoryRepository,
+)
 
 
 class TestCategoryInMemoryRepository(unittest.TestCase):
@@ -61,3 +65,156 @@ class TestCategoryInMemoryRepository(unittest.TestCase):
         # pylint: disable=protected-access
         items_filtered = self.repo._apply_sort(items, "name", "desc")
         self.assertListEqual(items_filtered, [items[0], items[1], items[2]])
+
+    def test_search_params_search_mode(self):
+        arrange = [
+            {'search_mode': None, 'expected': None},
+            {'search_mode': '', 'expected': None},
+            {'search_mode': 'fake', 'expected': None},
+            {'search_mode': 'fulltext', 'expected': 'fulltext'},
+            {'search_mode': 'FULLTEXT', 'expected': 'fulltext'},
+        ]
+        for item in arrange:
+            params = CategoryInMemoryRepository.SearchParams(
+                search_mode=item['search_mode']
+            )
+            self.assertEqual(params.search_mode, item['expected'], item)
+
+        self.assertFalse(
+            CategoryInMemoryRepository.SearchParams(search_mode='fulltext').is_fulltext
+        )
+        self.assertTrue(
+            CategoryInMemoryRepository.SearchParams(
+                search_mode='fulltext', filter='movie'
+            ).is_fulltext
+        )
+
+    def test_fulltext_search_ranks_by_relevance(self):
+        items = [
+            Category(name='Movie', description='feature films'),
+            Category(name='Documentary', description='non fiction films'),
+            Category(name='Short movie'),
+            Category(name='Movie', description='movie night classics'),
+        ]
+        self.repo.items = items
+
+        result = self.repo.search(CategoryInMemoryRepository.SearchParams(
+            filter='movie', search_mode='fulltext'
+        ))
+        self.assertEqual(result.total, 3)
+        self.assertEqual(result.items, [items[3], items[2], items[0]])
+
+        result = self.repo.search(CategoryInMemoryRepository.SearchParams(
+            filter='FILMS', search_mode='fulltext', sort='name', per_page=1
+        ))
+        self.assertEqual(result.total, 2)
+        self.assertEqual(result.items, [items[1]])
+
+        result = self.repo.search(CategoryInMemoryRepository.SearchParams(
+            filter='films', search_mode='fulltext', sort='relevance'
+        ))
+        self.assertEqual(len(result.items), 2)
+
+    def test_fulltext_index_follows_writes(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        params = CategoryInMemoryRepository.SearchParams(
+            filter='horror', search_mode='fulltext'
+        )
+        self.assertEqual(self.repo.search(params).total, 0)
+
+        category.update('Horror movie', None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.search(params).items, [category])
+
+        other = Category(name='Horror')
+        self.repo.insert(other)
+        self.assertEqual(self.repo.search(params).total, 2)
+
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.search(params).items, [other])
+
+        self.repo.items = []
+        self.assertEqual(self.repo.search(params).total, 0)
+
+    def test_search_params_keeps_category_filter(self):
+        category_filter = CategoryFilter(is_active=True)
+        params = CategoryInMemoryRepository.SearchParams(filter=category_filter)
+        self.assertIs(params.filter, category_filter)
+
+        params = CategoryInMemoryRepository.SearchParams(
+            filter={'name_prefix': 'Mo', 'ids': ['1']}
+        )
+        self.assertEqual(params.filter, CategoryFilter(name_prefix='Mo', ids=('1',)))
+
+        params = CategoryInMemoryRepository.SearchParams(filter=CategoryFilter())
+        self.assertIsNone(params.filter)
+
+    def test_filter_with_category_filter(self):
+        now = timezone.now()
+        items = [
+            Category(name='Movie', created_at=now - timedelta(days=2)),
+            Category(name='movie night', is_active=False, created_at=now - timedelta(days=1)),
+            Category(name='Documentary', created_at=now),
+            Category(name='Mockumentary', is_active=False, created_at=now),
+        ]
+
+        arrange = [
+            {'filter': CategoryFilter(is_active=True), 'expected': [items[0], items[2]]},
+            {'filter': CategoryFilter(is_active=False), 'expected': [items[1], items[3]]},
+            {'filter': CategoryFilter(name='MOVIE'), 'expected': [items[0], items[1]]},
+            {'filter': CategoryFilter(name_prefix='Mo'), 'expected': [items[0], items[3]]},
+            {
+                'filter': CategoryFilter(created_at_from=now - timedelta(days=1)),
+                'expected': [items[1], items[2], items[3]]
+            },
+            {
+                'filter': CategoryFilter(created_at_to=now - timedelta(days=1)),
+                'expected': [items[0], items[1]]
+            },
+            {
+                'filter': CategoryFilter(ids=(items[1].id, items[2].id)),
+                'expected': [items[1], items[2]]
+            },
+            {
+                'filter': CategoryFilter(
+                    name='mentary', is_active=False, created_at_from=now
+                ),
+                'expected': [items[3]]
+            },
+        ]
+        for item in arrange:
+            # pylint: disable=protected-access
+            items_filtered = self.repo._apply_filter(items, item['filter'])
+            self.assertListEqual(items_filtered, item['expected'], item['filter'])
+
+
+class TestCategoryCopyOnWriteInMemoryRepository(TestCategoryInMemoryRepository):
+    repo: CategoryCopyOnWriteInMemoryRepository  # type: ignore
+
+    def setUp(self) -> None:
+        self.repo = CategoryCopyOnWriteInMemoryRepository()
+
+    def test_writes_publish_items_with_their_fulltext_index(self):
+        # pylint: disable=protected-access
+        categories = [Category(name='Movie'), Category(name='Horror movie')]
+        for category in categories:
+            self.repo.insert(category)
+        params = CategoryInMemoryRepository.SearchParams(
+            filter='movie', search_mode='fulltext'
+        )
+        self.assertEqual(self.repo.search(params).total, 2)
+        published = self.repo._fulltext
+        self.assertIs(published[0], self.repo.items)  # type: ignore
+
+        other = Category(name='Movie night')
+        self.repo.insert(other)
+        self.repo.delete(categories[0].id)
+
+        items, index = self.repo._fulltext  # type: ignore
+        self.assertIs(items, self.repo.items)
+        self.assertEqual(set(index.doc_lengths), {categories[1].id, other.id})
+        # a search still holding the earlier pair sees it unchanged
+        self.assertEqual(published[1].search('movie').keys(),  # type: ignore
+                         {category.id for category in categories})
+        self.assertEqual(self.repo.search(params).total, 2)
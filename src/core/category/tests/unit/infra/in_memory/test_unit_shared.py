@@ -0,0 +1,179 @@
+import multiprocessing
+import sys
+import threading
+import unittest
+import uuid
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter
+from core.category.infra.in_memory.shared import (
+    CategorySharedMemoryRepository,
+    SharedMemoryFullException,
+)
+
+
+def _insert_from_worker(name: str, total: int) -> None:
+    repo = CategorySharedMemoryRepository(name)
+    for index in range(total):
+        repo.insert(Category(name=f'worker {index}'))
+    repo.close()
+
+
+class TestCategorySharedMemoryRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.name = f'test_categories_{uuid.uuid4().hex[:12]}'
+        self.repo = self._attach(capacity=8, heap_size=256)
+        self.addCleanup(self.repo.unlink)
+
+    def _attach(self, **kwargs) -> CategorySharedMemoryRepository:
+        repo = CategorySharedMemoryRepository(self.name, **kwargs)
+        self.addCleanup(repo.close)
+        return repo
+
+    def test_insert_and_find(self):
+        category = Category(name='Ação', description='some description', is_active=False)
+        self.repo.insert(category)
+
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        self.assertEqual(self.repo.find_all(), [category])
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(
+            assert_error.exception.args[0], "Entity not found using ID 'fake id'"
+        )
+
+    def test_writes_are_visible_to_other_attachments(self):
+        other = self._attach()
+        categories = [Category(name='Movie'), Category(name='Music', description='')]
+        for category in categories:
+            self.repo.insert(category)
+        self.assertEqual(other.find_all(), categories)
+
+        categories[0].update('Series', None)
+        other.update(categories[0])
+        other.delete(categories[1].id)
+
+        self.assertEqual(self.repo.find_all(), [categories[0]])
+        with self.assertRaises(NotFoundException):
+            self.repo.update(categories[1])
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(categories[1].id)
+
+    def test_reads_decode_from_the_segment(self):
+        other = self._attach()
+        categories = [Category(name='Movie'), Category(name='Music')]
+        for category in categories:
+            self.repo.insert(category)
+        first = other.find_by_id(categories[0].id)
+
+        categories[1].update('Kids', None)
+        self.repo.update(categories[1])
+
+        # nothing decoded is kept: every read returns new entities
+        self.assertIsNot(other.find_by_id(categories[0].id), first)
+        self.assertEqual(other.find_by_id(categories[0].id), first)
+        self.assertEqual(other.find_by_id(categories[1].id).name, 'Kids')
+        self.assertEqual(other._rows, {  # pylint: disable=protected-access
+            categories[0].id: 0, categories[1].id: 1
+        })
+
+    def test_threads_sharing_an_attachment(self):
+        name = f'test_categories_{uuid.uuid4().hex[:12]}'
+        repo = CategorySharedMemoryRepository(name, capacity=1000)
+        self.addCleanup(repo.unlink)
+        self.addCleanup(repo.close)
+        # switch threads as often as possible to interleave them
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        errors = []
+
+        def write():
+            try:
+                for index in range(100):
+                    category = Category(name=f'category {index}')
+                    repo.insert(category)
+                    if index % 2:
+                        repo.delete(category.id)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        def read():
+            try:
+                for _ in range(100):
+                    repo.search(repo.SearchParams(filter='category', sort='name'))
+                    repo.refresh()
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        threads = [threading.Thread(target=target) for target in (write, write, read, read)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(repo.find_all()), 100)
+        self.assertEqual(repo.search(repo.SearchParams(filter='category')).total, 100)
+
+    def test_refresh_after_more_writes_than_the_journal_holds(self):
+        name = f'test_categories_{uuid.uuid4().hex[:12]}'
+        repo = CategorySharedMemoryRepository(name, capacity=1000)
+        self.addCleanup(repo.unlink)
+        self.addCleanup(repo.close)
+        other = CategorySharedMemoryRepository(name)
+        self.addCleanup(other.close)
+        first = Category(name='first')
+        repo.insert(first)
+        self.assertEqual(other.find_all(), [first])
+
+        categories = [Category(name=f'category {index}') for index in range(300)]
+        for category in categories:
+            repo.insert(category)
+        repo.delete(first.id)
+
+        self.assertEqual(other.find_all(), categories)
+
+    def test_search(self):
+        categories = [Category(name='Movie'), Category(name='Music', is_active=False)]
+        for category in categories:
+            self.repo.insert(category)
+
+        result = self.repo.search(self.repo.SearchParams(filter='mu'))
+        self.assertEqual(result.items, [categories[1]])
+        result = self.repo.search(self.repo.SearchParams(filter=CategoryFilter(is_active=True)))
+        self.assertEqual(result.items, [categories[0]])
+        result = self.repo.search(self.repo.SearchParams(sort='name', sort_dir='desc', per_page=1))
+        self.assertEqual((result.items, result.total, result.last_page), ([categories[1]], 2, 2))
+
+    def test_compacts_when_full(self):
+        kept = Category(name='kept')
+        self.repo.insert(kept)
+        for index in range(20):
+            category = Category(name=f'category {index} ' + 'x' * 30)
+            self.repo.insert(category)
+            self.repo.delete(category.id)
+        kept.update('kept and updated', 'd' * 40)
+        self.repo.update(kept)
+
+        self.assertEqual(self.repo.find_all(), [kept])
+        self.assertEqual(self._attach().find_all(), [kept])
+
+        for index in range(7):
+            self.repo.insert(Category(name=f'c{index}'))
+        with self.assertRaises(SharedMemoryFullException):
+            self.repo.insert(Category(name='one too many'))
+
+    def test_writes_from_other_processes(self):
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(target=_insert_from_worker, args=(self.name, 3)) for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual([worker.exitcode for worker in workers], [0, 0])
+        self.assertEqual(len(self.repo.find_all()), 6)
@@ -0,0 +1,188 @@
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryFilter
+from core.category.infra.in_memory.repositories import (
+    CategoryCopyOnWriteInMemoryRepository,
+    CategoryInMemoryRepository,
+)
+from core.category.infra.in_memory.snapshot import (
+    InvalidSnapshotException,
+    PeriodicSnapshot,
+    load_snapshot,
+    restore,
+    write_snapshot,
+)
+
+if importlib.util.find_spec('numpy'):
+    from core.category.infra.in_memory.columnar import CategoryColumnarInMemoryRepository
+
+
+class TestSnapshotWithoutNumpy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'categories.snapshot')
+        self.categories = [
+            Category(name='Movie', description='some description'),
+            Category(name='Ação', description='', is_active=False),
+            Category(name='Movie'),
+        ]
+
+    def test_write_and_restore_list_repositories(self):
+        repo = CategoryCopyOnWriteInMemoryRepository()
+        for category in self.categories:
+            repo.insert(category)
+
+        self.assertEqual(write_snapshot(self.path, repo), 3)
+        restored = restore(self.path, CategoryInMemoryRepository())
+        self.assertEqual(restored.find_all(), self.categories)
+        self.assertEqual(
+            [category.created_at for category in restored.find_all()],
+            [category.created_at for category in self.categories]
+        )
+
+    def test_columns_of_different_lengths_keep_the_previous_snapshot(self):
+        repo = CategoryInMemoryRepository()
+        repo.insert(self.categories[0])
+        write_snapshot(self.path, repo)
+        with open(self.path, 'rb') as file:
+            previous = file.read()
+
+        columns = (['1', '2'], ['Movie'], [0, 0], [None, None], [True], [0, 0])
+        with patch('core.category.infra.in_memory.snapshot._copy_columns', return_value=columns):
+            with self.assertRaises(InvalidSnapshotException):
+                write_snapshot(self.path, repo)
+
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(), previous)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['categories.snapshot'])
+
+    def test_periodic_snapshot_survives_a_failed_write(self):
+        repo = CategoryInMemoryRepository()
+        repo.insert(self.categories[0])
+        periodic = PeriodicSnapshot(repo, self.path, interval=0.01)
+        calls = []
+
+        def flaky_write(path, repository):
+            calls.append(path)
+            if len(calls) == 1:
+                raise ValueError('Snapshot strings cannot contain NUL characters')
+            return write_snapshot(path, repository)
+
+        with patch('core.category.infra.in_memory.snapshot.write_snapshot', flaky_write), \
+                self.assertLogs('core.category.infra.in_memory.snapshot', 'ERROR') as logs:
+            periodic.start()
+            deadline = time.monotonic() + 5
+            while not os.path.exists(self.path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            periodic.stop(final_snapshot=False)
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertIn('Could not write the snapshot', logs.output[0])
+        self.assertEqual(restore(self.path, CategoryInMemoryRepository()).find_all(),
+                         self.categories[:1])
+
+
+@unittest.skipIf(importlib.util.find_spec('numpy') is None, 'numpy is not installed')
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'categories.snapshot')
+        self.categories = [
+            Category(name='Movie', description='some description'),
+            Category(name='Ação', description='', is_active=False),
+            Category(name='Movie'),
+            Category(name='Kids', description='multi\nline'),
+        ]
+
+    def test_write_and_load_from_list_repository(self):
+        repo = CategoryInMemoryRepository()
+        for category in self.categories:
+            repo.insert(category)
+
+        self.assertEqual(write_snapshot(self.path, repo), 4)
+        loaded = load_snapshot(self.path)
+
+        self.assertEqual(loaded.find_all(), self.categories)
+        self.assertEqual(loaded.names, ['Movie', 'Ação', 'Kids'])
+        self.assertEqual(loaded.find_by_id(self.categories[3].id), self.categories[3])
+        self.assertEqual(
+            loaded.search(loaded.SearchParams(filter=CategoryFilter(is_active=False))).items,
+            [self.categories[1]]
+        )
+
+    def test_write_from_columnar_repository_skips_deleted_rows(self):
+        repo = CategoryColumnarInMemoryRepository()
+        for category in self.categories:
+            repo.insert(category)
+        repo.delete(self.categories[0].id)
+
+        self.assertEqual(write_snapshot(self.path, repo), 3)
+        self.assertEqual(load_snapshot(self.path).find_all(), self.categories[1:])
+
+    def test_load_into_non_empty_repository(self):
+        repo = CategoryInMemoryRepository()
+        for category in self.categories[:2]:
+            repo.insert(category)
+        write_snapshot(self.path, repo)
+
+        target = CategoryColumnarInMemoryRepository()
+        for category in self.categories[2:]:
+            target.insert(category)
+        load_snapshot(self.path, target)
+
+        self.assertEqual(target.find_all(), self.categories[2:] + self.categories[:2])
+        self.assertEqual(target.names, ['Movie', 'Kids', 'Ação'])
+
+    def test_restore_list_repository(self):
+        repo = CategoryColumnarInMemoryRepository()
+        for category in self.categories:
+            repo.insert(category)
+        write_snapshot(self.path, repo)
+
+        restored = restore(self.path, CategoryInMemoryRepository())
+        self.assertEqual(restored.find_all(), self.categories)
+
+    def test_empty_snapshot(self):
+        write_snapshot(self.path, CategoryInMemoryRepository())
+        self.assertEqual(load_snapshot(self.path).find_all(), [])
+
+    def test_invalid_snapshot(self):
+        for content in [b'', b'not a snapshot', b'CATSNAP1' + b'\x01' * 40]:
+            with open(self.path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(InvalidSnapshotException, msg=content):
+                load_snapshot(self.path)
+
+    def test_nul_characters_are_rejected(self):
+        # entities are validated and cannot hold them, only bulk loads can
+        repo = CategoryColumnarInMemoryRepository()
+        repo.bulk_load(['1'], ['a\x00b'], [None], [True], [0])
+
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, repo)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+    def test_periodic_snapshot(self):
+        repo = CategoryInMemoryRepository()
+        repo.insert(self.categories[0])
+        periodic = PeriodicSnapshot(repo, self.path, interval=0.01)
+        periodic.start()
+        deadline = time.monotonic() + 5
+        while not os.path.exists(self.path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(os.path.exists(self.path))
+
+        repo.insert(self.categories[1])
+        periodic.stop()
+
+        self.assertEqual(load_snapshot(self.path).find_all(), self.categories[:2])
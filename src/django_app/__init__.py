@@ -1,4 +1,10 @@
+from typing import Any
 
-from .container import Container
 
-container = Container()
+def __getattr__(name: str) -> Any:
+    # the container is built on first use, not when django_app.settings loads
+    if name == 'container':
+        from .container import Container  # pylint: disable=import-outside-toplevel
+        globals()['container'] = Container()
+        return globals()['container']
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,41 +1,67 @@
 
 # pylint: disable=c-extension-no-member, too-few-public-methods
+from importlib import import_module
+from typing import Any, Callable, Optional
+
 from dependency_injector import containers, providers
 
-from core.category.infra.django_app.repositories import CategoryDjangoRepository
-from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
-from core.category.application.use_cases import (
-    CreateCategoryUseCase,
-    DeleteCategoryUseCase,
-    GetCategoryUseCase,
-    ListCategoriesUseCase,
-    UpdateCategoryUseCase
-)
+from core.__seedwork.infra.instrumentation import LAYER_REPOSITORY, instrumented
+
+
+def _lazy(path: str, layer: Optional[str] = None) -> Callable[..., Any]:
+    # imports the class on the first call of its provider, so building the
+    # container does not load the ORM, DRF or every backend at startup; use
+    # cases and repositories come wrapped by the instrumentation
+    module_name, class_name = path.rsplit('.', 1)
+
+    def create(*args, **kwargs):
+        return instrumented(getattr(import_module(module_name), class_name), layer)(*args, **kwargs)
+    return create
 
 
 class Container(containers.DeclarativeContainer):
     repository_category_in_memory = providers.Singleton(
-        CategoryInMemoryRepository)
+        _lazy('core.category.infra.in_memory.repositories.CategoryCopyOnWriteInMemoryRepository'))
 
     repository_category_django_orm = providers.Singleton(
-        CategoryDjangoRepository)
+        _lazy('core.category.infra.django_app.repositories.CategoryDjangoRepository'))
+
+    repository_category_django_orm_query = providers.Singleton(
+        _lazy('core.category.infra.django_app.repositories.CategoryDjangoQueryRepository',
+              LAYER_REPOSITORY))
 
     use_case_category_create_category = providers.Singleton(
-        CreateCategoryUseCase, category_repo=repository_category_django_orm
+        _lazy('core.category.application.use_cases.CreateCategoryUseCase'),
+        category_repo=repository_category_django_orm
     )
 
     use_case_category_list_category = providers.Singleton(
-        ListCategoriesUseCase, category_repo=repository_category_django_orm
+        _lazy('core.category.application.use_cases.ListCategoriesUseCase'),
+        category_repo=repository_category_django_orm,
+        category_query_repo=repository_category_django_orm_query
     )
 
     use_case_category_get_category = providers.Singleton(
-        GetCategoryUseCase, category_repo=repository_category_django_orm
+        _lazy('core.category.application.use_cases.GetCategoryUseCase'),
+        category_repo=repository_category_django_orm
     )
 
     use_case_category_update_category = providers.Singleton(
-        UpdateCategoryUseCase, category_repo=repository_category_django_orm
+        _lazy('core.category.application.use_cases.UpdateCategoryUseCase'),
+        category_repo=repository_category_django_orm
     )
 
     use_case_category_delete_category = providers.Singleton(
-        DeleteCategoryUseCase, category_repo=repository_category_django_orm
+        _lazy('core.category.application.use_cases.DeleteCategoryUseCase'),
+        category_repo=repository_category_django_orm
+    )
+
+    category_name_index = providers.Singleton(
+        _lazy('core.category.infra.django_app.autocomplete.CategoryPrefixNameIndex'),
+        category_query_repo=repository_category_django_orm_query
+    )
+
+    use_case_category_autocomplete_category = providers.Singleton(
+        _lazy('core.category.application.use_cases.AutocompleteCategoriesUseCase'),
+        name_index=category_name_index
     )
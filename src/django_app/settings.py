@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -38,10 +39,15 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django_extensions',
+    'core.__seedwork.infra.django_app',
     'core.category.infra.django_app'
 ]
 
 MIDDLEWARE = [
+    'core.__seedwork.infra.django_app.middleware.SamplingProfilerMiddleware',
+    'core.__seedwork.infra.django_app.middleware.MetricsMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ServerTimingMiddleware',
+    'core.__seedwork.infra.django_app.middleware.QueryLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -49,6 +55,9 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ReadYourWritesMiddleware',
+    'core.__seedwork.infra.django_app.middleware.AllocationTrackingMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'django_app.urls'
@@ -78,10 +87,102 @@ WSGI_APPLICATION = 'django_app.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('DJANGO_DATABASE_NAME', BASE_DIR / 'db.sqlite3'),
     }
 }
 
+# Applied to every new SQLite connection (core.__seedwork.infra.django_app)
+SQLITE_PRAGMAS = {}
+
+# DJANGO_DATABASE_PROFILE=production, for concurrent load: persistent
+# connections, WAL so readers run alongside the writer, writers wait up to
+# busy_timeout for the lock instead of failing with "database is locked",
+# synchronous=NORMAL (durable with WAL except on power loss) and bigger
+# mmap/page cache
+DATABASE_PROFILE = os.environ.get('DJANGO_DATABASE_PROFILE', 'default')
+
+if DATABASE_PROFILE == 'production':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'timeout': 20},
+    })
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 20000,
+        'mmap_size': 256 * 2 ** 20,
+        'cache_size': -64 * 2 ** 10,
+        'temp_store': 'MEMORY',
+    }
+
+# DJANGO_DATABASE_REPLICAS: comma separated SQLite files used as read
+# replicas (kept in sync outside Django). Test databases mirror "default";
+# the test suite itself runs without replicas
+DATABASE_REPLICAS = []
+for _index, _name in enumerate(filter(None, os.environ.get('DJANGO_DATABASE_REPLICAS', '').split(','))):
+    DATABASES[f'replica_{_index + 1}'] = {
+        **DATABASES['default'],
+        'NAME': _name,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{_index + 1}')
+
+DATABASE_ROUTERS = ['core.__seedwork.infra.django_app.routers.ReadReplicaRouter']
+
+# reads of a client stay on the primary for this long after it wrote
+READ_YOUR_WRITES_SECONDS = 5
+
+# the process-local category name index behind /categories/autocomplete/ is
+# rebuilt when older than this many seconds, picking up writes made by other
+# processes (core.category.infra.django_app.autocomplete)
+CATEGORY_NAME_INDEX_MAX_AGE = float(os.environ.get('DJANGO_CATEGORY_NAME_INDEX_MAX_AGE', '60'))
+
+# Prometheus metrics at /metrics (core.__seedwork.infra.metrics); with
+# METRICS_TOKEN set, scrapes must send "Authorization: Bearer <token>".
+# Off by default: anyone reaching it sees the routes, their traffic and SQL
+METRICS_ENABLED = os.environ.get('DJANGO_METRICS_ENABLED', 'false') == 'true'
+METRICS_TOKEN = os.environ.get('DJANGO_METRICS_TOKEN', '')
+
+# Server-Timing response header (core.__seedwork.infra.django_app.server_timing);
+# it shows every client how long validation, the use case and SQL took, so
+# it is meant for debugging and off by default
+SERVER_TIMING_ENABLED = os.environ.get('DJANGO_SERVER_TIMING_ENABLED', 'false') == 'true'
+
+# requests over these limits are logged with their SQL
+# (core.__seedwork.infra.django_app.middleware.QueryLogMiddleware). Each of
+# metrics, Server-Timing and the query log wraps every SQL statement, so
+# only the ones in use should be enabled
+QUERY_LOG_ENABLED = os.environ.get('DJANGO_QUERY_LOG_ENABLED', 'false') == 'true'
+QUERY_LOG_MAX_QUERIES = int(os.environ.get('DJANGO_QUERY_LOG_MAX_QUERIES', '10'))
+QUERY_LOG_MAX_SECONDS = float(os.environ.get('DJANGO_QUERY_LOG_MAX_SECONDS', '0.1'))
+QUERY_LOG_REPEATED_QUERIES = int(os.environ.get('DJANGO_QUERY_LOG_REPEATED_QUERIES', '5'))
+
+# requests sent with "X-Profile: <PROFILING_TOKEN>" are profiled into
+# PROFILING_DIR (core.__seedwork.infra.django_app.middleware.ProfilingMiddleware)
+PROFILING_TOKEN = os.environ.get('DJANGO_PROFILING_TOKEN', '')
+PROFILING_ENABLED = bool(PROFILING_TOKEN)
+PROFILING_DIR = os.environ.get('DJANGO_PROFILING_DIR', os.path.join(BASE_DIR, 'profiles'))
+PROFILING_SAMPLE_INTERVAL = float(os.environ.get('DJANGO_PROFILING_SAMPLE_INTERVAL', '0.001'))
+
+# always-on sampling of the request threads into rotated collapsed stack
+# files (core.__seedwork.infra.profiling.RotatingStackSampler)
+SAMPLING_PROFILER_ENABLED = os.environ.get('DJANGO_SAMPLING_PROFILER_ENABLED', 'false') == 'true'
+SAMPLING_PROFILER_INTERVAL = float(os.environ.get('DJANGO_SAMPLING_PROFILER_INTERVAL', '0.02'))
+SAMPLING_PROFILER_DIR = os.environ.get(
+    'DJANGO_SAMPLING_PROFILER_DIR', os.path.join(BASE_DIR, 'profiles', 'continuous')
+)
+SAMPLING_PROFILER_ROTATE_SECONDS = float(os.environ.get('DJANGO_SAMPLING_PROFILER_ROTATE_SECONDS', '60'))
+SAMPLING_PROFILER_KEEP = int(os.environ.get('DJANGO_SAMPLING_PROFILER_KEEP', '60'))
+
+# tracemalloc peak/net bytes and top allocating modules while a request runs;
+# tracemalloc counts the whole process, so the numbers are per request only
+# with a single worker thread
+# (core.__seedwork.infra.django_app.middleware.AllocationTrackingMiddleware)
+ALLOCATION_TRACKING_ENABLED = os.environ.get('DJANGO_ALLOCATION_TRACKING_ENABLED', 'false') == 'true'
+ALLOCATION_TRACKING_FRAMES = int(os.environ.get('DJANGO_ALLOCATION_TRACKING_FRAMES', '25'))
+ALLOCATION_TRACKING_TOP = int(os.environ.get('DJANGO_ALLOCATION_TRACKING_TOP', '10'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -0,0 +1,42 @@
+"""
+Lean settings for serving the JSON category API (DJANGO_SETTINGS_MODULE=
+django_app.settings_api): no DEBUG (Django would keep every executed SQL
+query in memory), no admin/auth/sessions/messages apps or their
+middleware, and DRF restricted to JSON without authentication.
+"""
+import os
+
+from django_app.settings import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+DEBUG = False
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+
+INSTALLED_APPS = [
+    'core.__seedwork.infra.django_app',
+    'core.category.infra.django_app'
+]
+
+MIDDLEWARE = [
+    'core.__seedwork.infra.django_app.middleware.SamplingProfilerMiddleware',
+    'core.__seedwork.infra.django_app.middleware.MetricsMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ServerTimingMiddleware',
+    'core.__seedwork.infra.django_app.middleware.QueryLogMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ReadYourWritesMiddleware',
+    'core.__seedwork.infra.django_app.middleware.AllocationTrackingMiddleware',
+    'core.__seedwork.infra.django_app.middleware.ProfilingMiddleware',
+]
+
+TEMPLATES = []
+
+AUTH_PASSWORD_VALIDATORS = []
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+    'DEFAULT_PARSER_CLASSES': ['rest_framework.parsers.JSONParser'],
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
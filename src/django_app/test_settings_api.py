@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SCRIPT = '''
+from benchmarks._django import setup_django
+setup_django('django_app.settings_api')
+
+from django.conf import settings
+from django.test import Client
+
+assert not settings.DEBUG
+client = Client()
+response = client.post('/categories/', {'name': 'Movie'}, content_type='application/json')
+assert response.status_code == 201, response.status_code
+response = client.get('/categories/')
+assert response.status_code == 200, response.status_code
+assert response['Content-Type'] == 'application/json', response['Content-Type']
+assert response.json()['items'][0]['name'] == 'Movie', response.json()
+assert client.post('/categories/', {'name': 'Movie'}).status_code == 415
+assert client.get('/admin/').status_code == 404
+'''
+
+
+class TestSettingsApi(unittest.TestCase):
+
+    def test_serves_the_category_api(self):
+        src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c', SCRIPT],
+            env={**os.environ, 'PYTHONPATH': src, 'DJANGO_SETTINGS_MODULE': 'django_app.settings_api'},
+            capture_output=True, text=True, check=False
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
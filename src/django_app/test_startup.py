@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import unittest
+from typing import Set
+
+# modules imported by `django.setup()` with the API settings: about 470 with
+# the locked dependencies. Unlike import time, the count does not depend on
+# the machine; growing past the budget means startup picked up a new
+# dependency tree
+SETUP_MODULES_BUDGET = 550
+
+LAZY_MODULES = (
+    'rest_framework',
+    'dependency_injector',
+    'numpy',
+    'core.category.infra.django_app.repositories',
+    'core.category.infra.in_memory.repositories',
+)
+
+
+def imported_modules(statement: str) -> Set[str]:
+    # run in a fresh interpreter, this one has imported everything already
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys\nprint("\\n".join(sys.modules))'],
+        env={**os.environ, 'PYTHONPATH': src, 'DJANGO_SETTINGS_MODULE': 'django_app.settings_api'},
+        capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_setup_does_not_import_backends(self):
+        modules = imported_modules('import django; django.setup()')
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+        self.assertLess(len(modules), SETUP_MODULES_BUDGET)
+
+    def test_entities_do_not_import_drf(self):
+        modules = imported_modules('import core.category.domain.entities')
+        self.assertNotIn('rest_framework', modules)
+        self.assertNotIn('django.db.models', modules)
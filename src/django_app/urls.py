@@ -14,10 +14,18 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
+from django.apps import apps
 from django.urls import include, path
 
+from core.__seedwork.infra.django_app.views import metrics_view
+
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('', include('core.category.infra.django_app.urls'))
+    path('', include('core.category.infra.django_app.urls')),
+    # answers 404 unless METRICS_ENABLED
+    path('metrics', metrics_view),
 ]
+
+# the lean API settings (django_app.settings_api) leave the admin out
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin  # pylint: disable=ungrouped-imports
+    urlpatterns.insert(0, path('admin/', admin.site.urls))